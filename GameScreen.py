@@ -29,24 +29,34 @@ class LetterBox(Label):
         self.bold = True
         self.halign = 'center'
         self.valign = 'middle'
+        self.status = 'empty'
         self.bind(pos=self.update_rect, size=self.update_rect)
+        App.get_running_app().theme_manager.register_widget(self)
         
+    def apply_theme(self, palette):
+        """Tema değişti: kutuyu mevcut durumunun rengiyle yeniden boya"""
+        if self.status in ('correct', 'present', 'absent'):
+            self.fill(palette[self.status])
+        else:
+            self.update_rect()
+            
     def update_rect(self, *args):
         """Kutu kenarlığını güncelle"""
         self.canvas.before.clear()
         with self.canvas.before:
             from kivy.graphics import Color, RoundedRectangle
             app = App.get_running_app()
-            theme_manager = app.theme_manager
             dark_mode = app.settings['theme'] == 'Dark'
+            palette = app.theme_manager.get_palette(dark_mode)
             
             # Border rengi
-            border_color = theme_manager.get_color('border', dark_mode)
+            border_color = palette['border']
             Color(*border_color)
             RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(5)])
         
     def animate_correct(self, theme_manager, dark_mode, sound_manager=None):
         """Doğru harf ve konum - Yeşil animasyon"""
+        self.status = 'correct'
         color = theme_manager.get_color('correct', dark_mode)
         self.animate_flip(color)
         if sound_manager and sound_manager.enabled:
@@ -54,6 +64,7 @@ class LetterBox(Label):
         
     def animate_present(self, theme_manager, dark_mode, sound_manager=None):
         """Doğru harf ama yanlış konum - Sarı animasyon"""
+        self.status = 'present'
         color = theme_manager.get_color('present', dark_mode)
         self.animate_flip(color)
         if sound_manager and sound_manager.enabled:
@@ -61,6 +72,7 @@ class LetterBox(Label):
         
     def animate_absent(self, theme_manager, dark_mode, sound_manager=None):
         """Yanlış harf - Gri animasyon + titreme"""
+        self.status = 'absent'
         color = theme_manager.get_color('absent', dark_mode)
         self.animate_flip(color)
         self.shake()
@@ -73,18 +85,22 @@ class LetterBox(Label):
         anim2 = Animation(size=(dp(60), dp(60)), duration=0.15)
         
         def change_color(anim, widget):
-            self.canvas.before.clear()
-            with self.canvas.before:
-                from kivy.graphics import Color, RoundedRectangle
-                Color(*bg_color)
-                RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(5)])
-                Color(1, 1, 1, 1)
-            self.color = (1, 1, 1, 1)
+            self.fill(bg_color)
             
         anim1.bind(on_complete=change_color)
         anim1.bind(on_complete=lambda *args: anim2.start(self))
         anim1.start(self)
         
+    def fill(self, bg_color):
+        """Kutuyu verilen renkle doldur (beyaz metin)"""
+        self.canvas.before.clear()
+        with self.canvas.before:
+            from kivy.graphics import Color, RoundedRectangle
+            Color(*bg_color)
+            RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(5)])
+            Color(1, 1, 1, 1)
+        self.color = (1, 1, 1, 1)
+        
     def shake(self):
         """Titreme animasyonu"""
         original_x = self.x
@@ -107,13 +123,22 @@ class KeyboardKey(MDRaisedButton):
         self.size = (dp(35), dp(50))
         
         app = App.get_running_app()
-        theme_manager = app.theme_manager
         dark_mode = app.settings['theme'] == 'Dark'
+        palette = app.theme_manager.get_palette(dark_mode)
         
-        self.md_bg_color = theme_manager.get_color('keyboard', dark_mode)
-        self.text_color = theme_manager.get_color('text', dark_mode)
+        self.md_bg_color = palette['keyboard']
+        self.text_color = palette['text']
         self.on_release = lambda: callback(letter)
         self.state = 'normal'
+        app.theme_manager.register_widget(self)
+        
+    def apply_theme(self, palette):
+        """Tema değişti: tuşu mevcut durumunun rengiyle yeniden boya"""
+        if self.state in ('correct', 'present', 'absent'):
+            self.md_bg_color = palette[self.state]
+        else:
+            self.md_bg_color = palette['keyboard']
+            self.text_color = palette['text']
         
     def update_color(self, state, theme_manager, dark_mode):
         """Tuş rengini duruma göre güncelle"""
@@ -201,6 +226,7 @@ class GameScreen(Screen):
         word_length = app.settings['word_length']
         max_attempts = word_length
         language = app.settings['language']
+        mode = app.settings.get('game_mode', 'classic')
         
         # Metrikleri sıfırla
         self.game_metrics = {
@@ -220,17 +246,16 @@ class GameScreen(Screen):
         self.timer_event = Clock.schedule_interval(self.update_timer, 1.0)
         
         # Kelime yöneticisini başlat
-        from words import WordManager
-        word_manager = WordManager()
-        secret_word = word_manager.get_random_word(word_length, language)
+        word_manager = App.get_running_app().word_manager
+        # hashed kipte gizli kelime burada çözülmez, yalnızca oyun sonunda gösterilir
+        new_game = word_manager.new_game(word_length, language, max_attempts, mode=mode)
         
-        if not secret_word:
+        if new_game is None:
             self.show_error_dialog("Kelime listesi yüklenemedi!")
             return
             
         # Oyun mantığını başlat
-        from game_logic import GameLogic
-        self.game_logic = GameLogic(secret_word, max_attempts)
+        self.game_logic, self.word_id = new_game
         self.current_guess = ""
         
         # Grid'i oluştur
@@ -304,17 +329,13 @@ class GameScreen(Screen):
             
             for key in row:
                 if key == '⏎':
-                    app = App.get_running_app()
                     btn = MDRaisedButton(
                         text='GİR',
                         font_size=sp(14),
                         size_hint=(None, None),
-                        size=(dp(50), dp(50)),
-                        md_bg_color=app.theme_manager.get_color(
-                            'correct', 
-                            app.settings['theme'] == 'Dark'
-                        )
+                        size=(dp(50), dp(50))
                     )
+                    App.get_running_app().theme_manager.bind_color(btn, 'md_bg_color', 'correct')
                     btn.bind(on_release=lambda x: self.on_enter())
                 elif key == '⌫':
                     btn = MDRaisedButton(
@@ -529,7 +550,9 @@ class GameScreen(Screen):
             won=self.game_logic.is_won(),
             attempts=self.game_logic.current_attempt,
             word_length=app.settings['word_length'],
-            language=app.settings['language']
+            language=app.settings['language'],
+            duration=self.game_metrics['total_time'],
+            word_id=getattr(self, 'word_id', -1)
         )
         
         # Oyun sonu diyaloğunu göster
@@ -548,20 +571,22 @@ class GameScreen(Screen):
                 app.sound_manager.play_win_sound()
         else:
             title = "😢 Oyun Bitti"
-            text = f"Doğru kelime: {self.game_logic.secret_word}\n"
+            text = f"Doğru kelime: {self.game_logic.reveal_secret()}\n"
             text += f"Süre: {int(self.game_metrics['total_time'])} saniye"
             
             if app.sound_manager.enabled:
                 app.sound_manager.play_lose_sound()
             
+        replay_btn = MDRaisedButton(
+            text="TEKRAR OYNA",
+            on_release=lambda x: self.restart_game(dialog)
+        )
+        app.theme_manager.bind_color(replay_btn, 'md_bg_color', 'correct')
         dialog = MDDialog(
             title=title,
             text=text,
             buttons=[
-                MDRaisedButton(
-                    text="TEKRAR OYNA",
-                    on_release=lambda x: self.restart_game(dialog)
-                ),
+                replay_btn,
                 MDFlatButton(
                     text="İSTATİSTİKLER",
                     on_release=lambda x: self.show_stats(dialog)
@@ -582,7 +607,7 @@ class GameScreen(Screen):
     def show_stats(self, dialog):
         """İstatistikleri göster"""
         dialog.dismiss()
-        App.get_running_app().root.current = 'statistics'
+        App.get_running_app().show_statistics_screen()
         
     def go_to_menu(self, dialog):
         """Ana menüye dön"""
@@ -652,4 +677,31 @@ class GameScreen(Screen):
     def show_game_settings(self, button):
         """Oyun içi ayarlar menüsü"""
         # TODO: Erişilebilirlik ayarları eklenebilir
-        pass
+        app = App.get_running_app()
+        current = app.settings.get('game_mode', 'classic')
+        dialog = MDDialog(
+            title="⚙️ OYUN MODU",
+            text=f"Şu anki mod: {'Absurdle' if current == 'absurdle' else 'Klasik'}\n"
+                 "Mod değiştirilirse yeni oyun başlar.",
+            buttons=[
+                MDFlatButton(
+                    text="KLASİK",
+                    on_release=lambda x: self.set_game_mode(dialog, 'classic')
+                ),
+                MDFlatButton(
+                    text="ABSURDLE",
+                    on_release=lambda x: self.set_game_mode(dialog, 'absurdle')
+                ),
+            ],
+        )
+        dialog.open()
+        
+    def set_game_mode(self, dialog, mode):
+        """Oyun modunu kaydet ve gerekirse yeni oyun başlat"""
+        dialog.dismiss()
+        app = App.get_running_app()
+        if app.settings.get('game_mode', 'classic') == mode:
+            return
+        app.settings['game_mode'] = mode
+        app.save_settings()
+        self.initialize_game()
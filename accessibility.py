@@ -10,6 +10,8 @@ from kivy.logger import Logger
 import json
 import os
 
+from metrics import REGISTRY
+
 
 class AccessibilityManager:
     """Erişilebilirlik yöneticisi"""
@@ -146,8 +148,25 @@ class AccessibilityManager:
 class GameMetrics:
     """Oyun metrikleri ve analiz"""
     
-    def __init__(self):
-        """Metrik yöneticisini başlat"""
+    def __init__(self, registry=REGISTRY):
+        """
+        Metrik yöneticisini başlat
+        
+        Args:
+            registry: Oturum verilerinin de yansıtılacağı metrik kaydı
+        """
+        self.registry = registry
+        self._games_started = registry.counter(
+            'wordle_games_started_total', 'Başlatılan oyun sayısı', ('language', 'length')
+        )
+        self._games_abandoned = registry.counter(
+            'wordle_games_abandoned_total', 'Yarıda bırakılan oyun sayısı'
+        )
+        self._playtime = registry.counter(
+            'wordle_playtime_seconds_total', 'Toplam oyun süresi'
+        )
+        self._fps = registry.gauge('wordle_fps', 'Son ölçülen kare hızı')
+        self._memory = registry.gauge('wordle_memory_mb', 'Son ölçülen bellek kullanımı (MB)')
         self.metrics = self.load_metrics()
         self.current_session = {
             'start_time': time.time(),
@@ -198,10 +217,20 @@ class GameMetrics:
         except Exception as e:
             Logger.error(f"Metrikler kaydedilemedi: {e}")
             
+    def export_prometheus(self, filename: str = 'game_metrics.prom'):
+        """
+        Metrikleri Prometheus metin biçiminde dosyaya yaz
+        
+        Args:
+            filename: Hedef dosya
+        """
+        self.registry.write_to_file(filename)
+        
     def record_game_start(self, word_length: int, language: str, theme: str):
         """Oyun başlangıcını kaydet"""
         self.current_session['games_played'] += 1
         self.current_session['game_start_time'] = time.time()
+        self._games_started.inc(language=language, length=word_length)
         
         # Kelime uzunluğu
         if word_length not in self.current_session['word_lengths']:
@@ -223,13 +252,16 @@ class GameMetrics:
         if 'game_start_time' in self.current_session:
             duration = time.time() - self.current_session['game_start_time']
             self.current_session['total_playtime'] += duration
+            self._playtime.inc(duration)
             
             if not completed:
                 self.current_session['abandonment_count'] += 1
+                self._games_abandoned.inc()
                 
     def record_fps(self, fps: float):
         """FPS kaydı"""
         self.current_session['fps_samples'].append(fps)
+        self._fps.set(fps)
         
         # Son 100 örneği tut
         if len(self.current_session['fps_samples']) > 100:
@@ -238,6 +270,7 @@ class GameMetrics:
     def record_memory(self, memory_mb: float):
         """Bellek kullanımı kaydı"""
         self.current_session['memory_samples'].append(memory_mb)
+        self._memory.set(memory_mb)
         
         # Son 50 örneği tut
         if len(self.current_session['memory_samples']) > 50:
@@ -0,0 +1,226 @@
+"""
+Toplu Tahmin Değerlendirme Modülü
+Eşzamanlı çağıranların (guess, secret) çiftlerini kısa bir pencerede
+toplayıp tek geçişte puanlar
+
+Her çağıran kendi future'ını bekler; toplu iş ya en fazla max_batch_size
+çifte ulaşınca ya da max_wait saniye dolunca işlenir. Toplu işteki tekil
+çiftlerin tamamı score_pairs ile tek çağrıda puanlanır. GameServer klasik
+oyunların tahminlerini bu sınıf üzerinden değerlendirir.
+"""
+
+import asyncio
+import time
+from collections import deque
+from typing import Dict, List, Optional, Tuple
+
+from game_logic import score_pairs, decode_pattern
+
+
+class GuessBatcher:
+    """asyncio tabanlı mikro toplu tahmin değerlendirici"""
+
+    def __init__(self, max_batch_size: int = 256, max_wait: float = 0.002,
+                 latency_samples: int = 1000):
+        """
+        Toplu değerlendiriciyi başlat
+
+        Args:
+            max_batch_size: Bir toplu işteki en fazla çift sayısı
+            max_wait: İlk çiftten sonra toplu işin bekleyeceği süre (saniye)
+            latency_samples: Gecikme yüzdelikleri için saklanacak örnek sayısı
+        """
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait
+        self.loop: Optional[asyncio.AbstractEventLoop] = None
+        self._pending: List[Tuple[str, str, asyncio.Future, float]] = []
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._latencies = deque(maxlen=latency_samples)
+        # Verim ilk istekten itibaren ölçülür
+        self._started_at: Optional[float] = None
+        self._metrics = {
+            'requests': 0,
+            'batches': 0,
+            'size_flushes': 0,
+            'timer_flushes': 0,
+            'max_batch': 0,
+            'unique_pairs': 0,
+            'scoring_time': 0.0
+        }
+
+    async def evaluate_code(self, guess: str, secret: str) -> int:
+        """
+        Tahmini toplu işe ekle ve desen kodunu bekle
+
+        Args:
+            guess: Tahmin
+            secret: Gizli kelime
+
+        Returns:
+            Taban-3 desen kodu
+        """
+        if len(guess) != len(secret):
+            raise ValueError("Tahmin ve gizli kelime aynı uzunlukta olmalı")
+
+        loop = asyncio.get_running_loop()
+        if loop is not self.loop:
+            # Yeni olay döngüsünde yeniden kullanım: önceki döngünün
+            # zamanlayıcısı hiç çalışmayabilir, yarım kalan toplu işini bırak
+            self._abandon()
+            self.loop = loop
+        if self._started_at is None:
+            self._started_at = time.perf_counter()
+
+        future = loop.create_future()
+        self._pending.append((guess.upper(), secret.upper(), future, time.perf_counter()))
+        self._metrics['requests'] += 1
+
+        if len(self._pending) >= self.max_batch_size:
+            self._flush(by_size=True)
+        elif self._timer is None:
+            self._timer = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    async def evaluate(self, guess: str, secret: str) -> List[str]:
+        """
+        Tahmini toplu işe ekle ve durum listesini bekle
+
+        Args:
+            guess: Tahmin
+            secret: Gizli kelime
+
+        Returns:
+            Her pozisyon için durum listesi (GameLogic.evaluate_guess ile aynı)
+        """
+        code = await self.evaluate_code(guess, secret)
+        return decode_pattern(code, len(guess))
+
+    def evaluate_threadsafe(self, guess: str, secret: str,
+                            timeout: Optional[float] = None) -> List[str]:
+        """
+        Başka bir iş parçacığından tahmin değerlendir
+
+        Olay döngüsü başka bir iş parçacığında çalışıyor olmalı ve
+        toplu değerlendirici en az bir kez o döngüde kullanılmış ya da
+        loop özelliği atanmış olmalıdır.
+
+        Args:
+            guess: Tahmin
+            secret: Gizli kelime
+            timeout: En fazla bekleme süresi
+
+        Returns:
+            Durum listesi
+        """
+        if self.loop is None:
+            raise RuntimeError("Toplu değerlendirici bir olay döngüsüne bağlı değil")
+        future = asyncio.run_coroutine_threadsafe(self.evaluate(guess, secret), self.loop)
+        return future.result(timeout)
+
+    def _abandon(self):
+        """Önceki olay döngüsüne ait bekleyen toplu işi ve zamanlayıcıyı bırak"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        for _, _, future, _ in self._pending:
+            if not future.get_loop().is_closed():
+                future.get_loop().call_soon_threadsafe(future.cancel)
+        self._pending = []
+
+    def _flush(self, by_size: bool = False):
+        """Bekleyen çiftleri tek geçişte puanla ve future'ları çöz"""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+
+        start = time.perf_counter()
+
+        # Tekrar eden çiftleri ayıkla, kalanları tek çağrıda puanla
+        pairs = list(dict.fromkeys((guess, secret) for guess, secret, _, _ in batch))
+        codes = dict(zip(pairs, score_pairs(pairs)))
+        unique_pairs = len(pairs)
+
+        end = time.perf_counter()
+        for guess, secret, future, enqueued in batch:
+            if not future.done():
+                future.set_result(codes[guess, secret])
+            self._latencies.append(end - enqueued)
+
+        metrics = self._metrics
+        metrics['batches'] += 1
+        metrics['size_flushes' if by_size else 'timer_flushes'] += 1
+        metrics['max_batch'] = max(metrics['max_batch'], len(batch))
+        metrics['unique_pairs'] += unique_pairs
+        metrics['scoring_time'] += end - start
+
+    async def close(self):
+        """Bekleyen tüm çiftleri hemen işle"""
+        self._flush()
+
+    def get_metrics(self) -> Dict:
+        """
+        Gecikme ve verim metriklerini döndür
+
+        Returns:
+            Metrik dictionary'si (gecikmeler milisaniye)
+        """
+        metrics = dict(self._metrics)
+        elapsed = time.perf_counter() - self._started_at if self._started_at else 0.0
+
+        metrics['average_batch'] = (
+            metrics['requests'] / metrics['batches'] if metrics['batches'] else 0.0
+        )
+        metrics['throughput_per_sec'] = metrics['requests'] / elapsed if elapsed > 0 else 0.0
+        metrics['max_batch_size'] = self.max_batch_size
+        metrics['max_wait_ms'] = self.max_wait * 1000
+
+        samples = sorted(self._latencies)
+        for name, fraction in (('p50', 0.50), ('p95', 0.95), ('p99', 0.99)):
+            if samples:
+                index = min(len(samples) - 1, int(fraction * len(samples)))
+                metrics[f'latency_{name}_ms'] = samples[index] * 1000
+            else:
+                metrics[f'latency_{name}_ms'] = 0.0
+
+        return metrics
+
+
+# Test fonksiyonu
+if __name__ == '__main__':
+    """Modül testleri: tek tek puanlama ile toplu puanlama karşılaştırması"""
+    import random
+    from game_logic import pattern_code
+    from words import WordManager
+
+    words = WordManager().load_words(5, 'tr')
+    pairs = [(random.choice(words), random.choice(words)) for _ in range(100000)]
+
+    print("=== Puanlama: tek tek ve tek çağrıda ===\n")
+    start = time.perf_counter()
+    single = [pattern_code(guess, secret) for guess, secret in pairs]
+    single_time = time.perf_counter() - start
+    start = time.perf_counter()
+    bulk = score_pairs(pairs)
+    bulk_time = time.perf_counter() - start
+    assert single == bulk
+    print(f"pattern_code: {len(pairs) / single_time:>10.0f} çift/sn")
+    print(f"score_pairs:  {len(pairs) / bulk_time:>10.0f} çift/sn\n")
+
+    async def run(batch_size: int, wait: float, callers: int = 5000):
+        batcher = GuessBatcher(max_batch_size=batch_size, max_wait=wait)
+        sample = pairs[:callers]
+        await asyncio.gather(*(batcher.evaluate_code(g, s) for g, s in sample))
+        return batcher.get_metrics()
+
+    print("=== Toplu Değerlendirme Ödünleşimi ===\n")
+    print(f"{'boyut':>6} {'pencere':>8} {'ort.iş':>7} {'p50 ms':>8} {'p99 ms':>8} {'istek/sn':>10}")
+    for batch_size, wait in ((1, 0.0), (256, 0.0), (256, 0.002), (1024, 0.005)):
+        m = asyncio.run(run(batch_size, wait))
+        print(f"{batch_size:>6} {wait * 1000:>7.1f}ms {m['average_batch']:>7.1f} "
+              f"{m['latency_p50_ms']:>8.2f} {m['latency_p99_ms']:>8.2f} "
+              f"{m['throughput_per_sec']:>10.0f}")
@@ -3,20 +3,174 @@ Oyun Mantığı Modülü
 Tahmin kontrolü, doğru/yanlış harf analizi ve oyun durumu yönetimi
 """
 
-from typing import List, Optional, Tuple
+import time
+from typing import Dict, Iterable, List, Optional, Tuple
 from collections import Counter
 
+from metrics import GUESS_EVALUATION_SECONDS
+
+
+# Durum kodları: desen kodunda her pozisyon bir taban-3 basamağıdır
+STATUS_CODES = {'absent': 0, 'present': 1, 'correct': 2}
+CODE_STATUSES = ('absent', 'present', 'correct')
+
+
+def score_batch(guess: str, secrets: Iterable[str]) -> List[int]:
+    """
+    Bir tahmini birçok gizli kelimeye karşı tek geçişte puanla
+    
+    Sonuçlar liste yerine taban-3 tamsayı desen kodu olarak döner
+    (pozisyon i'nin basamağı 3**i ağırlığındadır). Kurallar
+    GameLogic.evaluate_guess ile birebir aynıdır.
+    
+    Args:
+        guess: Büyük harfli tahmin
+        secrets: Aynı uzunlukta büyük harfli gizli kelimeler
+        
+    Returns:
+        Her gizli kelime için desen kodu
+    """
+    n = len(guess)
+    weights = [3 ** i for i in range(n)]
+    positions = list(zip(range(n), guess))
+    codes = []
+    append = codes.append
+    
+    for secret in secrets:
+        code = 0
+        missing = None
+        
+        # 1. Adım: Doğru konumdakiler
+        for i, letter in positions:
+            if letter == secret[i]:
+                code += 2 * weights[i]
+            elif missing is None:
+                missing = [i]
+            else:
+                missing.append(i)
+                
+        # 2. Adım: Kalan harflerden yanlış konumdakiler
+        if missing:
+            pool = [secret[i] for i in missing]
+            for i in missing:
+                letter = guess[i]
+                if letter in pool:
+                    pool.remove(letter)
+                    code += weights[i]
+                    
+        append(code)
+        
+    return codes
+
+
+def score_pairs(pairs: Iterable[Tuple[str, str]]) -> List[int]:
+    """
+    Birbirinden bağımsız (tahmin, gizli kelime) çiftlerini tek geçişte puanla
+    
+    Her çifti ayrı ayrı pattern_code ile puanlamak yerine toplu iş
+    tek çağrıda işlenir; ağırlıklar uzunluk başına bir kez hesaplanır.
+    Kurallar score_batch ile birebir aynıdır.
+    
+    Args:
+        pairs: Aynı uzunlukta büyük harfli (tahmin, gizli kelime) çiftleri
+        
+    Returns:
+        Her çift için desen kodu
+    """
+    weights_by_length: Dict[int, List[int]] = {}
+    codes = []
+    append = codes.append
+    
+    for guess, secret in pairs:
+        n = len(guess)
+        weights = weights_by_length.get(n)
+        if weights is None:
+            weights = weights_by_length[n] = [3 ** i for i in range(n)]
+        code = 0
+        missing = None
+        
+        # 1. Adım: Doğru konumdakiler
+        for i in range(n):
+            if guess[i] == secret[i]:
+                code += 2 * weights[i]
+            elif missing is None:
+                missing = [i]
+            else:
+                missing.append(i)
+                
+        # 2. Adım: Kalan harflerden yanlış konumdakiler
+        if missing:
+            pool = [secret[i] for i in missing]
+            for i in missing:
+                letter = guess[i]
+                if letter in pool:
+                    pool.remove(letter)
+                    code += weights[i]
+                    
+        append(code)
+        
+    return codes
+
+
+def pattern_code(guess: str, secret: str) -> int:
+    """
+    Tek bir tahmin için desen kodu hesapla
+    
+    Args:
+        guess: Büyük harfli tahmin
+        secret: Büyük harfli gizli kelime
+        
+    Returns:
+        Taban-3 desen kodu
+    """
+    return score_batch(guess, (secret,))[0]
+
+
+def encode_pattern(result: List[str]) -> int:
+    """
+    Durum listesini desen koduna çevir
+    
+    Args:
+        result: ['correct', 'present', 'absent'] listesi
+        
+    Returns:
+        Taban-3 desen kodu
+    """
+    code = 0
+    for status in reversed(result):
+        code = code * 3 + STATUS_CODES[status]
+    return code
+
+
+def decode_pattern(code: int, length: int) -> List[str]:
+    """
+    Desen kodunu durum listesine çevir
+    
+    Args:
+        code: Taban-3 desen kodu
+        length: Kelime uzunluğu
+        
+    Returns:
+        Her pozisyon için durum listesi
+    """
+    result = []
+    for _ in range(length):
+        code, digit = divmod(code, 3)
+        result.append(CODE_STATUSES[digit])
+    return result
+
 
 class GameLogic:
     """Wordle oyun mantığını yöneten sınıf"""
     
-    def __init__(self, secret_word: str, max_attempts: int):
+    def __init__(self, secret_word: str, max_attempts: int, verbose: bool = True):
         """
         Oyun mantığını başlat
         
         Args:
             secret_word: Tahmin edilecek gizli kelime
             max_attempts: Maksimum tahmin hakkı
+            verbose: Konsola oyun mesajları yazılsın mı
         """
         self.secret_word = secret_word.upper()
         self.max_attempts = max_attempts
@@ -24,17 +178,23 @@ class GameLogic:
         self.guesses = []
         self.results = []
         self.won = False
+        self.verbose = verbose
+        # Kelime listesinin dili (sunucu sözlük denetimi için atar)
+        self.language: Optional[str] = None
         
-        print(f"Oyun başlatıldı: {len(secret_word)} harfli kelime, {max_attempts} deneme hakkı")
-        # DEBUG: Geliştirme sırasında gizli kelimeyi göster
-        print(f"[DEBUG] Gizli kelime: {self.secret_word}")
+        if self.verbose:
+            print(f"Oyun başlatıldı: {len(secret_word)} harfli kelime, {max_attempts} deneme hakkı")
+            # DEBUG: Geliştirme sırasında gizli kelimeyi göster
+            print(f"[DEBUG] Gizli kelime: {self.secret_word}")
         
-    def make_guess(self, guess: str) -> Optional[List[str]]:
+    def make_guess(self, guess: str, result: Optional[List[str]] = None) -> Optional[List[str]]:
         """
         Tahmin yap ve sonucu döndür
         
         Args:
             guess: Tahmin edilen kelime
+            result: Önceden (ör. toplu olarak) hesaplanmış sonuç; None ise
+                tahmin burada değerlendirilir
             
         Returns:
             Her harf için durum listesi ['correct', 'present', 'absent']
@@ -44,11 +204,13 @@ class GameLogic:
         
         # Validasyon kontrolleri
         if len(guess) != len(self.secret_word):
-            print(f"HATA: Tahmin uzunluğu yanlış ({len(guess)} != {len(self.secret_word)})")
+            if self.verbose:
+                print(f"HATA: Tahmin uzunluğu yanlış ({len(guess)} != {len(self.secret_word)})")
             return None
             
         if self.is_game_over():
-            print("HATA: Oyun zaten bitti!")
+            if self.verbose:
+                print("HATA: Oyun zaten bitti!")
             return None
             
         # Tahmini kaydet
@@ -56,14 +218,18 @@ class GameLogic:
         self.current_attempt += 1
         
         # Tahmin sonucunu hesapla
-        result = self.evaluate_guess(guess)
+        if result is None:
+            start = time.perf_counter()
+            result = self.evaluate_guess(guess)
+            GUESS_EVALUATION_SECONDS.observe(time.perf_counter() - start)
         self.results.append(result)
         
         # Kazandı mı kontrol et
         if all(status == 'correct' for status in result):
             self.won = True
-            print(f"TEBRİKLER! {self.current_attempt}. denemede doğru kelimeyi buldunuz!")
-        elif self.current_attempt >= self.max_attempts:
+            if self.verbose:
+                print(f"TEBRİKLER! {self.current_attempt}. denemede doğru kelimeyi buldunuz!")
+        elif self.current_attempt >= self.max_attempts and self.verbose:
             print(f"Oyun bitti! Doğru kelime: {self.secret_word}")
             
         return result
@@ -109,6 +275,15 @@ class GameLogic:
                 
         return result
         
+    def reveal_secret(self) -> str:
+        """
+        Gizli kelimeyi oyun sonu gösterimi için döndür
+        
+        Returns:
+            Gizli kelime
+        """
+        return self.secret_word
+        
     def is_game_over(self) -> bool:
         """
         Oyun bitti mi kontrol et
@@ -185,6 +360,208 @@ class GameLogic:
             'guesses': self.guesses,
             'results': self.results
         }
+        
+    def to_snapshot(self) -> dict:
+        """
+        Oyunu yeniden kurulabilir kompakt bir dictionary'ye çevir
+        
+        Sonuçlar desen kodu olarak saklanır.
+        
+        Returns:
+            Anlık görüntü dictionary'si
+        """
+        return {
+            'mode': 'classic',
+            'secret': self.secret_word,
+            'max_attempts': self.max_attempts,
+            'language': self.language,
+            'guesses': list(self.guesses),
+            'patterns': [encode_pattern(result) for result in self.results]
+        }
+        
+    @classmethod
+    def from_snapshot(cls, snapshot: dict, verbose: bool = False) -> 'GameLogic':
+        """
+        Anlık görüntüden oyunu yeniden oluştur
+        
+        Args:
+            snapshot: to_snapshot çıktısı
+            verbose: Konsola oyun mesajları yazılsın mı
+            
+        Returns:
+            GameLogic nesnesi
+        """
+        if snapshot.get('mode') == 'absurdle':
+            game = AbsurdleGameLogic(snapshot['candidates'], snapshot['max_attempts'], verbose)
+        else:
+            game = GameLogic(snapshot['secret'], snapshot['max_attempts'], verbose)
+        game.language = snapshot.get('language')
+        game._restore_history(snapshot['guesses'], snapshot['patterns'])
+        return game
+        
+    def _restore_history(self, guesses: List[str], patterns: List[int]):
+        """Tahmin geçmişini yeniden değerlendirmeden geri yükle"""
+        length = len(self.secret_word)
+        win_code = 3 ** length - 1
+        self.guesses = list(guesses)
+        self.results = [decode_pattern(code, length) for code in patterns]
+        self.current_attempt = len(self.guesses)
+        self.won = bool(patterns) and patterns[-1] == win_code
+
+
+class AbsurdleGameLogic(GameLogic):
+    """
+    Gizli kelimesi sabit olmayan düşmanca (Absurdle) oyun modu
+    
+    Her tahminden sonra kalan adaylar geri bildirim desenine göre
+    gruplanır ve en büyük grup tutulur. secret_word her zaman kalan
+    gruptan bir temsilcidir; böylece GameLogic'in genel API'si ve her iki
+    GameScreen değişmeden çalışır.
+    """
+    
+    def __init__(self, candidates: List[str], max_attempts: int, verbose: bool = True):
+        """
+        Absurdle oyununu başlat
+        
+        Args:
+            candidates: Aynı uzunlukta aday kelimeler
+            max_attempts: Maksimum tahmin hakkı
+            verbose: Konsola oyun mesajları yazılsın mı
+        """
+        if not candidates:
+            raise ValueError("Absurdle için en az bir aday kelime gerekli")
+            
+        self.candidates = [word.upper() for word in candidates]
+        super().__init__(self.candidates[0], max_attempts, verbose)
+        
+    def partition(self, guess: str) -> Dict[int, List[str]]:
+        """
+        Kalan adayları tahmine göre desen kodlarına ayır
+        
+        Args:
+            guess: Büyük harfli tahmin
+            
+        Returns:
+            {desen_kodu: aday_listesi} dictionary'si
+        """
+        buckets: Dict[int, List[str]] = {}
+        codes = score_batch(guess, self.candidates)
+        
+        for code, word in zip(codes, self.candidates):
+            bucket = buckets.get(code)
+            if bucket is None:
+                buckets[code] = [word]
+            else:
+                bucket.append(word)
+                
+        return buckets
+        
+    def make_guess(self, guess: str) -> Optional[List[str]]:
+        """
+        Tahmin yap; önce aday kümesini en büyük desen grubuna daralt
+        
+        Args:
+            guess: Tahmin edilen kelime
+            
+        Returns:
+            Her harf için durum listesi, geçersiz tahmin ise None
+        """
+        guess = guess.upper()
+        
+        # Geçersiz tahminleri üst sınıfın mesajlarıyla reddet
+        if len(guess) != len(self.secret_word) or self.is_game_over():
+            return super().make_guess(guess)
+            
+        win_code = 3 ** len(guess) - 1  # Tüm basamaklar 'correct'
+        buckets = self.partition(guess)
+        
+        # En büyük grup; eşitlikte kazandırmayan desen tercih edilir
+        _, self.candidates = max(
+            buckets.items(),
+            key=lambda item: (len(item[1]), item[0] != win_code)
+        )
+        self.secret_word = self.candidates[0]
+        
+        return super().make_guess(guess)
+        
+    def get_remaining_candidates(self) -> List[str]:
+        """
+        Kalan aday kelimeleri döndür
+        
+        Returns:
+            Aday kelime listesi
+        """
+        return list(self.candidates)
+        
+    def to_snapshot(self) -> dict:
+        """
+        Oyunu kalan adaylarla birlikte kompakt bir dictionary'ye çevir
+        
+        Returns:
+            Anlık görüntü dictionary'si
+        """
+        snapshot = super().to_snapshot()
+        snapshot['mode'] = 'absurdle'
+        snapshot['candidates'] = list(self.candidates)
+        return snapshot
+
+
+class HashedGameLogic(GameLogic):
+    """
+    Gizli kelimesi bellekte düz metin tutulmayan oyun
+    
+    Kelime yalnızca cevap deposundaki sırası ve anahtarlı özeti olarak
+    saklanır (bkz. security.HashedAnswerStore). Doğru tahmin özet
+    karşılaştırmasıyla tanınır; diğer tahminler puanlama süresince depodan
+    geçici olarak çözülen kelimeye karşı değerlendirilir. secret_word yalnızca
+    uzunluğu taşıyan bir maskedir; kelime reveal_secret ile oyun sonunda alınır.
+    """
+    
+    def __init__(self, store, secret_index: int, word_length: int, max_attempts: int,
+                 verbose: bool = True):
+        """
+        Oyunu cevap deposundaki bir kelimeyle başlat (kelime çözülmez)
+        
+        Args:
+            store: security.HashedAnswerStore
+            secret_index: Gizli kelimenin depodaki sırası
+            word_length: Kelime uzunluğu
+            max_attempts: Maksimum tahmin hakkı
+            verbose: Konsola oyun mesajları yazılsın mı
+        """
+        self.store = store
+        self.secret_index = secret_index
+        self.secret_hash = store.digest_at(secret_index)
+        super().__init__('?' * word_length, max_attempts, verbose)
+        
+    def evaluate_guess(self, guess: str) -> List[str]:
+        """
+        Tahmini depodaki gizli kelimeye karşı değerlendir
+        
+        Args:
+            guess: Tahmin edilen kelime
+            
+        Returns:
+            Her pozisyon için durum listesi
+        """
+        guess = guess.upper()
+        if self.store.digest(guess) == self.secret_hash:
+            return ['correct'] * len(guess)
+        return decode_pattern(pattern_code(guess, self.store.reveal(self.secret_index)),
+                              len(guess))
+        
+    def reveal_secret(self) -> str:
+        """
+        Gizli kelimeyi depodan çöz (yalnızca oyun sonu gösterimi için)
+        
+        Returns:
+            Gizli kelime
+        """
+        return self.store.reveal(self.secret_index)
+        
+    def to_snapshot(self) -> dict:
+        """Depo anahtarı olmadan yeniden kurulamayacağından desteklenmez"""
+        raise NotImplementedError("Hashed oyunlar anlık görüntüye çevrilemez")
 
 
 # Test fonksiyonu
@@ -0,0 +1,292 @@
+"""
+Oyun Geçmişi Modülü
+Biten her oyunu sabit boyutlu ikili kayıt olarak sona ekleyen günlük
+
+Her kayıt 16 bayttır:
+    zaman damgası (u32, unix saniye), dil (2 ASCII bayt), kelime uzunluğu (u8),
+    tahmin sayısı + kazanma biti (u8), süre (u32, milisaniye), kelime kimliği (i32)
+
+Dosya yalnızca sona eklenir; kayıt eklemek dosya boyutundan bağımsız
+olarak O(1)'dir ve ilk eklemede açılan tanıtıcı açık tutulur. Aynı anda
+binlerce günlük kullanan çağıranlar (ör. oyuncu profilleri) keep_open=False
+ile her eklemede açıp kapatabilir. Yarım kalmış son kayıt (yazma sırasında
+çökme) dosya açılırken kesilir; read_only=True ile açılan günlük ise
+dosyaya hiç dokunmaz ve yarım kuyruğu yalnızca yok sayar.
+"""
+
+import os
+import struct
+import threading
+import time
+from typing import Dict, Iterator, NamedTuple, Optional
+
+
+RECORD = struct.Struct('<I2sBBIi')
+WON_BIT = 0x80
+# Tek seferde okunacak kayıt sayısı
+READ_CHUNK_RECORDS = 4096
+
+
+class GameRecord(NamedTuple):
+    """Tek bir oyunun geçmiş kaydı"""
+    timestamp: int
+    language: str
+    word_length: int
+    attempts: int
+    won: bool
+    duration_ms: int = 0
+    word_id: int = -1
+
+
+def pack_record(record: GameRecord) -> bytes:
+    """
+    Kaydı 16 baytlık ikili biçime çevir
+
+    Args:
+        record: Oyun kaydı
+
+    Returns:
+        İkili kayıt
+    """
+    flags = (record.attempts & 0x7F) | (WON_BIT if record.won else 0)
+    return RECORD.pack(
+        record.timestamp & 0xFFFFFFFF,
+        record.language.encode('ascii')[:2].ljust(2, b' '),
+        record.word_length,
+        flags,
+        min(max(record.duration_ms, 0), 0xFFFFFFFF),
+        record.word_id
+    )
+
+
+def unpack_record(timestamp: int, language: bytes, word_length: int,
+                  flags: int, duration_ms: int, word_id: int) -> GameRecord:
+    """struct alanlarından GameRecord oluştur"""
+    return GameRecord(
+        timestamp,
+        language.decode('ascii').rstrip(),
+        word_length,
+        flags & 0x7F,
+        bool(flags & WON_BIT),
+        duration_ms,
+        word_id
+    )
+
+
+class GameHistory:
+    """Sona eklemeli ikili oyun geçmişi"""
+
+    def __init__(self, path: str, keep_open: bool = True, read_only: bool = False):
+        """
+        Geçmiş günlüğünü aç
+
+        Args:
+            path: Günlük dosyasının yolu
+            keep_open: Ekleme tanıtıcısı açık tutulsun mu (False ise her eklemede açılır)
+            read_only: True ise dosya değiştirilmez (ekleme ve silme reddedilir)
+        """
+        self.path = path
+        self.keep_open = keep_open
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._file = None
+        self._count = self._scan()
+
+    def _scan(self) -> int:
+        """Dosyadaki tam kayıt sayısını bul, yarım kalan kuyruğu kes"""
+        if not os.path.exists(self.path):
+            return 0
+        size = os.path.getsize(self.path)
+        remainder = size % RECORD.size
+        if remainder and not self.read_only:
+            print(f"Geçmiş dosyasında yarım kayıt kesildi ({remainder} bayt)")
+            with open(self.path, 'r+b') as f:
+                f.truncate(size - remainder)
+        return size // RECORD.size
+
+    def append(self, record: GameRecord):
+        """
+        Kaydı günlüğün sonuna ekle
+
+        Args:
+            record: Oyun kaydı
+        """
+        if self.read_only:
+            raise PermissionError(f"Geçmiş salt okunur açıldı: {self.path}")
+        data = pack_record(record)
+        with self._lock:
+            if self._file is None:
+                self._file = open(self.path, 'ab', buffering=0)
+            try:
+                self._file.write(data)
+            finally:
+                if not self.keep_open:
+                    self._file.close()
+                    self._file = None
+            self._count += 1
+
+    def record(self, won: bool, attempts: int, word_length: int, language: str,
+               duration: float = 0.0, word_id: int = -1,
+               timestamp: Optional[float] = None) -> GameRecord:
+        """
+        Oyunu kayıt olarak oluştur ve ekle
+
+        Args:
+            won: Kazanıldı mı
+            attempts: Tahmin sayısı
+            word_length: Kelime uzunluğu
+            language: Dil kodu
+            duration: Oyun süresi (saniye)
+            word_id: Gizli kelimenin listedeki sırası (-1 ise bilinmiyor)
+            timestamp: Unix zamanı (None ise şimdi)
+
+        Returns:
+            Eklenen kayıt
+        """
+        record = GameRecord(
+            int(time.time() if timestamp is None else timestamp),
+            language, word_length, attempts, won,
+            int(duration * 1000), word_id
+        )
+        self.append(record)
+        return record
+
+    def iter_records(self, start: int = 0, since: Optional[float] = None,
+                     language: Optional[str] = None,
+                     word_length: Optional[int] = None) -> Iterator[GameRecord]:
+        """
+        Kayıtları sırayla ve parça parça oku
+
+        Args:
+            start: Başlanacak kayıt sırası
+            since: Yalnızca bu unix zamanından sonraki oyunlar
+            language: Yalnızca bu dil
+            word_length: Yalnızca bu uzunluk
+
+        Yields:
+            GameRecord nesneleri
+        """
+        if not os.path.exists(self.path):
+            return
+
+        with self._lock:
+            end = self._count
+        chunk_size = READ_CHUNK_RECORDS * RECORD.size
+
+        with open(self.path, 'rb') as f:
+            f.seek(start * RECORD.size)
+            remaining = (end - start) * RECORD.size
+            while remaining > 0:
+                chunk = f.read(min(chunk_size, remaining))
+                if not chunk:
+                    break
+                remaining -= len(chunk)
+                for fields in RECORD.iter_unpack(chunk):
+                    record = unpack_record(*fields)
+                    if since is not None and record.timestamp < since:
+                        continue
+                    if language is not None and record.language != language:
+                        continue
+                    if word_length is not None and record.word_length != word_length:
+                        continue
+                    yield record
+
+    def query(self, since: Optional[float] = None, language: Optional[str] = None,
+              word_length: Optional[int] = None) -> Dict:
+        """
+        Filtrelenmiş oyunların özetini hesapla
+
+        Örnek: son 30 günde 6 harfli Türkçe oyunların kazanma oranı
+            history.query(since=time.time() - 30 * 86400, language='tr', word_length=6)
+
+        Args:
+            since: Yalnızca bu unix zamanından sonraki oyunlar
+            language: Yalnızca bu dil
+            word_length: Yalnızca bu uzunluk
+
+        Returns:
+            {played, won, win_rate, average_attempts, average_duration} dictionary'si
+        """
+        played = won = attempts = 0
+        duration_ms = 0
+        for record in self.iter_records(since=since, language=language,
+                                        word_length=word_length):
+            played += 1
+            duration_ms += record.duration_ms
+            if record.won:
+                won += 1
+                attempts += record.attempts
+
+        return {
+            'played': played,
+            'won': won,
+            'win_rate': (won / played * 100) if played else 0.0,
+            'average_attempts': (attempts / won) if won else 0.0,
+            'average_duration': (duration_ms / played / 1000) if played else 0.0
+        }
+
+    def refresh(self) -> int:
+        """
+        Kayıt sayısını dosya boyutundan yeniden oku (başka süreçlerin eklemeleri için)
+
+        Returns:
+            Dosyadaki tam kayıt sayısı
+        """
+        with self._lock:
+            try:
+                self._count = os.path.getsize(self.path) // RECORD.size
+            except FileNotFoundError:
+                self._count = 0
+            return self._count
+
+    def clear(self):
+        """
+        Tüm geçmişi sil
+
+        Dosya silinmez, kesilir; böylece aynı dosyayı sona ekleme kipinde
+        açık tutan diğer süreçler yeni boş dosyaya yazmaya devam eder.
+        """
+        if self.read_only:
+            raise PermissionError(f"Geçmiş salt okunur açıldı: {self.path}")
+        with self._lock:
+            if os.path.exists(self.path):
+                with open(self.path, 'r+b') as f:
+                    f.truncate(0)
+            self._count = 0
+
+    def close(self):
+        """Dosya tanıtıcısını kapat"""
+        with self._lock:
+            if self._file is not None:
+                self._file.close()
+                self._file = None
+
+    def __len__(self) -> int:
+        return self._count
+
+
+# Test fonksiyonu
+if __name__ == '__main__':
+    """Modül testleri: 100 bin kayıt ekleme ve sorgu süresi"""
+    import random
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), 'history.bin')
+    history = GameHistory(path)
+
+    print("=== Oyun Geçmişi Test ===\n")
+    start = time.perf_counter()
+    now = time.time()
+    for i in range(100_000):
+        history.record(random.random() < 0.7, random.randint(1, 6), random.choice((5, 6, 7)),
+                       random.choice(('tr', 'en')), random.uniform(20, 300),
+                       random.randint(0, 5000), now - random.uniform(0, 90 * 86400))
+    elapsed = time.perf_counter() - start
+    print(f"100.000 kayıt: {elapsed:.2f}s ({elapsed / 100_000 * 1e6:.1f} µs/kayıt), "
+          f"{os.path.getsize(path) / 1024:.0f} KB")
+
+    start = time.perf_counter()
+    result = history.query(since=now - 30 * 86400, language='tr', word_length=6)
+    print(f"Son 30 gün, TR, 6 harf: {result} ({(time.perf_counter() - start) * 1000:.0f} ms)")
+
+    history.clear()
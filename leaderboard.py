@@ -0,0 +1,281 @@
+"""
+Liderlik Tablosu Modülü
+Oyuncuların en iyi oyunlarını (en az tahmin, eşitlikte en kısa süre)
+dil ve kelime uzunluğuna göre sıralı tutar
+
+Her tablo (tahmin, süre_ms, oyuncu) anahtarlarından oluşan sıralı bir
+listedir; yeni sonuçlar bisect ile yerine eklenir. Oyuncunun sırası ve
+ilk K oyuncu ikili aramayla O(log n)'de bulunur. Tablolar kompakt ikili
+biçimde atomik olarak kaydedilir.
+"""
+
+import os
+import struct
+import threading
+from bisect import bisect_left, insort
+from typing import Dict, List, Optional, Tuple
+
+from persistence import WriteBehind, atomic_write_bytes
+
+
+MAGIC = b'WLB1'
+HEADER = struct.Struct('<4sH')
+BOARD_HEADER = struct.Struct('<2sBI')
+ENTRY = struct.Struct('<BIB')
+# Kimlik uzunluğu kayıtta tek baytla tutulur
+MAX_PLAYER_ID_BYTES = 255
+
+# (tahmin, süre_ms, oyuncu_kimliği)
+Entry = Tuple[int, int, str]
+
+
+class Leaderboard:
+    """Tek bir (dil, uzunluk) için oyuncu başına en iyi sonuçların sıralı listesi"""
+
+    def __init__(self):
+        """Boş tablo oluştur"""
+        self._entries: List[Entry] = []
+        self._best: Dict[str, Entry] = {}
+
+    def submit(self, player_id: str, attempts: int, time_ms: int) -> bool:
+        """
+        Kazanılmış bir oyunu tabloya gönder
+
+        Oyuncunun önceki en iyi sonucundan iyiyse eskisinin yerini alır.
+
+        Args:
+            player_id: Oyuncu kimliği
+            attempts: Tahmin sayısı
+            time_ms: Oyun süresi (milisaniye)
+
+        Returns:
+            Tablo değiştiyse True
+        """
+        entry = (attempts, time_ms, player_id)
+        previous = self._best.get(player_id)
+        if previous is not None:
+            if previous <= entry:
+                return False
+            del self._entries[bisect_left(self._entries, previous)]
+
+        insort(self._entries, entry)
+        self._best[player_id] = entry
+        return True
+
+    def rank(self, player_id: str) -> Optional[int]:
+        """
+        Oyuncunun sırasını döndür (1 en iyi)
+
+        Args:
+            player_id: Oyuncu kimliği
+
+        Returns:
+            Sıra veya oyuncu tabloda yoksa None
+        """
+        entry = self._best.get(player_id)
+        if entry is None:
+            return None
+        return bisect_left(self._entries, entry) + 1
+
+    def top(self, k: int = 10) -> List[Dict]:
+        """
+        İlk K oyuncuyu döndür
+
+        Args:
+            k: Oyuncu sayısı
+
+        Returns:
+            {rank, player_id, attempts, time_ms} listesi
+        """
+        return [
+            {'rank': i + 1, 'player_id': player_id, 'attempts': attempts, 'time_ms': time_ms}
+            for i, (attempts, time_ms, player_id) in enumerate(self._entries[:k])
+        ]
+
+    def get_best(self, player_id: str) -> Optional[Entry]:
+        """Oyuncunun en iyi sonucunu döndür"""
+        return self._best.get(player_id)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+class LeaderboardSet:
+    """Dil ve kelime uzunluğuna göre liderlik tabloları (kalıcı)"""
+
+    def __init__(self, path: Optional[str] = 'leaderboard.bin',
+                 flush_delay: Optional[float] = 2.0):
+        """
+        Tabloları yükle
+
+        Args:
+            path: Kayıt dosyası (None ise yalnızca bellekte)
+            flush_delay: Yazma gecikmesi (saniye, None ise hemen)
+        """
+        self.path = path
+        self._lock = threading.Lock()
+        self._boards: Dict[Tuple[str, int], Leaderboard] = {}
+        self._writer = WriteBehind(self._write, flush_delay or 0)
+        if path and os.path.exists(path):
+            self._load()
+
+    def board(self, language: str, word_length: int) -> Leaderboard:
+        """
+        (dil, uzunluk) tablosunu al veya oluştur
+
+        Args:
+            language: Dil kodu
+            word_length: Kelime uzunluğu
+
+        Returns:
+            Leaderboard nesnesi
+        """
+        key = (language, word_length)
+        board = self._boards.get(key)
+        if board is None:
+            board = self._boards[key] = Leaderboard()
+        return board
+
+    def record_game(self, player_id: str, won: bool, attempts: int, word_length: int,
+                    language: str, duration: float = 0.0) -> Optional[int]:
+        """
+        Oyun sonucunu ilgili tabloya ilet (Statistics.record_game ile aynı veriler)
+
+        Args:
+            player_id: Oyuncu kimliği
+            won: Oyun kazanıldı mı (yalnızca kazanılan oyunlar sıralanır)
+            attempts: Tahmin sayısı
+            word_length: Kelime uzunluğu
+            language: Dil kodu
+            duration: Oyun süresi (saniye)
+
+        Returns:
+            Oyuncunun güncel sırası (kaybedilen oyunda None)
+            
+        Raises:
+            ValueError: Oyuncu kimliği MAX_PLAYER_ID_BYTES bayttan uzunsa
+        """
+        if len(player_id.encode('utf-8')) > MAX_PLAYER_ID_BYTES:
+            # Kaydedilemeyecek bir kimlik sonraki her yazmayı bozardı
+            raise ValueError(f"Oyuncu kimliği {MAX_PLAYER_ID_BYTES} bayttan uzun olamaz")
+        if not won:
+            return None
+        with self._lock:
+            board = self.board(language, word_length)
+            changed = board.submit(player_id, attempts, int(duration * 1000))
+            rank = board.rank(player_id)
+        if changed and self.path:
+            self._writer.mark_dirty()
+        return rank
+
+    def rank(self, player_id: str, language: str, word_length: int) -> Optional[int]:
+        """Oyuncunun (dil, uzunluk) tablosundaki sırası"""
+        with self._lock:
+            board = self._boards.get((language, word_length))
+            return board.rank(player_id) if board else None
+
+    def top(self, language: str, word_length: int, k: int = 10) -> List[Dict]:
+        """(dil, uzunluk) tablosundaki ilk K oyuncu"""
+        with self._lock:
+            board = self._boards.get((language, word_length))
+            return board.top(k) if board else []
+
+    def _serialize(self) -> bytes:
+        """Tabloları ikili biçime çevir"""
+        parts = [HEADER.pack(MAGIC, len(self._boards))]
+        for (language, word_length), board in sorted(self._boards.items()):
+            parts.append(BOARD_HEADER.pack(language.encode('ascii')[:2].ljust(2, b' '),
+                                           word_length, len(board)))
+            for attempts, time_ms, player_id in board._entries:
+                encoded = player_id.encode('utf-8')
+                parts.append(ENTRY.pack(attempts, min(time_ms, 0xFFFFFFFF), len(encoded)))
+                parts.append(encoded)
+        return b''.join(parts)
+
+    def _write(self):
+        """Tabloları dosyaya atomik olarak yaz"""
+        with self._lock:
+            data = self._serialize()
+        atomic_write_bytes(self.path, data)
+
+    def _load(self):
+        """Tabloları dosyadan oku (kayıtlar zaten sıralı)"""
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+            magic, board_count = HEADER.unpack_from(data, 0)
+            if magic != MAGIC:
+                raise ValueError("Geçersiz liderlik dosyası")
+            offset = HEADER.size
+            for _ in range(board_count):
+                language, word_length, count = BOARD_HEADER.unpack_from(data, offset)
+                offset += BOARD_HEADER.size
+                board = self.board(language.decode('ascii').rstrip(), word_length)
+                for _ in range(count):
+                    attempts, time_ms, id_length = ENTRY.unpack_from(data, offset)
+                    offset += ENTRY.size
+                    player_id = data[offset:offset + id_length].decode('utf-8')
+                    offset += id_length
+                    entry = (attempts, time_ms, player_id)
+                    board._entries.append(entry)
+                    board._best[player_id] = entry
+        except Exception as e:
+            print(f"Liderlik tablosu yüklenemedi: {e}")
+            self._boards = {}
+
+    def rebuild_from_profiles(self, store) -> int:
+        """
+        Tabloları profil deposundaki tüm oyunlardan yeniden oluştur
+
+        Args:
+            store: ProfileStore nesnesi
+
+        Returns:
+            İşlenen oyun sayısı
+        """
+        with self._lock:
+            self._boards = {}
+        games = 0
+        for player_id in store.iter_player_ids():
+            for record in store.get(player_id).iter_games():
+                self.record_game(player_id, record.won, record.attempts,
+                                 record.word_length, record.language,
+                                 record.duration_ms / 1000)
+                games += 1
+        return games
+
+    def flush(self) -> bool:
+        """Bekleyen değişiklikleri yaz"""
+        return self._writer.flush()
+
+    def close(self):
+        """Zamanlayıcıyı durdur ve bekleyen değişiklikleri yaz"""
+        self._writer.close()
+
+
+# Test fonksiyonu
+if __name__ == '__main__':
+    """Modül testleri: 100 bin oyuncu, sıra ve ilk 10 sorgu süreleri"""
+    import random
+    import time
+
+    print("=== Liderlik Tablosu Test ===\n")
+    boards = LeaderboardSet(path=None)
+
+    start = time.perf_counter()
+    for i in range(200_000):
+        boards.record_game(f"oyuncu{random.randrange(100_000)}", True,
+                           random.randint(1, 6), 5, 'tr', random.uniform(10, 600))
+    elapsed = time.perf_counter() - start
+    board = boards.board('tr', 5)
+    print(f"200.000 sonuç, {len(board)} oyuncu: {elapsed:.2f}s "
+          f"({elapsed / 200_000 * 1e6:.1f} µs/sonuç)")
+
+    start = time.perf_counter()
+    for i in range(10_000):
+        boards.rank(f"oyuncu{i}", 'tr', 5)
+    print(f"rank: {(time.perf_counter() - start) / 10_000 * 1e6:.1f} µs")
+
+    for row in boards.top('tr', 5, 3):
+        print(row)
+    print(f"Kompakt boyut: {len(boards._serialize()) / 1024:.0f} KB")
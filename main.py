@@ -27,10 +27,9 @@ import os
 import time
 
 from words import WordManager
-from game_logic import GameLogic
-from statistics import Statistics
 from sounds import SoundManager
 from themes import ThemeManager
+from metrics import REGISTRY, STARTUP
 
 
 class LetterBox(Label):
@@ -48,6 +47,15 @@ class LetterBox(Label):
         # Bind pozisyon değişikliklerini
         self.bind(pos=self.update_graphics, size=self.update_graphics)
         
+        # Tema değişiminde yeniden oluşturmadan boyan
+        app = App.get_running_app()
+        if app:
+            app.theme_manager.register_widget(self)
+            
+    def apply_theme(self, palette):
+        """Tema değişti: kutuyu mevcut durumuyla yeniden boya"""
+        self.update_graphics()
+        
     def update_graphics(self, *args):
         """Canvas'ı güncelle"""
         self.canvas.before.clear()
@@ -56,27 +64,27 @@ class LetterBox(Label):
         if not app:
             return
             
-        theme_manager = app.theme_manager
         dark_mode = app.settings.get('theme', 'Light') == 'Dark'
+        palette = app.theme_manager.get_palette(dark_mode)
         
         with self.canvas.before:
             from kivy.graphics import Color, RoundedRectangle, Line
             
             if self.status == 'correct':
                 # Yeşil arka plan
-                Color(*theme_manager.get_color('correct', dark_mode))
+                Color(*palette['correct'])
                 RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(5)])
                 self.color = (1, 1, 1, 1)  # Beyaz metin
                 
             elif self.status == 'present':
                 # Sarı arka plan
-                Color(*theme_manager.get_color('present', dark_mode))
+                Color(*palette['present'])
                 RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(5)])
                 self.color = (1, 1, 1, 1)  # Beyaz metin
                 
             elif self.status == 'absent':
                 # Gri arka plan
-                Color(*theme_manager.get_color('absent', dark_mode))
+                Color(*palette['absent'])
                 RoundedRectangle(pos=self.pos, size=self.size, radius=[dp(5)])
                 self.color = (1, 1, 1, 1)  # Beyaz metin
                 
@@ -88,7 +96,7 @@ class LetterBox(Label):
                 
             else:
                 # Boş - sadece border
-                border_color = theme_manager.get_color('border', dark_mode)
+                border_color = palette['border']
                 Color(*border_color)
                 Line(
                     rounded_rectangle=(
@@ -158,13 +166,22 @@ class KeyboardKey(MDRaisedButton):
         
         app = App.get_running_app()
         if app:
-            theme_manager = app.theme_manager
             dark_mode = app.settings.get('theme', 'Light') == 'Dark'
-            self.md_bg_color = theme_manager.get_color('keyboard', dark_mode)
-            self.text_color = theme_manager.get_color('text', dark_mode)
+            palette = app.theme_manager.get_palette(dark_mode)
+            self.md_bg_color = palette['keyboard']
+            self.text_color = palette['text']
+            app.theme_manager.register_widget(self)
         
         self.on_release = lambda: callback(letter)
         
+    def apply_theme(self, palette):
+        """Tema değişti: tuşu mevcut durumunun rengiyle yeniden boya"""
+        if self.status in ('correct', 'present', 'absent'):
+            self.md_bg_color = palette[self.status]
+        else:
+            self.md_bg_color = palette['keyboard']
+            self.text_color = palette['text']
+        
     def update_color(self, status):
         """Tuş rengini güncelle"""
         self.status = status
@@ -173,17 +190,17 @@ class KeyboardKey(MDRaisedButton):
         if not app:
             return
             
-        theme_manager = app.theme_manager
         dark_mode = app.settings.get('theme', 'Light') == 'Dark'
+        palette = app.theme_manager.get_palette(dark_mode)
         
         if status == 'correct':
-            self.md_bg_color = theme_manager.get_color('correct', dark_mode)
+            self.md_bg_color = palette['correct']
             self.text_color = (1, 1, 1, 1)
         elif status == 'present':
-            self.md_bg_color = theme_manager.get_color('present', dark_mode)
+            self.md_bg_color = palette['present']
             self.text_color = (1, 1, 1, 1)
         elif status == 'absent':
-            self.md_bg_color = theme_manager.get_color('absent', dark_mode)
+            self.md_bg_color = palette['absent']
             self.text_color = (1, 1, 1, 1)
 
 
@@ -242,6 +259,9 @@ class StatisticsScreen(Screen):
         distribution_card = self.create_distribution_card(stats)
         self.stats_container.add_widget(distribution_card)
         
+        rolling_card = self.create_rolling_card(stats)
+        self.stats_container.add_widget(rolling_card)
+        
     def create_summary_card(self, stats):
         from kivymd.uix.card import MDCard
         
@@ -295,6 +315,39 @@ class StatisticsScreen(Screen):
         card.add_widget(grid)
         return card
         
+    def create_rolling_card(self, stats):
+        from kivymd.uix.card import MDCard
+        
+        card = MDCard(
+            orientation='vertical',
+            padding=dp(15),
+            spacing=dp(10),
+            size_hint_y=None,
+            height=dp(140)
+        )
+        
+        title = MDLabel(
+            text="SON GÜNLER", 
+            font_style='H6', 
+            size_hint_y=None, 
+            height=dp(30)
+        )
+        card.add_widget(title)
+        
+        for label_text, window in (("Son 7 gün", stats['last_7_days']),
+                                   ("Son 30 gün", stats['last_30_days'])):
+            row = MDLabel(
+                text=(f"{label_text}: {window['played']} oyun, "
+                      f"%{window['win_rate']} kazanma, "
+                      f"ort. {window['average_guesses']} tahmin, "
+                      f"en iyi seri {window['max_streak']}"),
+                size_hint_y=None,
+                height=dp(30)
+            )
+            card.add_widget(row)
+            
+        return card
+        
     def create_distribution_card(self, stats):
         from kivymd.uix.card import MDCard
         
@@ -415,6 +468,15 @@ class MenuScreen(Screen):
         self.word_length_btn.bind(on_release=self.show_word_length_menu)
         settings_box.add_widget(self.word_length_btn)
         
+        self.game_mode_btn = MDRaisedButton(
+            text="Mod: Klasik",
+            size_hint=(0.8, None),
+            height=dp(50),
+            pos_hint={'center_x': 0.5}
+        )
+        self.game_mode_btn.bind(on_release=self.show_game_mode_menu)
+        settings_box.add_widget(self.game_mode_btn)
+        
         self.theme_btn = MDRaisedButton(
             text="Tema: Klasik",
             size_hint=(0.8, None),
@@ -462,6 +524,7 @@ class MenuScreen(Screen):
         
         self.language_menu = None
         self.word_length_menu = None
+        self.game_mode_menu = None
         self.theme_menu = None
         
     def show_language_menu(self, button):
@@ -486,6 +549,16 @@ class MenuScreen(Screen):
         self.word_length_menu = MDDropdownMenu(caller=button, items=menu_items, width_mult=4)
         self.word_length_menu.open()
         
+    def show_game_mode_menu(self, button):
+        menu_items = [
+            {"text": "Klasik", "viewclass": "OneLineListItem",
+             "on_release": lambda: self.set_game_mode("classic", "Klasik")},
+            {"text": "Absurdle", "viewclass": "OneLineListItem",
+             "on_release": lambda: self.set_game_mode("absurdle", "Absurdle")},
+        ]
+        self.game_mode_menu = MDDropdownMenu(caller=button, items=menu_items, width_mult=4)
+        self.game_mode_menu.open()
+        
     def show_theme_menu(self, button):
         app = App.get_running_app()
         themes = app.theme_manager.get_theme_display_names()
@@ -514,6 +587,14 @@ class MenuScreen(Screen):
             self.word_length_menu.dismiss()
         app.save_settings()
         
+    def set_game_mode(self, mode, mode_name):
+        app = App.get_running_app()
+        app.settings['game_mode'] = mode
+        self.game_mode_btn.text = f"Mod: {mode_name}"
+        if self.game_mode_menu:
+            self.game_mode_menu.dismiss()
+        app.save_settings()
+        
     def set_theme(self, theme_name, display_name):
         app = App.get_running_app()
         app.settings['color_theme'] = theme_name
@@ -537,7 +618,7 @@ class MenuScreen(Screen):
         app.root.current = 'game'
         
     def show_statistics(self, button):
-        App.get_running_app().root.current = 'statistics'
+        App.get_running_app().show_statistics_screen()
 
 
 class GameScreen(Screen):
@@ -595,6 +676,7 @@ class GameScreen(Screen):
         word_length = app.settings['word_length']
         max_attempts = word_length
         language = app.settings['language']
+        mode = app.settings.get('game_mode', 'classic')
         
         # Zamanlayıcı
         self.start_time = time.time()
@@ -603,15 +685,16 @@ class GameScreen(Screen):
         self.timer_event = Clock.schedule_interval(self.update_timer, 1.0)
         
         # Kelime seç
-        word_manager = WordManager()
-        secret_word = word_manager.get_random_word(word_length, language)
+        word_manager = App.get_running_app().word_manager
+        # hashed kipte gizli kelime burada çözülmez, yalnızca oyun sonunda gösterilir
+        new_game = word_manager.new_game(word_length, language, max_attempts, mode=mode)
         
-        if not secret_word:
+        if new_game is None:
             self.show_error_dialog("Kelime listesi yüklenemedi!")
             return
             
         # Oyun mantığı
-        self.game_logic = GameLogic(secret_word, max_attempts)
+        self.game_logic, self.word_id = new_game
         self.current_guess = ""
         
         # Grid ve klavye
@@ -694,9 +777,9 @@ class GameScreen(Screen):
                         text='GİR',
                         font_size=sp(14),
                         size_hint=(None, None),
-                        size=(dp(50), dp(50)),
-                        md_bg_color=get_color_from_hex('#6aaa64')
+                        size=(dp(50), dp(50))
                     )
+                    App.get_running_app().theme_manager.bind_color(btn, 'md_bg_color', 'correct')
                     btn.bind(on_release=lambda x: self.on_enter())
                 elif key == '⌫':
                     btn = MDRaisedButton(
@@ -897,12 +980,14 @@ class GameScreen(Screen):
         # İstatistik kaydet
         app = App.get_running_app()
         if self.start_time and self.game_logic:
-            total_time = int(time.time() - self.start_time)
+            total_time = time.time() - self.start_time
             app.statistics.record_game(
                 won=self.game_logic.is_won(),
                 attempts=self.game_logic.current_attempt,
                 word_length=app.settings['word_length'],
-                language=app.settings['language']
+                language=app.settings['language'],
+                duration=total_time,
+                word_id=getattr(self, 'word_id', -1)
             )
         
         self.show_game_over_dialog()
@@ -922,7 +1007,7 @@ class GameScreen(Screen):
                 app.sound_manager.play_win_sound()
         else:
             title = "😢 Oyun Bitti"
-            text = f"Doğru kelime: {self.game_logic.secret_word}"
+            text = f"Doğru kelime: {self.game_logic.reveal_secret()}"
             if self.start_time:
                 elapsed = int(time.time() - self.start_time)
                 text += f"\nSüre: {elapsed} saniye"
@@ -930,14 +1015,16 @@ class GameScreen(Screen):
             if app.sound_manager and app.sound_manager.enabled:
                 app.sound_manager.play_lose_sound()
         
+        replay_btn = MDRaisedButton(
+            text="TEKRAR OYNA",
+            on_release=lambda x: self.restart_game(dialog)
+        )
+        app.theme_manager.bind_color(replay_btn, 'md_bg_color', 'correct')
         dialog = MDDialog(
             title=title,
             text=text,
             buttons=[
-                MDRaisedButton(
-                    text="TEKRAR OYNA",
-                    on_release=lambda x: self.restart_game(dialog)
-                ),
+                replay_btn,
                 MDFlatButton(
                     text="İSTATİSTİKLER",
                     on_release=lambda x: self.show_stats(dialog)
@@ -956,7 +1043,7 @@ class GameScreen(Screen):
         
     def show_stats(self, dialog):
         dialog.dismiss()
-        App.get_running_app().root.current = 'statistics'
+        App.get_running_app().show_statistics_screen()
         
     def go_to_menu(self, dialog):
         dialog.dismiss()
@@ -1024,34 +1111,99 @@ class WordleApp(MDApp):
     
     def __init__(self, **kwargs):
         super().__init__(**kwargs)
-        self.settings = self.load_settings()
-        self.statistics = Statistics()
-        self.sound_manager = SoundManager(enabled=self.settings.get('sound_enabled', True))
-        self.theme_manager = ThemeManager()
-        self.theme_manager.set_current_theme(self.settings.get('color_theme', 'classic'))
+        with STARTUP.measure('settings'):
+            self.settings = self.load_settings()
+        # İstatistikler ve kelime listeleri ilk erişimde yüklenir
+        self._statistics = None
+        self._word_manager = None
+        with STARTUP.measure('sound_manager'):
+            self.sound_manager = SoundManager(enabled=self.settings.get('sound_enabled', True))
+        with STARTUP.measure('theme_manager'):
+            self.theme_manager = ThemeManager()
+            self.theme_manager.set_current_theme(self.settings.get('color_theme', 'classic'))
+            self.theme_manager.set_dark_mode(self.settings.get('theme', 'Light') == 'Dark')
+            
+    @property
+    def statistics(self):
+        """İstatistik deposu (menüyü göstermek için gerekmediğinden ilk erişimde açılır)"""
+        if self._statistics is None:
+            with STARTUP.measure('statistics'):
+                from statistics import open_statistics
+                self._statistics = open_statistics(self.settings.get('stats_backend', 'json'))
+        return self._statistics
+        
+    @property
+    def word_manager(self):
+        """
+        Oyunlar arasında paylaşılan kelime yöneticisi
+        
+        Kaynaklar ayarlardaki 'word_sources' listesinden seçilir (ör.
+        ["bundle", "text"]); yoksa en hızlı kullanılabilir kaynak kullanılır.
+        'hashed_answers' açıksa listeler bellekte düz metin tutulmaz.
+        """
+        if self._word_manager is None:
+            self._word_manager = WordManager(self.settings.get('word_sources'),
+                                             hashed=self.settings.get('hashed_answers', False))
+        return self._word_manager
         
     def build(self):
         """Uygulamayı oluştur"""
         self.theme_cls.theme_style = self.settings.get('theme', 'Light')
         self.theme_cls.primary_palette = "Green"
         
-        # Ekran yöneticisi
+        # Ekran yöneticisi; istatistik ekranı ilk açılışta oluşturulur
         sm = ScreenManager(transition=FadeTransition())
-        sm.add_widget(MenuScreen())
-        sm.add_widget(GameScreen())
-        sm.add_widget(StatisticsScreen())
+        with STARTUP.measure('menu_screen'):
+            sm.add_widget(MenuScreen())
+        with STARTUP.measure('game_screen'):
+            sm.add_widget(GameScreen())
         
         return sm
         
+    def show_statistics_screen(self):
+        """İstatistik ekranını (gerekirse oluşturup) göster"""
+        if not self.root.has_screen('statistics'):
+            with STARTUP.measure('statistics_screen'):
+                self.root.add_widget(StatisticsScreen())
+        self.root.current = 'statistics'
+        
+    def on_start(self):
+        """İsteğe bağlı yerel metrik uç noktasını başlat, açılış süresini kaydet"""
+        STARTUP.record('first_frame', STARTUP.origin, time.perf_counter() - STARTUP.origin)
+        if self.settings.get('startup_timeline'):
+            print(STARTUP.report())
+            
+        metrics_port = self.settings.get('metrics_port')
+        if metrics_port:
+            # Hatalı ayar veya dolu port uygulamanın açılmasını engellememeli
+            try:
+                REGISTRY.start_http_server(int(metrics_port))
+            except (TypeError, ValueError, OSError) as e:
+                print(f"Metrik uç noktası başlatılamadı ({metrics_port}): {e}")
+            
+    def on_pause(self):
+        """Uygulama arka plana alınırken bekleyen istatistikleri yaz"""
+        if self._statistics is not None:
+            self._statistics.flush()
+        return True
+        
+    def on_stop(self):
+        """Kapanışta istatistikleri ve metrikleri yaz"""
+        if self._statistics is not None:
+            self._statistics.close()
+        REGISTRY.write_to_file('game_metrics.prom')
+        
     def load_settings(self):
         """Ayarları yükle"""
         default_settings = {
             'theme': 'Light',
             'language': 'tr',
             'word_length': 5,
+            'game_mode': 'classic',
             'sound_enabled': True,
             'color_theme': 'classic',
-            'first_game': True
+            'first_game': True,
+            'stats_backend': 'json'
         }
         
         try:
@@ -0,0 +1,433 @@
+"""
+Metrik Kayıt Modülü
+Sayaç, gösterge ve gecikme histogramlarını tutar ve Prometheus metin
+biçiminde dışa verir
+
+Kivy içe aktarılmaz; hem uygulama hem de başsız süreçler (sunucu, bot,
+toplu işler) aynı varsayılan REGISTRY üzerinden aynı metrikleri yayınlar.
+"""
+
+import os
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Dict, Iterable, List, Optional, Tuple
+
+
+# Saniye cinsinden varsayılan gecikme kovaları
+DEFAULT_BUCKETS = (
+    0.00001, 0.00005, 0.0001, 0.0005, 0.001, 0.005,
+    0.01, 0.05, 0.1, 0.5, 1.0, 5.0
+)
+
+
+def _escape(value: str) -> str:
+    """Etiket değerini Prometheus biçimine göre kaçışla"""
+    return str(value).replace('\\', '\\\\').replace('\n', '\\n').replace('"', '\\"')
+
+
+def _format_labels(names: Tuple[str, ...], values: Tuple[str, ...],
+                   extra: Optional[Tuple[str, str]] = None) -> str:
+    """Etiketleri {a="1",b="2"} biçiminde yaz"""
+    pairs = [f'{name}="{_escape(value)}"' for name, value in zip(names, values)]
+    if extra:
+        pairs.append(f'{extra[0]}="{extra[1]}"')
+    return '{' + ','.join(pairs) + '}' if pairs else ''
+
+
+def _format_value(value: float) -> str:
+    """Sayıyı Prometheus biçiminde yaz"""
+    if value == float('inf'):
+        return '+Inf'
+    if float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+class _Metric:
+    """Etiketli metriklerin ortak temeli"""
+
+    kind = 'untyped'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = ()):
+        """
+        Metrik oluştur
+
+        Args:
+            name: Metrik adı (ör. wordle_games_total)
+            documentation: HELP satırındaki açıklama
+            labelnames: Etiket adları
+        """
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+        self._values: Dict[Tuple[str, ...], object] = {}
+
+    def _key(self, labels: Dict[str, object]) -> Tuple[str, ...]:
+        """Etiket değerlerini sıralı anahtara çevir"""
+        if set(labels) != set(self.labelnames):
+            raise ValueError(f"{self.name} etiketleri {self.labelnames} olmalı")
+        return tuple(str(labels[name]) for name in self.labelnames)
+
+    def render(self) -> List[str]:
+        """Prometheus satırlarını döndür"""
+        lines = [
+            f"# HELP {self.name} {self.documentation}",
+            f"# TYPE {self.name} {self.kind}"
+        ]
+        with self._lock:
+            items = list(self._values.items())
+        for key, value in items:
+            lines.extend(self._render_value(key, value))
+        return lines
+
+    def _render_value(self, key: Tuple[str, ...], value) -> List[str]:
+        return [f"{self.name}{_format_labels(self.labelnames, key)} {_format_value(value)}"]
+
+
+class Counter(_Metric):
+    """Yalnızca artan sayaç"""
+
+    kind = 'counter'
+
+    def inc(self, amount: float = 1, **labels):
+        """
+        Sayacı artır
+
+        Args:
+            amount: Artış miktarı (negatif olamaz)
+            **labels: Etiket değerleri
+        """
+        if amount < 0:
+            raise ValueError("Sayaç azaltılamaz")
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def get(self, **labels) -> float:
+        """Mevcut değeri döndür"""
+        return self._values.get(self._key(labels), 0)
+
+
+class Gauge(_Metric):
+    """Artıp azalabilen gösterge"""
+
+    kind = 'gauge'
+
+    def set(self, value: float, **labels):
+        """
+        Değeri ata
+
+        Args:
+            value: Yeni değer
+            **labels: Etiket değerleri
+        """
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = value
+
+    def inc(self, amount: float = 1, **labels):
+        """Değeri artır"""
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def dec(self, amount: float = 1, **labels):
+        """Değeri azalt"""
+        self.inc(-amount, **labels)
+
+    def get(self, **labels) -> float:
+        """Mevcut değeri döndür"""
+        return self._values.get(self._key(labels), 0)
+
+
+class Histogram(_Metric):
+    """Kovalı gecikme histogramı"""
+
+    kind = 'histogram'
+
+    def __init__(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                 buckets: Iterable[float] = DEFAULT_BUCKETS):
+        """
+        Histogram oluştur
+
+        Args:
+            name: Metrik adı
+            documentation: Açıklama
+            labelnames: Etiket adları
+            buckets: Artan sırada üst sınırlar (+Inf otomatik eklenir)
+        """
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets)) + (float('inf'),)
+
+    def observe(self, value: float, **labels):
+        """
+        Gözlem ekle
+
+        Args:
+            value: Ölçülen değer (saniye)
+            **labels: Etiket değerleri
+        """
+        key = self._key(labels)
+        with self._lock:
+            state = self._values.get(key)
+            if state is None:
+                # [kova_sayıları..., toplam, adet]
+                state = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if value <= bound:
+                    state[i] += 1
+                    break
+            state[-2] += value
+            state[-1] += 1
+
+    def time(self, **labels) -> '_Timer':
+        """
+        Süre ölçen bağlam yöneticisi döndür
+
+        Örnek:
+            with histogram.time():
+                iş_yap()
+        """
+        return _Timer(self, labels)
+
+    def get_count(self, **labels) -> int:
+        """Gözlem sayısını döndür"""
+        state = self._values.get(self._key(labels))
+        return state[-1] if state else 0
+
+    def _render_value(self, key: Tuple[str, ...], state) -> List[str]:
+        lines = []
+        cumulative = 0
+        for i, bound in enumerate(self.buckets):
+            cumulative += state[i]
+            labels = _format_labels(self.labelnames, key, ('le', _format_value(bound)))
+            lines.append(f"{self.name}_bucket{labels} {cumulative}")
+        labels = _format_labels(self.labelnames, key)
+        lines.append(f"{self.name}_sum{labels} {_format_value(state[-2])}")
+        lines.append(f"{self.name}_count{labels} {state[-1]}")
+        return lines
+
+
+class _Timer:
+    """Histogram.time() bağlam yöneticisi"""
+
+    def __init__(self, histogram: Histogram, labels: Dict[str, object]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.histogram.observe(time.perf_counter() - self.start, **self.labels)
+        return False
+
+
+class MetricsRegistry:
+    """Metrikleri adlarıyla tutan kayıt"""
+
+    def __init__(self):
+        """Boş kayıt oluştur"""
+        self._metrics: Dict[str, _Metric] = {}
+        self._lock = threading.Lock()
+        self._http_server: Optional[ThreadingHTTPServer] = None
+
+    def _get_or_create(self, cls, name: str, documentation: str, labelnames, **kwargs):
+        """Aynı adla kayıtlı metrik varsa onu döndür"""
+        with self._lock:
+            metric = self._metrics.get(name)
+            if metric is None:
+                metric = self._metrics[name] = cls(name, documentation, labelnames, **kwargs)
+            elif not isinstance(metric, cls):
+                raise ValueError(f"{name} farklı türde kayıtlı")
+            return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Counter:
+        """Sayaç al veya oluştur"""
+        return self._get_or_create(Counter, name, documentation, labelnames)
+
+    def gauge(self, name: str, documentation: str, labelnames: Iterable[str] = ()) -> Gauge:
+        """Gösterge al veya oluştur"""
+        return self._get_or_create(Gauge, name, documentation, labelnames)
+
+    def histogram(self, name: str, documentation: str, labelnames: Iterable[str] = (),
+                  buckets: Iterable[float] = DEFAULT_BUCKETS) -> Histogram:
+        """Histogram al veya oluştur"""
+        return self._get_or_create(Histogram, name, documentation, labelnames, buckets=buckets)
+
+    def render(self) -> str:
+        """
+        Tüm metrikleri Prometheus metin biçiminde döndür
+
+        Returns:
+            text/plain; version=0.0.4 içeriği
+        """
+        with self._lock:
+            metrics = sorted(self._metrics.values(), key=lambda m: m.name)
+        lines = []
+        for metric in metrics:
+            lines.extend(metric.render())
+        return '\n'.join(lines) + '\n'
+
+    def write_to_file(self, filename: str):
+        """
+        Metrikleri dosyaya yaz (node_exporter textfile toplayıcısı için)
+
+        Args:
+            filename: Hedef dosya (.prom)
+        """
+        tmp_path = f"{filename}.tmp"
+        try:
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(self.render())
+            os.replace(tmp_path, filename)
+        except Exception as e:
+            print(f"Metrikler yazılamadı: {e}")
+
+    def start_http_server(self, port: int = 9464, host: str = '127.0.0.1') -> int:
+        """
+        /metrics uç noktasını arka plan iş parçacığında sun
+
+        Args:
+            port: Dinlenecek port (0 ise işletim sistemi seçer)
+            host: Dinlenecek adres (varsayılan yalnızca yerel)
+
+        Returns:
+            Dinlenen port
+        """
+        if self._http_server is not None:
+            return self._http_server.server_address[1]
+
+        registry = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path.split('?', 1)[0] != '/metrics':
+                    self.send_error(404)
+                    return
+                body = registry.render().encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'text/plain; version=0.0.4; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format, *args):
+                pass
+
+        self._http_server = ThreadingHTTPServer((host, port), Handler)
+        thread = threading.Thread(target=self._http_server.serve_forever, daemon=True)
+        thread.start()
+        return self._http_server.server_address[1]
+
+    def stop_http_server(self):
+        """HTTP uç noktasını durdur"""
+        if self._http_server is not None:
+            self._http_server.shutdown()
+            self._http_server.server_close()
+            self._http_server = None
+
+
+class StartupTimeline:
+    """
+    Açılış sırasında her bileşenin ne zaman başlayıp ne kadar sürdüğünü tutar
+
+    Örnek:
+        with STARTUP.measure('statistics'):
+            stats = Statistics()
+    """
+
+    def __init__(self, registry: Optional[MetricsRegistry] = None):
+        """
+        Zaman çizelgesini başlat (sıfır noktası oluşturulma anıdır)
+
+        Args:
+            registry: Sürelerin gösterge olarak yayınlanacağı kayıt
+        """
+        self.origin = time.perf_counter()
+        self.events: List[Tuple[str, float, float]] = []
+        self._gauge = registry.gauge(
+            'wordle_startup_component_seconds', 'Açılışta bileşen başına harcanan süre',
+            ('component',)
+        ) if registry else None
+
+    def measure(self, component: str) -> '_TimelineSpan':
+        """Bileşenin süresini ölçen bağlam yöneticisi döndür"""
+        return _TimelineSpan(self, component)
+
+    def record(self, component: str, start: float, duration: float):
+        """
+        Ölçümü ekle
+
+        Args:
+            component: Bileşen adı
+            start: perf_counter başlangıç değeri
+            duration: Süre (saniye)
+        """
+        self.events.append((component, start - self.origin, duration))
+        if self._gauge is not None:
+            self._gauge.inc(duration, component=component)
+
+    def report(self) -> str:
+        """
+        Zaman çizelgesini metin olarak döndür
+
+        Returns:
+            Her satırda başlangıç, süre ve bileşen adı
+        """
+        lines = [f"{'başlangıç':>10} {'süre':>9}  bileşen"]
+        for component, offset, duration in self.events:
+            lines.append(f"{offset * 1000:>8.1f}ms {duration * 1000:>7.1f}ms  {component}")
+        return '\n'.join(lines)
+
+
+class _TimelineSpan:
+    """StartupTimeline.measure() bağlam yöneticisi"""
+
+    def __init__(self, timeline: StartupTimeline, component: str):
+        self.timeline = timeline
+        self.component = component
+
+    def __enter__(self):
+        self.start = time.perf_counter()
+        return self
+
+    def __exit__(self, *exc):
+        self.timeline.record(self.component, self.start, time.perf_counter() - self.start)
+        return False
+
+
+# Uygulama genelinde paylaşılan varsayılan kayıt
+REGISTRY = MetricsRegistry()
+
+# Uygulama açılış zaman çizelgesi (sıfır noktası bu modülün yüklenmesi)
+STARTUP = StartupTimeline(REGISTRY)
+
+GUESS_EVALUATION_SECONDS = REGISTRY.histogram(
+    'wordle_guess_evaluation_seconds', 'Tek bir tahminin değerlendirilme süresi'
+)
+WORD_LOAD_SECONDS = REGISTRY.histogram(
+    'wordle_word_load_seconds', 'Kelime listesinin diskten yüklenme süresi',
+    ('language', 'length')
+)
+GAMES_TOTAL = REGISTRY.counter(
+    'wordle_games_total', 'Biten oyun sayısı', ('language', 'result')
+)
+STATS_SAVE_SECONDS = REGISTRY.histogram(
+    'wordle_stats_save_seconds', 'İstatistik dosyasının kaydedilme süresi'
+)
+
+
+# Test fonksiyonu
+if __name__ == '__main__':
+    """Modül testleri"""
+    print("=== Metrik Kaydı Test ===\n")
+
+    GAMES_TOTAL.inc(language='tr', result='won')
+    with GUESS_EVALUATION_SECONDS.time():
+        sum(range(1000))
+
+    print(REGISTRY.render())
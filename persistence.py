@@ -0,0 +1,342 @@
+"""
+Kalıcılık Yardımcıları Modülü
+Atomik dosya yazma, gecikmeli (write-behind) kaydetme ve süreçler arası
+dosya kilidi
+
+Dosyalar aynı dizinde geçici bir dosyaya yazılır, fsync ile diske
+indirilir ve os.replace ile tek adımda yerine konur. Yazma sırasında
+çökme olursa eski dosya bozulmadan kalır.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Callable, Dict, Optional
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+
+def atomic_write_bytes(path: str, data: bytes, fsync: bool = True):
+    """
+    Baytları dosyaya atomik olarak yaz
+
+    Args:
+        path: Hedef dosya
+        data: Yazılacak içerik
+        fsync: Yeniden adlandırmadan önce diske indirilsin mi
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(
+        dir=directory, prefix=f".{os.path.basename(path)}.", suffix='.tmp'
+    )
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            if fsync:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    if fsync and hasattr(os, 'O_DIRECTORY'):
+        # Yeniden adlandırmanın kendisini de kalıcı yap (POSIX)
+        try:
+            dir_fd = os.open(directory, os.O_RDONLY | os.O_DIRECTORY)
+            try:
+                os.fsync(dir_fd)
+            finally:
+                os.close(dir_fd)
+        except OSError:
+            pass
+
+
+def atomic_write_json(path: str, data: Any, fsync: bool = True):
+    """
+    Veriyi kompakt JSON olarak atomik yaz
+
+    Args:
+        path: Hedef dosya
+        data: JSON'a çevrilebilir veri
+        fsync: Yeniden adlandırmadan önce diske indirilsin mi
+    """
+    payload = json.dumps(data, ensure_ascii=False, separators=(',', ':'))
+    atomic_write_bytes(path, payload.encode('utf-8'), fsync)
+
+
+def _lock_fd(fd: int):
+    """Dosya tanıtıcısı üzerinde bekleyerek özel kilit al"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_EX)
+    else:
+        msvcrt.locking(fd, msvcrt.LK_LOCK, 1)
+
+
+def _unlock_fd(fd: int):
+    """Dosya tanıtıcısındaki kilidi bırak"""
+    if fcntl is not None:
+        fcntl.flock(fd, fcntl.LOCK_UN)
+    else:
+        os.lseek(fd, 0, os.SEEK_SET)
+        msvcrt.locking(fd, msvcrt.LK_UNLCK, 1)
+
+
+class FileLock:
+    """
+    Süreçler arası özel dosya kilidi (POSIX flock / Windows msvcrt)
+
+    Aynı süreç içinde yeniden girilebilir; iç içe with blokları kilidi
+    yalnızca en dıştaki blok bitince bırakır. Kilit dosyası oluşturulamazsa
+    (ör. dizin yok) yalnızca süreç içi kilit uygulanır; o durumda korunan
+    dosyalar da zaten yazılamaz.
+    """
+
+    def __init__(self, path: str):
+        """
+        Kilidi hazırla (dosya ilk kilitlemede oluşturulur)
+
+        Args:
+            path: Kilit dosyasının yolu
+        """
+        self.path = path
+        self._thread_lock = threading.RLock()
+        self._depth = 0
+        self._fd: Optional[int] = None
+
+    def acquire(self):
+        """Kilidi al (gerekirse bekle)"""
+        self._thread_lock.acquire()
+        if self._depth == 0:
+            try:
+                fd = os.open(self.path, os.O_RDWR | os.O_CREAT, 0o644)
+            except FileNotFoundError:
+                fd = None
+            if fd is not None:
+                try:
+                    _lock_fd(fd)
+                except BaseException:
+                    os.close(fd)
+                    self._thread_lock.release()
+                    raise
+            self._fd = fd
+        self._depth += 1
+
+    def release(self):
+        """Kilidi bırak"""
+        self._depth -= 1
+        if self._depth == 0:
+            fd, self._fd = self._fd, None
+            if fd is not None:
+                try:
+                    _unlock_fd(fd)
+                finally:
+                    os.close(fd)
+        self._thread_lock.release()
+
+    def __enter__(self):
+        self.acquire()
+        return self
+
+    def __exit__(self, *exc):
+        self.release()
+        return False
+
+
+class WriteBehind:
+    """
+    Kirli bayrakla birleştirilen, arka plan iş parçacığında yapılan yazma
+
+    mark_dirty() çağrıları delay saniye içinde tek bir yazmada birleştirilir;
+    delay 0 ise yazma hemen çağıran iş parçacığında yapılır. flush() bekleyen
+    yazmayı çağıran iş parçacığında hemen yapar.
+
+    scheduler verilirse yazıcı kendi zamanlayıcı iş parçacığını açmaz;
+    gecikmeli yazma paylaşılan FlushScheduler iş parçacığında yapılır.
+    """
+
+    def __init__(self, write: Callable[[], None], delay: float = 2.0,
+                 scheduler: Optional['FlushScheduler'] = None):
+        """
+        Gecikmeli yazıcıyı başlat
+
+        Args:
+            write: Asıl yazmayı yapan fonksiyon (hata fırlatabilir)
+            delay: İlk değişiklikten sonra yazmadan önce beklenecek süre (0 ise hemen)
+            scheduler: Paylaşılan yazma zamanlayıcısı (gecikmesi scheduler.delay)
+        """
+        self._write = write
+        self.delay = delay
+        self._scheduler = scheduler
+        self._lock = threading.Lock()
+        self._write_lock = threading.Lock()
+        self._timer: Optional[threading.Timer] = None
+        self._dirty = False
+        self.writes = 0
+        self.failures = 0
+        self.coalesced = 0
+
+    def mark_dirty(self):
+        """Yazma gerektiğini işaretle ve zamanlayıcıyı kur"""
+        with self._lock:
+            if self._dirty:
+                self.coalesced += 1
+            self._dirty = True
+            immediate = self.delay <= 0
+            if not immediate and self._scheduler is not None:
+                self._scheduler.schedule(self)
+            elif not immediate and self._timer is None:
+                self._timer = threading.Timer(self.delay, self._on_timer)
+                self._timer.daemon = True
+                self._timer.start()
+
+        if immediate:
+            self.flush()
+
+    def _on_timer(self):
+        """Zamanlayıcı iş parçacığında bekleyen yazmayı yap"""
+        with self._lock:
+            self._timer = None
+        self.flush()
+
+    def flush(self) -> bool:
+        """
+        Bekleyen yazmayı hemen yap
+
+        Returns:
+            Yazma başarılıysa (veya yazılacak bir şey yoksa) True
+        """
+        with self._write_lock:
+            with self._lock:
+                if not self._dirty:
+                    return True
+                self._dirty = False
+
+            try:
+                self._write()
+                self.writes += 1
+                return True
+            except Exception as e:
+                self.failures += 1
+                # Bir sonraki flush tekrar denesin
+                with self._lock:
+                    self._dirty = True
+                print(f"Gecikmeli yazma başarısız: {e}")
+                return False
+
+    def close(self):
+        """Zamanlayıcıyı iptal et ve bekleyen yazmayı tamamla"""
+        with self._lock:
+            timer, self._timer = self._timer, None
+        if timer is not None:
+            timer.cancel()
+        if self._scheduler is not None:
+            self._scheduler.cancel(self)
+        self.flush()
+
+    @property
+    def dirty(self) -> bool:
+        """Yazılmamış değişiklik var mı?"""
+        return self._dirty
+
+    def get_stats(self) -> Dict[str, int]:
+        """
+        Yazma sayaçlarını döndür
+
+        Returns:
+            {writes, failures, coalesced} dictionary'si
+        """
+        return {'writes': self.writes, 'failures': self.failures, 'coalesced': self.coalesced}
+
+
+class FlushScheduler:
+    """
+    Birçok WriteBehind'in gecikmeli yazmalarını tek iş parçacığında yapan zamanlayıcı
+
+    Yazıcı başına bir threading.Timer yerine bekleyen yazıcılar ilk
+    kirlenme sırasıyla tutulur; gecikme herkes için aynı olduğundan sıra
+    aynı zamanda yazma sırasıdır. İş parçacığı ilk kullanımda başlar.
+    """
+
+    def __init__(self, delay: float = 2.0):
+        """
+        Zamanlayıcıyı başlat
+
+        Args:
+            delay: İlk değişiklikten sonra yazmadan önce beklenecek süre (saniye)
+        """
+        self.delay = delay
+        self._condition = threading.Condition()
+        # WriteBehind -> yazma zamanı; sıra = yazma sırası
+        self._pending: 'OrderedDict[WriteBehind, float]' = OrderedDict()
+        self._thread: Optional[threading.Thread] = None
+        self._closed = False
+
+    def schedule(self, writer: WriteBehind):
+        """
+        Yazıcıyı delay saniye sonra yazılmak üzere sıraya koy
+
+        Args:
+            writer: Kirli yazıcı (zaten sıradaysa zamanı değişmez)
+        """
+        with self._condition:
+            if writer in self._pending:
+                return
+            self._pending[writer] = time.monotonic() + self.delay
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name='flush-scheduler',
+                                                daemon=True)
+                self._thread.start()
+            self._condition.notify()
+
+    def cancel(self, writer: WriteBehind):
+        """Yazıcıyı sıradan çıkar (yazıcı kapanırken kendisi yazar)"""
+        with self._condition:
+            self._pending.pop(writer, None)
+
+    def _run(self):
+        """Zamanı gelen yazıcıları sırayla yaz"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if self._closed:
+                    return
+                writer, due = next(iter(self._pending.items()))
+                remaining = due - time.monotonic()
+                if remaining > 0:
+                    self._condition.wait(remaining)
+                    continue
+                del self._pending[writer]
+            writer.flush()
+
+    def __len__(self) -> int:
+        with self._condition:
+            return len(self._pending)
+
+    def close(self):
+        """
+        İş parçacığını durdur ve sıradaki tüm yazıcıları hemen yaz
+
+        Sonraki schedule() çağrıları iş parçacığını yeniden başlatır.
+        """
+        with self._condition:
+            self._closed = True
+            thread, self._thread = self._thread, None
+            writers = list(self._pending)
+            self._pending.clear()
+            self._condition.notify()
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            self._closed = False
+        for writer in writers:
+            writer.flush()
@@ -0,0 +1,232 @@
+"""
+Oyuncu Profilleri Modülü
+Oyuncu başına istatistikleri parçalı (sharded) dizin düzeninde tutar
+
+Her profilin dosyaları oyuncu kimliğinin özetinden türetilen iki seviyeli
+bir alt dizinde durur (ör. profiles/3f/a9/oyuncu42.json); böylece tek bir
+dizinde yüz binlerce dosya birikmez. Profiller yalnızca erişildiğinde
+yüklenir ve bellekte en fazla capacity kadar sıcak profil (LRU) tutulur;
+çıkarılan profilin bekleyen değişiklikleri diske yazılır.
+
+Sıcak profiller dosya tanıtıcısı tutmaz (geçmiş günlüğü her eklemede
+açılıp kapatılır) ve kendi zamanlayıcı iş parçacığını açmaz; bekleyen
+yazmalar deponun tek bir FlushScheduler iş parçacığında yapılır.
+"""
+
+import hashlib
+import os
+import re
+import threading
+from collections import OrderedDict
+from typing import Dict, Iterator, Optional
+
+from leaderboard import LeaderboardSet
+from persistence import FlushScheduler
+from statistics import Statistics
+
+
+# Dosya adı olarak güvenle kullanılabilecek oyuncu kimlikleri
+PLAYER_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+DEFAULT_CAPACITY = 256
+
+
+class ProfileStore:
+    """Oyuncu kimliğine göre tembel yüklenen, LRU ile sınırlı istatistik deposu"""
+
+    def __init__(self, root_dir: str = 'profiles', capacity: int = DEFAULT_CAPACITY,
+                 flush_delay: Optional[float] = 2.0,
+                 leaderboards: Optional[LeaderboardSet] = None):
+        """
+        Profil deposunu başlat
+
+        Args:
+            root_dir: Profil dizinlerinin kökü
+            capacity: Bellekte tutulacak en fazla profil sayısı
+            flush_delay: Her profilin Statistics yazma gecikmesi (saniye)
+            leaderboards: Kaydedilen oyunların iletileceği liderlik tabloları
+        """
+        self.root_dir = root_dir
+        self.capacity = capacity
+        self.flush_delay = flush_delay
+        self.leaderboards = leaderboards
+        self._lock = threading.Lock()
+        # Tüm kirli profiller için tek yazma iş parçacığı
+        self._flusher = FlushScheduler(flush_delay) if flush_delay else None
+        self._profiles: 'OrderedDict[str, Statistics]' = OrderedDict()
+        self._metrics = {
+            'hits': 0,
+            'loads': 0,
+            'evictions': 0
+        }
+
+    def profile_path(self, player_id: str) -> str:
+        """
+        Profilin istatistik dosyasının yolunu döndür
+
+        Args:
+            player_id: Oyuncu kimliği
+
+        Returns:
+            <root>/<özet[0:2]>/<özet[2:4]>/<player_id>.json
+        """
+        if not PLAYER_ID_PATTERN.match(player_id):
+            raise ValueError(f"Geçersiz oyuncu kimliği: {player_id!r}")
+        digest = hashlib.sha1(player_id.encode('utf-8')).hexdigest()
+        return os.path.join(self.root_dir, digest[:2], digest[2:4], f"{player_id}.json")
+
+    def get(self, player_id: str) -> Statistics:
+        """
+        Profili al (bellekte yoksa diskten yükle veya boş oluştur)
+
+        Args:
+            player_id: Oyuncu kimliği
+
+        Returns:
+            Oyuncunun Statistics nesnesi
+        """
+        with self._lock:
+            stats = self._profiles.get(player_id)
+            if stats is not None:
+                self._metrics['hits'] += 1
+                self._profiles.move_to_end(player_id)
+                return stats
+
+        # Yükleme (dosya kilidi, günlük okuma) diğer oyuncuları bekletmesin
+        path = self.profile_path(player_id)
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        # Binlerce profil aynı anda dosya tanıtıcısı tutmasın
+        loaded = Statistics(path, flush_delay=self.flush_delay, history_keep_open=False,
+                            flush_scheduler=self._flusher)
+
+        evicted = []
+        with self._lock:
+            stats = self._profiles.get(player_id)
+            if stats is None:
+                stats, loaded = loaded, None
+                self._metrics['loads'] += 1
+                self._profiles[player_id] = stats
+                while len(self._profiles) > self.capacity:
+                    evicted.append(self._profiles.popitem(last=False)[1])
+                    self._metrics['evictions'] += 1
+            else:
+                # Aynı oyuncuyu eşzamanlı yükleyen başka bir çağıran önce davrandı
+                self._metrics['hits'] += 1
+                self._profiles.move_to_end(player_id)
+
+        # Kapatma (bekleyen yazma) da kilit dışında yapılır. Aynı oyuncu bu
+        # sırada yeniden yüklenirse kayıp olmaz: oyunlar önce günlüğe eklenir
+        # ve her yazıcı yazmadan önce günlüğü toplamlarına katar.
+        if loaded is not None:
+            loaded.close()
+        for old in evicted:
+            old.close()
+        return stats
+
+    def record_game(self, player_id: str, won: bool, attempts: int, word_length: int,
+                    language: str, duration: float = 0.0, word_id: int = -1):
+        """
+        Oyuncunun oyun sonucunu kaydet
+
+        Args:
+            player_id: Oyuncu kimliği
+            won: Oyun kazanıldı mı
+            attempts: Kullanılan tahmin sayısı
+            word_length: Kelime uzunluğu
+            language: Oyun dili
+            duration: Oyun süresi (saniye)
+            word_id: Gizli kelimenin listedeki sırası
+        """
+        self.get(player_id).record_game(won, attempts, word_length, language,
+                                        duration, word_id)
+        if self.leaderboards is not None:
+            self.leaderboards.record_game(player_id, won, attempts, word_length,
+                                          language, duration)
+
+    def exists(self, player_id: str) -> bool:
+        """Profilin bellekte veya diskte olup olmadığını yükleme yapmadan kontrol et"""
+        return player_id in self._profiles or os.path.exists(self.profile_path(player_id))
+
+    def iter_player_ids(self) -> Iterator[str]:
+        """
+        Diskteki tüm oyuncu kimliklerini profilleri yüklemeden dolaş
+
+        Yields:
+            Oyuncu kimlikleri
+        """
+        if not os.path.isdir(self.root_dir):
+            return
+        for first in sorted(os.listdir(self.root_dir)):
+            first_dir = os.path.join(self.root_dir, first)
+            if not os.path.isdir(first_dir):
+                continue
+            for second in sorted(os.listdir(first_dir)):
+                second_dir = os.path.join(first_dir, second)
+                if not os.path.isdir(second_dir):
+                    continue
+                for name in sorted(os.listdir(second_dir)):
+                    if name.endswith('.json'):
+                        yield name[:-5]
+
+    def flush(self):
+        """Bellekteki tüm profillerin bekleyen değişikliklerini yaz"""
+        with self._lock:
+            profiles = list(self._profiles.values())
+        for stats in profiles:
+            stats.flush()
+        if self.leaderboards is not None:
+            self.leaderboards.flush()
+
+    def close(self):
+        """Tüm profilleri yazıp bellekten çıkar"""
+        with self._lock:
+            profiles = list(self._profiles.values())
+            self._profiles.clear()
+        for stats in profiles:
+            stats.close()
+        if self._flusher is not None:
+            self._flusher.close()
+        if self.leaderboards is not None:
+            self.leaderboards.close()
+
+    def __len__(self) -> int:
+        return len(self._profiles)
+
+    def __contains__(self, player_id: str) -> bool:
+        return player_id in self._profiles
+
+    def get_metrics(self) -> Dict:
+        """
+        Depo metriklerini döndür
+
+        Returns:
+            Metrik dictionary'si
+        """
+        lookups = self._metrics['hits'] + self._metrics['loads']
+        metrics = dict(self._metrics)
+        metrics['size'] = len(self._profiles)
+        metrics['capacity'] = self.capacity
+        metrics['hit_rate'] = (self._metrics['hits'] / lookups * 100) if lookups else 0.0
+        return metrics
+
+
+# Test fonksiyonu
+if __name__ == '__main__':
+    """Modül testleri: 20 bin oyuncu, 500 sıcak profil"""
+    import random
+    import tempfile
+    import time
+
+    print("=== Profil Deposu Test ===\n")
+    store = ProfileStore(tempfile.mkdtemp(), capacity=500)
+
+    start = time.perf_counter()
+    for i in range(20000):
+        # Oyuncuların %10'u oyunların %90'ını oynar
+        player = random.randrange(200) if random.random() < 0.9 else random.randrange(20000)
+        store.record_game(f"oyuncu{player}", random.random() < 0.7,
+                          random.randint(1, 6), 5, 'tr')
+    elapsed = time.perf_counter() - start
+
+    print(f"20.000 oyun: {elapsed:.2f}s")
+    print(f"Metrikler: {store.get_metrics()}")
+    store.close()
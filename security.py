@@ -5,11 +5,233 @@ Kelime listesi şifreleme ve önbellek optimizasyonu
 
 import base64
 import hashlib
+import hmac
 import json
+import mmap
 import os
-from typing import List, Optional
+import secrets
+import struct
+import sys
+import threading
+import time
+from array import array
+from collections import OrderedDict, defaultdict
+from contextlib import contextmanager
+from typing import Callable, Dict, List, NamedTuple, Optional, Tuple, Union
 from functools import lru_cache
 
+from game_logic import GameLogic
+from persistence import atomic_write_bytes
+from words import BundleSource, EncryptedJSONSource
+
+
+# Toplu şifreli kelime paketi biçimi:
+#   başlık | bölüm tablosu | başlık etiketi | bölüm verileri
+# Her bölüm tek bir (dil, kelime uzunluğu) çiftinin '\n' ile birleştirilmiş
+# UTF-8 kelimeleridir. Tablodaki konumlar sayesinde yalnızca istenen bölüm
+# okunur; bölümler parça başına ayrı anahtar akışıyla şifrelenir ve kendi
+# etiketini taşır.
+BUNDLE_MAGIC = b'WBN1'
+BUNDLE_VERSION = 2
+BUNDLE_NONCE_SIZE = 16
+BUNDLE_TAG_SIZE = 16
+BUNDLE_CHUNK_SIZE = 64 * 1024
+# sihirli sayı, sürüm, nonce, bölüm sayısı
+BUNDLE_HEADER = struct.Struct('<4sB16sH')
+# dil, kelime uzunluğu, kelime sayısı, dosya içi konum, bayt sayısı, bölüm etiketi
+BUNDLE_SECTION = struct.Struct('<2sBIII16s')
+
+# Önbellek anlık görüntüsü: başlık | girdiler; her girdi anahtar, kaynak dosya,
+# kaynağın SHA256 özeti ve '\n' ile birleştirilmiş kelimelerden oluşur
+SNAPSHOT_MAGIC = b'WCS1'
+# sihirli sayı, girdi sayısı
+SNAPSHOT_HEADER = struct.Struct('<4sI')
+# anahtar uzunluğu, kaynak uzunluğu, kaynak özeti, kelime sayısı, veri uzunluğu
+SNAPSHOT_ENTRY = struct.Struct('<HH32sII')
+
+# WordCache varsayılan bellek bütçesi ve kelime hash önbelleği boyutu
+DEFAULT_CACHE_BYTES = 32 * 1024 * 1024
+HASH_CACHE_SIZE = 128
+
+
+class BundleSection(NamedTuple):
+    """Paket bölüm tablosundaki tek kayıt"""
+    language: str
+    length: int
+    count: int
+    offset: int
+    size: int
+    tag: bytes
+
+
+def _keystream(key: bytes, nonce: bytes, length: int) -> bytes:
+    """
+    Anahtar ve nonce'tan istenen uzunlukta anahtar akışı üret (SHAKE-256)
+    
+    Args:
+        key: Şifreleme anahtarı
+        nonce: Tek kullanımlık değer
+        length: Bayt sayısı
+        
+    Returns:
+        Anahtar akışı
+    """
+    return hashlib.shake_256(key + nonce).digest(length)
+
+
+def _xor_bytes(data: bytes, stream: bytes) -> bytes:
+    """
+    İki bayt dizisini tek bir büyük tamsayı işlemiyle XOR'la
+    
+    Args:
+        data: Veri
+        stream: Aynı uzunlukta anahtar akışı
+        
+    Returns:
+        XOR sonucu
+    """
+    length = len(data)
+    if not length:
+        return b''
+    return (
+        int.from_bytes(data, 'big') ^ int.from_bytes(stream[:length], 'big')
+    ).to_bytes(length, 'big')
+
+
+def _word_hash(word: str) -> str:
+    """Kelimenin kısaltılmış SHA256 özeti"""
+    return hashlib.sha256(word.encode('utf-8')).hexdigest()[:16]
+
+
+def keyed_word_hash(word: str, key: bytes) -> int:
+    """
+    Kelimenin anahtarlı 64 bitlik özeti (get_word_hash'in anahtarlı, sayısal hali)
+    
+    Anahtarı bilmeyen biri özetlerden sözlük saldırısıyla kelime bulamaz.
+    0 değeri boş tablo yuvasına ayrıldığından hiçbir zaman döndürülmez.
+    
+    Args:
+        word: Kelime
+        key: En fazla 64 baytlık anahtar
+        
+    Returns:
+        Sıfırdan farklı 64 bitlik tamsayı
+    """
+    digest = hashlib.blake2b(word.encode('utf-8'), digest_size=8, key=key).digest()
+    return int.from_bytes(digest, 'little') or 1
+
+
+def _estimate_size(words: List[str]) -> int:
+    """Kelime listesinin yaklaşık bellek boyutu (liste + kelime nesneleri)"""
+    return sys.getsizeof(words) + sum(map(sys.getsizeof, words))
+
+
+def file_checksum(path: str) -> bytes:
+    """
+    Dosyanın SHA256 özetini hesapla
+    
+    Args:
+        path: Dosya yolu
+        
+    Returns:
+        32 baytlık özet
+    """
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            digest.update(block)
+    return digest.digest()
+
+
+def _write_snapshot(path: str, items: List[Tuple[str, List[str]]],
+                    sources: Dict[str, Tuple[str, bytes]]) -> int:
+    """
+    Önbellek girdilerini anlık görüntü dosyasına atomik olarak yaz
+    
+    Args:
+        path: Anlık görüntü dosyası
+        items: (anahtar, kelimeler) listesi, en eskiden en yeniye
+        sources: {anahtar: (kaynak dosya, kaynak özeti)}; kaynağı bilinmeyen
+            girdiler yazılmaz
+            
+    Returns:
+        Yazılan girdi sayısı
+    """
+    parts = []
+    count = 0
+    for key, words in items:
+        if key not in sources:
+            continue
+        source, checksum = sources[key]
+        raw_key, raw_source = key.encode('utf-8'), source.encode('utf-8')
+        data = '\n'.join(words).encode('utf-8')
+        parts.append(SNAPSHOT_ENTRY.pack(len(raw_key), len(raw_source), checksum,
+                                         len(words), len(data)))
+        parts.extend((raw_key, raw_source, data))
+        count += 1
+        
+    atomic_write_bytes(path, SNAPSHOT_HEADER.pack(SNAPSHOT_MAGIC, count) + b''.join(parts),
+                       fsync=False)
+    return count
+
+
+def _read_snapshot(path: str,
+                   cache_words: Callable[[str, List[str]], None]) -> Dict[str, Tuple[str, bytes]]:
+    """
+    Anlık görüntüdeki güncel girdileri önbelleğe geri yükle
+    
+    Kaynak dosyası değişmiş (özeti tutmayan) veya silinmiş girdiler atlanır.
+    
+    Args:
+        path: Anlık görüntü dosyası
+        cache_words: Geçerli girdilerin ekleneceği fonksiyon
+        
+    Returns:
+        Geri yüklenen {anahtar: (kaynak dosya, kaynak özeti)}
+    """
+    try:
+        with open(path, 'rb') as f:
+            data = f.read()
+    except FileNotFoundError:
+        return {}
+        
+    restored = {}
+    current = {}
+    try:
+        magic, count = SNAPSHOT_HEADER.unpack_from(data, 0)
+        if magic != SNAPSHOT_MAGIC:
+            raise ValueError("Geçersiz anlık görüntü")
+        offset = SNAPSHOT_HEADER.size
+        for _ in range(count):
+            key_size, source_size, checksum, word_count, data_size = \
+                SNAPSHOT_ENTRY.unpack_from(data, offset)
+            offset += SNAPSHOT_ENTRY.size
+            key = data[offset:offset + key_size].decode('utf-8')
+            offset += key_size
+            source = data[offset:offset + source_size].decode('utf-8')
+            offset += source_size
+            raw_words = data[offset:offset + data_size]
+            offset += data_size
+            if len(raw_words) != data_size:
+                raise ValueError("Anlık görüntü eksik")
+                
+            if source not in current:
+                try:
+                    current[source] = file_checksum(source)
+                except OSError:
+                    current[source] = None
+            if current[source] != checksum:
+                continue
+            cache_words(key, raw_words.decode('utf-8').split('\n') if word_count else [])
+            restored[key] = (source, checksum)
+    except Exception as e:
+        print(f"✗ Önbellek anlık görüntüsü okunamadı: {e}")
+    return restored
+
+
+# Kaynak kodda açık duran varsayılan anahtar; yalnızca kelime listesi gizleme içindir
+DEFAULT_KEY = "WORDLE_SECRET_KEY_2024"
+
 
 class WordEncryption:
     """Kelime listesi şifreleme sınıfı"""
@@ -23,8 +245,10 @@ class WordEncryption:
         """
         if key is None:
             # Basit bir anahtar oluştur (gerçek uygulamada daha güvenli olmalı)
-            key = "WORDLE_SECRET_KEY_2024"
+            key = DEFAULT_KEY
         self.key = key.encode('utf-8')
+        self._bundle_enc_key = hashlib.sha256(b'bundle-enc' + self.key).digest()
+        self._bundle_mac_key = hashlib.sha256(b'bundle-mac' + self.key).digest()
         
     def encrypt_word(self, word: str) -> str:
         """
@@ -141,23 +365,468 @@ class WordEncryption:
         except Exception as e:
             print(f"✗ Yükleme hatası: {e}")
             return []
+            
+    def _crypt_section(self, nonce: bytes, section_id: bytes, read, size: int,
+                       encrypting: bool) -> Tuple[bytes, bytes]:
+        """
+        Bölümü parça parça şifrele/çöz ve şifreli metnin etiketini hesapla
+        
+        Her BUNDLE_CHUNK_SIZE'lık parçanın kendi anahtar akışı vardır; böylece
+        aynı anda yalnızca bir parçanın anahtar akışı bellekte tutulur.
+        
+        Args:
+            nonce: Paket nonce'u
+            section_id: Bölüm kimliği (dil + uzunluk)
+            read: Bölüm içi (başlangıç, bitiş) aralığının baytlarını döndüren fonksiyon
+            size: Bölüm bayt sayısı
+            encrypting: Şifreleme mi (etiket şifreli metin üzerinden hesaplanır)
+            
+        Returns:
+            (sonuç baytları, etiket)
+        """
+        mac = hmac.new(self._bundle_mac_key, nonce + section_id, hashlib.sha256)
+        parts = []
+        for index, start in enumerate(range(0, size, BUNDLE_CHUNK_SIZE)):
+            chunk = read(start, min(start + BUNDLE_CHUNK_SIZE, size))
+            result = _xor_bytes(chunk, _keystream(
+                self._bundle_enc_key, nonce + section_id + struct.pack('<I', index), len(chunk)
+            ))
+            mac.update(result if encrypting else chunk)
+            parts.append(result)
+        return b''.join(parts), mac.digest()[:BUNDLE_TAG_SIZE]
+        
+    def encode_bundle(self, words: Union[List[str], Dict[str, List[str]]],
+                      language: str = '') -> bytes:
+        """
+        Kelime listelerini tek parça şifreli pakete çevir
+        
+        Args:
+            words: Kelime listesi veya {dil: kelime listesi} dictionary'si
+            language: words liste ise bölümlerin dil kodu
+            
+        Returns:
+            Paket baytları
+        """
+        word_lists = words if isinstance(words, dict) else {language: words}
+        groups = defaultdict(list)
+        for lang, lang_words in word_lists.items():
+            for word in lang_words:
+                if 0 < len(word) <= 255:
+                    groups[(lang, len(word))].append(word)
+                    
+        nonce = os.urandom(BUNDLE_NONCE_SIZE)
+        header = BUNDLE_HEADER.pack(BUNDLE_MAGIC, BUNDLE_VERSION, nonce, len(groups))
+        offset = len(header) + len(groups) * BUNDLE_SECTION.size + BUNDLE_TAG_SIZE
+        
+        table, sections = [], []
+        for lang, word_length in sorted(groups):
+            section_id = _section_id(lang, word_length)
+            plaintext = '\n'.join(groups[(lang, word_length)]).encode('utf-8')
+            ciphertext, tag = self._crypt_section(
+                nonce, section_id, lambda start, end: plaintext[start:end],
+                len(plaintext), encrypting=True
+            )
+            table.append(BUNDLE_SECTION.pack(
+                section_id[:2], word_length, len(groups[(lang, word_length)]),
+                offset, len(ciphertext), tag
+            ))
+            sections.append(ciphertext)
+            offset += len(ciphertext)
+            
+        head = header + b''.join(table)
+        tag = hmac.new(self._bundle_mac_key, head, hashlib.sha256).digest()[:BUNDLE_TAG_SIZE]
+        return head + tag + b''.join(sections)
+        
+    def read_bundle_table(self, buffer) -> Tuple[bytes, List[BundleSection]]:
+        """
+        Paket başlığını ve bölüm tablosunu doğrulayıp oku
+        
+        Args:
+            buffer: Paket baytları veya mmap (dilimlenebilir)
+            
+        Returns:
+            (nonce, bölüm listesi)
+            
+        Raises:
+            ValueError: Başlık bozuksa veya başka anahtarla üretilmişse
+        """
+        try:
+            magic, version, nonce, section_count = BUNDLE_HEADER.unpack(
+                buffer[:BUNDLE_HEADER.size]
+            )
+        except struct.error:
+            raise ValueError("Geçersiz kelime paketi")
+        if magic != BUNDLE_MAGIC or version != BUNDLE_VERSION:
+            raise ValueError("Geçersiz kelime paketi")
+            
+        table_end = BUNDLE_HEADER.size + section_count * BUNDLE_SECTION.size
+        head = buffer[:table_end]
+        tag = buffer[table_end:table_end + BUNDLE_TAG_SIZE]
+        expected = hmac.new(self._bundle_mac_key, head, hashlib.sha256).digest()
+        if len(tag) != BUNDLE_TAG_SIZE or not hmac.compare_digest(
+                tag, expected[:BUNDLE_TAG_SIZE]):
+            raise ValueError("Kelime paketi imzası doğrulanamadı")
+            
+        sections = [
+            BundleSection(language.decode('ascii').rstrip(), length, count, offset, size, tag)
+            for language, length, count, offset, size, tag
+            in BUNDLE_SECTION.iter_unpack(head[BUNDLE_HEADER.size:])
+        ]
+        return nonce, sections
+        
+    def decrypt_section(self, buffer, nonce: bytes, section: BundleSection) -> List[str]:
+        """
+        Tek bir bölümü yalnızca kendi aralığını okuyarak doğrula ve çöz
+        
+        Args:
+            buffer: Paket baytları veya mmap
+            nonce: Paket nonce'u
+            section: Bölüm tablosu kaydı
+            
+        Returns:
+            Bölümdeki kelimeler
+            
+        Raises:
+            ValueError: Bölüm bozuksa
+        """
+        base = section.offset
+        if len(buffer) < base + section.size:
+            raise ValueError(f"Kelime paketi bölümü eksik: {section.language} {section.length}")
+        plaintext, tag = self._crypt_section(
+            nonce, _section_id(section.language, section.length),
+            lambda start, end: buffer[base + start:base + end],
+            section.size, encrypting=False
+        )
+        if not hmac.compare_digest(tag, section.tag):
+            raise ValueError(f"Kelime paketi bölümü bozuk: {section.language} {section.length}")
+        return plaintext.decode('utf-8').split('\n') if section.count else []
+        
+    def decode_bundle(self, data: bytes, word_length: Optional[int] = None,
+                      language: Optional[str] = None) -> Dict[Tuple[str, int], List[str]]:
+        """
+        Paketi doğrula ve istenen bölümleri çöz
+        
+        İstenmeyen bölümler doğrulanmaz ve çözülmez.
+        
+        Args:
+            data: Paket baytları
+            word_length: Yalnızca bu uzunluk (None ise hepsi)
+            language: Yalnızca bu dil (None ise hepsi)
+            
+        Returns:
+            {(dil, kelime uzunluğu): kelime listesi} dictionary'si
+            
+        Raises:
+            ValueError: Paket bozuk, değiştirilmiş veya başka anahtarla üretilmişse
+        """
+        nonce, sections = self.read_bundle_table(data)
+        return {
+            (section.language, section.length): self.decrypt_section(data, nonce, section)
+            for section in _select_sections(sections, word_length, language)
+        }
+        
+    def save_bundle(self, words: Union[List[str], Dict[str, List[str]]], filename: str,
+                    language: str = ''):
+        """
+        Kelimeleri şifreli paket olarak dosyaya kaydet
+        
+        Args:
+            words: Kelime listesi veya {dil: kelime listesi} dictionary'si
+            filename: Dosya adı
+            language: words liste ise bölümlerin dil kodu
+        """
+        try:
+            with open(filename, 'wb') as f:
+                f.write(self.encode_bundle(words, language))
+            print(f"✓ Kelimeler paketlenerek {filename} dosyasına kaydedildi")
+        except Exception as e:
+            print(f"✗ Kaydetme hatası: {e}")
+            
+    def load_bundle(self, filename: str, word_length: Optional[int] = None,
+                    language: Optional[str] = None) -> List[str]:
+        """
+        Şifreli paketten kelimeleri yükle (yalnızca istenen bölümler okunur)
+        
+        Args:
+            filename: Dosya adı
+            word_length: Yalnızca bu uzunluktaki kelimeler (None ise hepsi)
+            language: Yalnızca bu dildeki kelimeler (None ise hepsi)
+            
+        Returns:
+            Çözülmüş kelime listesi
+        """
+        try:
+            with WordBundle(filename, self) as bundle:
+                words = bundle.read(word_length, language)
+            print(f"✓ {len(words)} kelime {filename} paketinden yüklendi")
+            return words
+        except FileNotFoundError:
+            print(f"✗ {filename} bulunamadı")
+            return []
+        except Exception as e:
+            print(f"✗ Yükleme hatası: {e}")
+            return []
+
+
+def _section_id(language: str, word_length: int) -> bytes:
+    """Bölümün anahtar akışı ve etiketinde kullanılan 3 baytlık kimliği"""
+    return language.encode('ascii')[:2].ljust(2, b' ') + bytes([word_length])
+
+
+def _select_sections(sections: List[BundleSection], word_length: Optional[int],
+                     language: Optional[str]) -> List[BundleSection]:
+    """Bölüm tablosunu uzunluk ve dile göre filtrele"""
+    return [
+        section for section in sections
+        if (word_length is None or section.length == word_length)
+        and (language is None or section.language == language)
+    ]
+
+
+def is_bundle_file(filename: str) -> bool:
+    """
+    Dosyanın şifreli kelime paketi olup olmadığını kontrol et
+    
+    Args:
+        filename: Dosya adı
+        
+    Returns:
+        Dosya paket sihirli sayısıyla başlıyorsa True
+    """
+    try:
+        with open(filename, 'rb') as f:
+            return f.read(len(BUNDLE_MAGIC)) == BUNDLE_MAGIC
+    except OSError:
+        return False
+
+
+class WordBundle:
+    """
+    Şifreli kelime paketi okuyucusu
+    
+    Dosya mmap ile açılır; açılışta yalnızca başlık ve bölüm tablosu okunur.
+    Bir bölüm istendiğinde sadece onun sayfaları diskten okunur ve parça
+    parça çözülür, diğer dil/uzunlukların verisine hiç dokunulmaz.
+    """
+    
+    def __init__(self, filename: str, encryption: Optional[WordEncryption] = None):
+        """
+        Paketi aç ve bölüm tablosunu doğrula
+        
+        Args:
+            filename: Paket dosyası
+            encryption: Anahtarı sağlayan WordEncryption (None ise varsayılan)
+            
+        Raises:
+            ValueError: Paket bozuksa
+        """
+        self.filename = filename
+        self.encryption = encryption or WordEncryption()
+        self._file = open(filename, 'rb')
+        self._map = None
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self._nonce, self._sections = self.encryption.read_bundle_table(self._map)
+        except Exception:
+            self.close()
+            raise
+            
+    def sections(self) -> List[BundleSection]:
+        """Paketteki bölümlerin listesi (kelimeler çözülmeden)"""
+        return list(self._sections)
+        
+    def read(self, word_length: Optional[int] = None,
+             language: Optional[str] = None) -> List[str]:
+        """
+        Eşleşen bölümlerin kelimelerini çöz
+        
+        Args:
+            word_length: Yalnızca bu uzunluk (None ise hepsi)
+            language: Yalnızca bu dil (None ise hepsi)
+            
+        Returns:
+            Kelime listesi
+        """
+        words = []
+        for section in _select_sections(self._sections, word_length, language):
+            words.extend(self.encryption.decrypt_section(self._map, self._nonce, section))
+        return words
+        
+    def close(self):
+        """mmap'i ve dosyayı kapat"""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        self._file.close()
+        
+    def __enter__(self):
+        return self
+        
+    def __exit__(self, *exc):
+        self.close()
+        return False
+
+
+class GameStateToken:
+    """
+    Oyun durumunu kısa, şifreli ve imzalı bir jetona çevirir
+    
+    Jeton: sürüm + nonce + şifreli veri + HMAC-SHA256 etiketi (base64url).
+    Gizli kelime ve tahminler kelime listesindeki indeksleriyle, sonuçlar
+    desen kodlarıyla saklanır. Aynı anahtara ve kelime listesine sahip her
+    süreç, paylaşılan oturum deposu olmadan oyuna devam edebilir.
+    """
+    
+    VERSION = 1
+    NONCE_SIZE = 8
+    TAG_SIZE = 16
+    NOT_IN_LIST = 0xFFFFFFFF
+    
+    def __init__(self, words: List[str], encryption: WordEncryption):
+        """
+        Jeton kodlayıcısını başlat
+        
+        Args:
+            words: Gizli kelimenin seçildiği kelime listesi (sıra önemli)
+            encryption: Gizli anahtarı sağlayan WordEncryption
+            
+        Raises:
+            ValueError: Anahtar verilmemiş veya herkesin bildiği varsayılan anahtar
+        """
+        if encryption is None or encryption.key == DEFAULT_KEY.encode('utf-8'):
+            # Varsayılan anahtar kodda açık: onunla herkes geçerli jeton üretebilir
+            raise ValueError("GameStateToken için gizli bir anahtar gerekli")
+        self.encryption = encryption
+        self.words = [word.upper() for word in words]
+        self._index = {word: i for i, word in enumerate(self.words)}
+        
+        # Kelime listesi değişirse eski jetonlar doğrulanamaz
+        fingerprint = hashlib.sha256('\n'.join(self.words).encode('utf-8')).digest()[:8]
+        self._enc_key = hashlib.sha256(b'token-enc' + self.encryption.key).digest()
+        self._mac_key = hashlib.sha256(b'token-mac' + self.encryption.key + fingerprint).digest()
+        
+    def encode(self, game: GameLogic) -> str:
+        """
+        Oyunu jetona çevir
+        
+        Args:
+            game: Klasik GameLogic nesnesi
+            
+        Returns:
+            base64url jeton
+        """
+        snapshot = game.to_snapshot()
+        secret_index = self._index.get(game.secret_word)
+        if secret_index is None or snapshot['mode'] != 'classic':
+            raise ValueError("Yalnızca kelime listesindeki klasik oyunlar kodlanabilir")
+            
+        parts = [struct.pack('<IBB', secret_index, game.max_attempts, len(game.guesses))]
+        
+        for guess, code in zip(snapshot['guesses'], snapshot['patterns']):
+            guess_index = self._index.get(guess)
+            if guess_index is None:
+                raw = guess.encode('utf-8')
+                parts.append(struct.pack('<IHB', self.NOT_IN_LIST, code, len(raw)) + raw)
+            else:
+                parts.append(struct.pack('<IH', guess_index, code))
+                
+        payload = b''.join(parts)
+        nonce = os.urandom(self.NONCE_SIZE)
+        body = bytes([self.VERSION]) + nonce + _xor_bytes(
+            payload, _keystream(self._enc_key, nonce, len(payload))
+        )
+        tag = hmac.new(self._mac_key, body, hashlib.sha256).digest()[:self.TAG_SIZE]
+        
+        return base64.urlsafe_b64encode(body + tag).rstrip(b'=').decode('ascii')
+        
+    def decode(self, token: str, verbose: bool = False) -> GameLogic:
+        """
+        Jetonu doğrula ve canlı bir oyuna çevir
+        
+        Args:
+            token: encode çıktısı
+            verbose: Konsola oyun mesajları yazılsın mı
+            
+        Returns:
+            GameLogic nesnesi
+            
+        Raises:
+            ValueError: Jeton bozuk, değiştirilmiş veya başka anahtarla üretilmişse
+        """
+        try:
+            raw = base64.urlsafe_b64decode(token + '=' * (-len(token) % 4))
+        except (ValueError, TypeError):
+            raise ValueError("Geçersiz jeton")
+            
+        header_size = 1 + self.NONCE_SIZE
+        if len(raw) < header_size + self.TAG_SIZE or raw[0] != self.VERSION:
+            raise ValueError("Geçersiz jeton")
+            
+        body, tag = raw[:-self.TAG_SIZE], raw[-self.TAG_SIZE:]
+        expected = hmac.new(self._mac_key, body, hashlib.sha256).digest()[:self.TAG_SIZE]
+        if not hmac.compare_digest(tag, expected):
+            raise ValueError("Jeton imzası doğrulanamadı")
+            
+        nonce = body[1:header_size]
+        ciphertext = body[header_size:]
+        payload = _xor_bytes(ciphertext, _keystream(self._enc_key, nonce, len(ciphertext)))
+        
+        try:
+            secret_index, max_attempts, count = struct.unpack_from('<IBB', payload, 0)
+            offset = 6
+            guesses, patterns = [], []
+            for _ in range(count):
+                guess_index, code = struct.unpack_from('<IH', payload, offset)
+                offset += 6
+                if guess_index == self.NOT_IN_LIST:
+                    size = payload[offset]
+                    guess = payload[offset + 1:offset + 1 + size].decode('utf-8')
+                    offset += 1 + size
+                else:
+                    guess = self.words[guess_index]
+                guesses.append(guess)
+                patterns.append(code)
+                
+            return GameLogic.from_snapshot({
+                'mode': 'classic',
+                'secret': self.words[secret_index],
+                'max_attempts': max_attempts,
+                'guesses': guesses,
+                'patterns': patterns
+            }, verbose)
+        except (struct.error, IndexError, UnicodeDecodeError):
+            raise ValueError("Jeton içeriği çözümlenemedi")
 
 
 class WordCache:
-    """Kelime listesi önbellek yöneticisi"""
+    """
+    Kelime listesi önbellek yöneticisi
     
-    def __init__(self, cache_size: int = 128):
+    Gerçek LRU: girdiler erişim sırasına göre bir OrderedDict'te tutulur,
+    erişim ve çıkarma O(1)'dir. Girdi sayısının yanında yaklaşık bayt
+    bütçesiyle de sınırlanır.
+    """
+    
+    def __init__(self, cache_size: int = 128, max_bytes: Optional[int] = DEFAULT_CACHE_BYTES):
         """
         Önbellek yöneticisini başlat
         
         Args:
-            cache_size: Önbellek boyutu
+            cache_size: En fazla girdi sayısı
+            max_bytes: Yaklaşık bellek bütçesi (None ise sınırsız)
         """
         self.cache_size = cache_size
-        self._cache = {}
-        self._access_count = {}
+        self.max_bytes = max_bytes
+        self._cache: 'OrderedDict[str, List[str]]' = OrderedDict()
+        self._sizes: Dict[str, int] = {}
+        self._access_count: Dict[str, int] = {}
+        self._bytes = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        # Örneğe ait hash önbelleği (sınıf düzeyinde lru_cache self'i tutar)
+        self._hash_cache = lru_cache(maxsize=HASH_CACHE_SIZE)(_word_hash)
         
-    @lru_cache(maxsize=128)
     def get_word_hash(self, word: str) -> str:
         """
         Kelime için hash oluştur
@@ -168,7 +837,7 @@ class WordCache:
         Returns:
             SHA256 hash
         """
-        return hashlib.sha256(word.encode('utf-8')).hexdigest()[:16]
+        return self._hash_cache(word)
         
     def cache_words(self, key: str, words: List[str]):
         """
@@ -178,14 +847,27 @@ class WordCache:
             key: Önbellek anahtarı
             words: Kelime listesi
         """
-        if len(self._cache) >= self.cache_size:
-            # LRU stratejisi: En az kullanılanı sil
-            least_used = min(self._access_count.items(), key=lambda x: x[1])
-            del self._cache[least_used[0]]
-            del self._access_count[least_used[0]]
+        if key in self._cache:
+            self._remove(key)
             
+        size = _estimate_size(words)
         self._cache[key] = words
+        self._sizes[key] = size
         self._access_count[key] = 0
+        self._bytes += size
+        
+        # LRU stratejisi: en uzun süredir kullanılmayanı sil (yeni girdi hariç)
+        while len(self._cache) > 1 and (
+                len(self._cache) > self.cache_size
+                or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+            self._remove(next(iter(self._cache)))
+            self._evictions += 1
+            
+    def _remove(self, key: str):
+        """Girdiyi ve boyut kaydını sil"""
+        del self._cache[key]
+        del self._access_count[key]
+        self._bytes -= self._sizes.pop(key)
         
     def get_cached_words(self, key: str) -> Optional[List[str]]:
         """
@@ -197,10 +879,60 @@ class WordCache:
         Returns:
             Kelime listesi veya None
         """
-        if key in self._cache:
-            self._access_count[key] += 1
-            return self._cache[key]
-        return None
+        words = self._cache.get(key)
+        if words is None:
+            self._misses += 1
+            return None
+        self._cache.move_to_end(key)
+        self._access_count[key] += 1
+        self._hits += 1
+        return words
+        
+    def items(self) -> List[Tuple[str, List[str]]]:
+        """Girdileri en eskiden en yeniye döndür (erişim sayılmaz)"""
+        return list(self._cache.items())
+        
+    def save_snapshot(self, path: str, sources: Dict[str, Tuple[str, bytes]]) -> int:
+        """
+        Önbelleği sonraki açılışta geri yüklenmek üzere dosyaya yaz
+        
+        Args:
+            path: Anlık görüntü dosyası
+            sources: {anahtar: (kaynak dosya, kaynak özeti)}
+            
+        Returns:
+            Yazılan girdi sayısı
+        """
+        return _write_snapshot(path, self.items(), sources)
+        
+    def load_snapshot(self, path: str) -> Dict[str, Tuple[str, bytes]]:
+        """
+        Kaynağı değişmemiş girdileri anlık görüntüden geri yükle
+        
+        Args:
+            path: Anlık görüntü dosyası
+            
+        Returns:
+            Geri yüklenen {anahtar: (kaynak dosya, kaynak özeti)}
+        """
+        return _read_snapshot(path, self.cache_words)
+        
+    def get_or_load(self, key: str, loader: Callable[[], List[str]]) -> List[str]:
+        """
+        Önbellekten al; yoksa yükleyiciyle yükleyip önbelleğe al
+        
+        Args:
+            key: Önbellek anahtarı
+            loader: Kelime listesini döndüren fonksiyon
+            
+        Returns:
+            Kelime listesi
+        """
+        words = self.get_cached_words(key)
+        if words is None:
+            words = loader()
+            self.cache_words(key, words)
+        return words
         
     def is_cached(self, key: str) -> bool:
         """
@@ -214,11 +946,15 @@ class WordCache:
         """
         return key in self._cache
         
-    def clear_cache(self):
+    def clear_cache(self, verbose: bool = True):
         """Önbelleği temizle"""
         self._cache.clear()
+        self._sizes.clear()
         self._access_count.clear()
-        print("✓ Önbellek temizlendi")
+        self._bytes = 0
+        self._hash_cache.cache_clear()
+        if verbose:
+            print("✓ Önbellek temizlendi")
         
     def get_cache_stats(self) -> dict:
         """
@@ -227,27 +963,414 @@ class WordCache:
         Returns:
             İstatistik dictionary'si
         """
+        lookups = self._hits + self._misses
         return {
             'total_items': len(self._cache),
             'cache_size': self.cache_size,
             'usage_percent': (len(self._cache) / self.cache_size) * 100,
-            'access_counts': dict(self._access_count)
+            'access_counts': dict(self._access_count),
+            'bytes': self._bytes,
+            'max_bytes': self.max_bytes,
+            'hits': self._hits,
+            'misses': self._misses,
+            'evictions': self._evictions,
+            'hit_rate': (self._hits / lookups * 100) if lookups else 0.0
+        }
+
+
+class HashedAnswerStore:
+    """
+    Cevap listesini düz metin str nesneleri olmadan tutan depo
+    
+    Her kelimenin anahtarlı 64 bitlik özeti (bkz. keyed_word_hash) açık
+    adresli bir array('Q') tablosunda durur; üyelik ve sıra sorguları özet
+    karşılaştırmasıyla O(1)'dir. Kelimelerin kendisi yalnızca tek bir şifreli
+    bayt dizisi olarak saklanır ve reveal() ile tek tek çözülür.
+    
+    Kelime başına bellek (tablo + sıra + şifreli veri + konum) 50 baytın
+    altındadır; str listesi ve indeks sözlüğünde 120 bayt civarındadır.
+    """
+    
+    # Tablo doluluk oranı en fazla 1/2
+    LOAD_FACTOR = 2
+    
+    def __init__(self, words: List[str], encryption: Optional[WordEncryption] = None):
+        """
+        Depoyu kelime listesinden oluştur
+        
+        Args:
+            words: Büyük harfli kelimeler (sıra korunur, tekrarlar ilk sırayı alır)
+            encryption: Anahtarı sağlayan WordEncryption (None ise varsayılan)
+        """
+        key = (encryption or WordEncryption()).key
+        self._mac_key = hashlib.sha256(b'answers-mac' + key).digest()
+        self._enc_key = hashlib.sha256(b'answers-enc' + key).digest()
+        self._nonce = os.urandom(BUNDLE_NONCE_SIZE)
+        
+        capacity = 8
+        while capacity < len(words) * self.LOAD_FACTOR:
+            capacity <<= 1
+        self._slots = array('Q', bytes(8 * capacity))
+        self._slot_index = array('I', bytes(4 * capacity))
+        
+        encoded = [word.encode('utf-8') for word in words]
+        self._offsets = array('I', [0])
+        for raw in encoded:
+            self._offsets.append(self._offsets[-1] + len(raw))
+        plaintext = b''.join(encoded)
+        self._blob = _xor_bytes(plaintext, _keystream(self._enc_key, self._nonce, len(plaintext)))
+        del encoded, plaintext
+        
+        for index, word in enumerate(words):
+            digest = keyed_word_hash(word, self._mac_key)
+            slot, found = self._find(digest)
+            if not found:
+                self._slots[slot] = digest
+                self._slot_index[slot] = index
+                
+    def _find(self, digest: int) -> Tuple[int, bool]:
+        """Özetin yuvasını doğrusal yoklamayla bul: (yuva, bulundu mu)"""
+        slots = self._slots
+        mask = len(slots) - 1
+        slot = digest & mask
+        while True:
+            value = slots[slot]
+            if value == digest:
+                return slot, True
+            if value == 0:
+                return slot, False
+            slot = (slot + 1) & mask
+            
+    def index_of(self, word: str) -> int:
+        """
+        Kelimenin listedeki sırasını döndür
+        
+        Args:
+            word: Aranan kelime
+            
+        Returns:
+            Sıra numarası veya yoksa -1
+        """
+        slot, found = self._find(keyed_word_hash(word.upper(), self._mac_key))
+        return self._slot_index[slot] if found else -1
+        
+    def __contains__(self, word: str) -> bool:
+        return self._find(keyed_word_hash(word.upper(), self._mac_key))[1]
+        
+    def digest(self, word: str) -> int:
+        """
+        Kelimenin bu depodaki anahtarlı özetini döndür
+        
+        Args:
+            word: Kelime
+            
+        Returns:
+            64 bitlik özet
+        """
+        return keyed_word_hash(word.upper(), self._mac_key)
+        
+    def digest_at(self, index: int) -> int:
+        """
+        Sıradaki kelimenin özetini kelimeyi çözmeden döndür
+        
+        Args:
+            index: Kelimenin sırası
+            
+        Returns:
+            64 bitlik özet; kelime listede daha önce geçen bir tekrar ise 0
+        """
+        slots = self._slots
+        for slot, value in enumerate(self._slot_index):
+            if value == index and slots[slot]:
+                return slots[slot]
+        return 0
+        
+    def __len__(self) -> int:
+        return len(self._offsets) - 1
+        
+    def random_index(self) -> int:
+        """Rastgele bir kelimenin sırası (kelime çözülmez)"""
+        return secrets.randbelow(len(self))
+        
+    def reveal(self, index: int) -> str:
+        """
+        Tek bir kelimeyi çöz (ör. oyun sonunda göstermek için)
+        
+        Args:
+            index: Kelimenin sırası
+            
+        Returns:
+            Kelime
+        """
+        start, end = self._offsets[index], self._offsets[index + 1]
+        stream = _keystream(self._enc_key, self._nonce, end)[start:]
+        return _xor_bytes(self._blob[start:end], stream).decode('utf-8')
+        
+    def memory_bytes(self) -> int:
+        """Deponun yaklaşık bellek kullanımı"""
+        return (sys.getsizeof(self._slots) + sys.getsizeof(self._slot_index)
+                + sys.getsizeof(self._offsets) + sys.getsizeof(self._blob))
+
+
+class _Flight:
+    """Tek uçuşlu yüklemede bekleyenlerin paylaştığı sonuç"""
+    
+    def __init__(self):
+        self._done = threading.Event()
+        self._result = None
+        self._error = None
+        
+    def finish(self, result=None, error: Optional[BaseException] = None):
+        """Sonucu (veya hatayı) yayınla ve bekleyenleri uyandır"""
+        self._result = result
+        self._error = error
+        self._done.set()
+        
+    def wait(self):
+        """Yükleme bitene kadar bekle; yükleyicinin hatasını yeniden fırlat"""
+        self._done.wait()
+        if self._error is not None:
+            raise self._error
+        return self._result
+
+
+class ConcurrentWordCache:
+    """
+    İş parçacıkları arasında paylaşılabilen, kilit şeritli kelime önbelleği
+    
+    Anahtarlar hash'lerine göre STRIPES kadar bağımsız WordCache şeridine
+    dağıtılır; her şeridin kendi kilidi vardır, böylece farklı anahtarlara
+    erişen iş parçacıkları birbirini beklemez. LRU sırası ve bütçeler şerit
+    başınadır (toplam kapasite şeritlere eşit bölünür).
+    
+    get_or_load eksik bir anahtar için yükleyiciyi yalnızca bir kez çağırır;
+    aynı anda gelen diğer çağıranlar onun sonucunu bekler.
+    """
+    
+    STRIPES = 16
+    
+    def __init__(self, cache_size: int = 128, max_bytes: Optional[int] = DEFAULT_CACHE_BYTES,
+                 stripes: int = STRIPES):
+        """
+        Önbelleği başlat
+        
+        Args:
+            cache_size: Toplam en fazla girdi sayısı
+            max_bytes: Toplam yaklaşık bellek bütçesi (None ise sınırsız)
+            stripes: Kilit şeridi sayısı
+        """
+        self.cache_size = cache_size
+        self.max_bytes = max_bytes
+        self._stripes = [
+            WordCache(max(1, cache_size // stripes),
+                      None if max_bytes is None else max(1, max_bytes // stripes))
+            for _ in range(stripes)
+        ]
+        self._locks = [threading.Lock() for _ in range(stripes)]
+        self._loading: List[Dict[str, _Flight]] = [{} for _ in range(stripes)]
+        # Şerit başına [kilit alma, çekişmeli alma, bekleme süresi, yükleme, bekleyen]
+        # sayaçları; yalnızca şeridin kilidi tutulurken güncellenir
+        self._counters = [[0, 0, 0.0, 0, 0] for _ in range(stripes)]
+        self._hash_cache = lru_cache(maxsize=HASH_CACHE_SIZE)(_word_hash)
+        
+    def _stripe(self, key: str) -> int:
+        """Anahtarın şerit numarası"""
+        return hash(key) % len(self._stripes)
+        
+    @contextmanager
+    def _locked(self, index: int):
+        """Şeridin kilidini al; beklemek gerekirse çekişme olarak say"""
+        lock = self._locks[index]
+        if lock.acquire(blocking=False):
+            waited = None
+        else:
+            start = time.perf_counter()
+            lock.acquire()
+            waited = time.perf_counter() - start
+        try:
+            counters = self._counters[index]
+            counters[0] += 1
+            if waited is not None:
+                counters[1] += 1
+                counters[2] += waited
+            yield self._stripes[index]
+        finally:
+            lock.release()
+            
+    def get_word_hash(self, word: str) -> str:
+        """Kelime için hash oluştur (lru_cache iş parçacığı güvenlidir)"""
+        return self._hash_cache(word)
+        
+    def cache_words(self, key: str, words: List[str]):
+        """
+        Kelimeleri önbelleğe al
+        
+        Args:
+            key: Önbellek anahtarı
+            words: Kelime listesi
+        """
+        with self._locked(self._stripe(key)) as stripe:
+            stripe.cache_words(key, words)
+            
+    def get_cached_words(self, key: str) -> Optional[List[str]]:
+        """
+        Önbellekten kelimeleri al
+        
+        Args:
+            key: Önbellek anahtarı
+            
+        Returns:
+            Kelime listesi veya None
+        """
+        with self._locked(self._stripe(key)) as stripe:
+            return stripe.get_cached_words(key)
+            
+    def get_or_load(self, key: str, loader: Callable[[], List[str]]) -> List[str]:
+        """
+        Önbellekten al; yoksa yükleyiciyi tek uçuşlu olarak çağırıp önbelleğe al
+        
+        Yükleyici kilit dışında çalışır; aynı anahtarı isteyen diğer
+        iş parçacıkları yükleyiciyi tekrar çağırmak yerine sonucunu bekler.
+        
+        Args:
+            key: Önbellek anahtarı
+            loader: Kelime listesini döndüren fonksiyon
+            
+        Returns:
+            Kelime listesi
+        """
+        index = self._stripe(key)
+        with self._locked(index) as stripe:
+            words = stripe.get_cached_words(key)
+            if words is not None:
+                return words
+            flight = self._loading[index].get(key)
+            leader = flight is None
+            if leader:
+                flight = self._loading[index][key] = _Flight()
+                self._counters[index][3] += 1
+            else:
+                self._counters[index][4] += 1
+                
+        if not leader:
+            return flight.wait()
+            
+        try:
+            words = loader()
+        except BaseException as e:
+            with self._locked(index):
+                del self._loading[index][key]
+            flight.finish(error=e)
+            raise
+            
+        with self._locked(index) as stripe:
+            stripe.cache_words(key, words)
+            del self._loading[index][key]
+        flight.finish(words)
+        return words
+        
+    def is_cached(self, key: str) -> bool:
+        """
+        Önbellekte var mı kontrol et
+        
+        Args:
+            key: Önbellek anahtarı
+            
+        Returns:
+            Önbellekte varsa True
+        """
+        with self._locked(self._stripe(key)) as stripe:
+            return stripe.is_cached(key)
+            
+    def items(self) -> List[Tuple[str, List[str]]]:
+        """Tüm şeritlerin girdilerini döndür (şerit içinde en eskiden en yeniye)"""
+        items = []
+        for index in range(len(self._stripes)):
+            with self._locked(index) as stripe:
+                items.extend(stripe.items())
+        return items
+        
+    def save_snapshot(self, path: str, sources: Dict[str, Tuple[str, bytes]]) -> int:
+        """WordCache.save_snapshot ile aynı"""
+        return _write_snapshot(path, self.items(), sources)
+        
+    def load_snapshot(self, path: str) -> Dict[str, Tuple[str, bytes]]:
+        """WordCache.load_snapshot ile aynı"""
+        return _read_snapshot(path, self.cache_words)
+            
+    def clear_cache(self):
+        """Önbelleği temizle"""
+        for index in range(len(self._stripes)):
+            with self._locked(index) as stripe:
+                stripe.clear_cache(verbose=False)
+        self._hash_cache.cache_clear()
+        print("✓ Önbellek temizlendi")
+        
+    def get_cache_stats(self) -> dict:
+        """
+        Önbellek ve kilit çekişmesi istatistiklerini döndür
+        
+        Returns:
+            İstatistik dictionary'si (WordCache alanları + çekişme metrikleri)
+        """
+        totals = dict.fromkeys(('total_items', 'bytes', 'hits', 'misses', 'evictions'), 0)
+        access_counts = {}
+        acquisitions = contended = loads = coalesced = 0
+        wait = 0.0
+        for index in range(len(self._stripes)):
+            with self._locked(index) as stripe:
+                stats = stripe.get_cache_stats()
+                counters = list(self._counters[index])
+            for field in totals:
+                totals[field] += stats[field]
+            access_counts.update(stats['access_counts'])
+            acquisitions += counters[0]
+            contended += counters[1]
+            wait += counters[2]
+            loads += counters[3]
+            coalesced += counters[4]
+            
+        lookups = totals['hits'] + totals['misses']
+        return {
+            **totals,
+            'cache_size': self.cache_size,
+            'usage_percent': (totals['total_items'] / self.cache_size) * 100,
+            'access_counts': access_counts,
+            'max_bytes': self.max_bytes,
+            'hit_rate': (totals['hits'] / lookups * 100) if lookups else 0.0,
+            'stripes': len(self._stripes),
+            'lock_acquisitions': acquisitions,
+            'lock_contended': contended,
+            'contention_rate': (contended / acquisitions * 100) if acquisitions else 0.0,
+            'lock_wait_ms': wait * 1000,
+            'loads': loads,
+            'coalesced_loads': coalesced
         }
 
 
 class SecureWordManager:
     """Güvenli kelime yöneticisi - Şifreleme ve önbellek ile"""
     
-    def __init__(self, encryption_key: Optional[str] = None, cache_size: int = 128):
+    def __init__(self, encryption_key: Optional[str] = None, cache_size: int = 128,
+                 thread_safe: bool = False, snapshot_file: Optional[str] = None):
         """
         Güvenli kelime yöneticisini başlat
         
         Args:
             encryption_key: Şifreleme anahtarı
             cache_size: Önbellek boyutu
+            thread_safe: Birden çok iş parçacığından kullanılacaksa True
+                (ConcurrentWordCache ile tek uçuşlu yükleme)
+            snapshot_file: Çözülmüş kelimelerin açılışlar arasında saklandığı
+                önbellek dosyası (None ise kullanılmaz)
         """
         self.encryption = WordEncryption(encryption_key)
-        self.cache = WordCache(cache_size)
+        self.cache = ConcurrentWordCache(cache_size) if thread_safe else WordCache(cache_size)
+        self.snapshot_file = snapshot_file
+        # Önbellek anahtarı -> (kaynak dosya, yüklendiği andaki özeti)
+        self._sources: Dict[str, Tuple[str, bytes]] = {}
+        if snapshot_file:
+            self._sources.update(self.cache.load_snapshot(snapshot_file))
         
     def convert_plaintext_to_encrypted(self, input_file: str, output_file: str):
         """
@@ -267,36 +1390,89 @@ class SecureWordManager:
         except Exception as e:
             print(f"✗ Dönüştürme hatası: {e}")
             
-    def load_words_secure(self, filename: str, word_length: int) -> List[str]:
+    def convert_plaintext_to_bundle(self, input_files: Union[str, Dict[str, str]],
+                                    output_file: str):
+        """
+        Düz metin kelime listelerini tek bir şifreli pakete çevir
+        
+        Args:
+            input_files: Giriş dosyası veya {dil: giriş dosyası} dictionary'si
+            output_file: Çıkış dosyası (şifreli paket)
+        """
+        if isinstance(input_files, str):
+            input_files = {'': input_files}
+        try:
+            word_lists = {}
+            for language, input_file in input_files.items():
+                with open(input_file, 'r', encoding='utf-8') as f:
+                    word_lists[language] = [line.strip().upper() for line in f if line.strip()]
+                    
+            self.encryption.save_bundle(word_lists, output_file)
+            print(f"✓ {', '.join(input_files.values())} → {output_file} dönüştürüldü")
+            
+        except Exception as e:
+            print(f"✗ Dönüştürme hatası: {e}")
+            
+    def load_words_secure(self, filename: str, word_length: int,
+                          language: Optional[str] = None) -> List[str]:
         """
         Kelimeleri güvenli şekilde yükle (önbellekle)
         
         Args:
             filename: Dosya adı
             word_length: Kelime uzunluğu
+            language: Paketteki dil bölümü (None ise tüm diller)
             
         Returns:
             Kelime listesi
         """
-        cache_key = f"{filename}_{word_length}"
-        
-        # Önbellekte var mı kontrol et
-        cached = self.cache.get_cached_words(cache_key)
-        if cached:
-            print(f"✓ Önbellekten yüklendi: {len(cached)} kelime")
-            return cached
-            
-        # Şifreli dosyadan yükle
-        all_words = self.encryption.load_encrypted_words(filename)
+        cache_key = f"{filename}_{word_length}" if language is None else \
+            f"{filename}_{language}_{word_length}"
         
-        # İstenen uzunluktaki kelimeleri filtrele
-        filtered_words = [w for w in all_words if len(w) == word_length]
+        loaded = False
         
-        # Önbelleğe al
-        self.cache.cache_words(cache_key, filtered_words)
+        def load() -> List[str]:
+            nonlocal loaded
+            loaded = True
+            checksum = file_checksum(filename)
+            # WordManager ile aynı kaynak arka uçları: paketten yalnızca istenen
+            # (dil, uzunluk) bölümü, şifreli JSON'dan istenen uzunluk okunur
+            if is_bundle_file(filename):
+                source = BundleSource(filename, self.encryption)
+            else:
+                source = EncryptedJSONSource(filename, self.encryption)
+            words = list(source.read_words(word_length, language))
+            self._sources[cache_key] = (filename, checksum)
+            return words
+            
+        # Önbellekte yoksa yükle ve önbelleğe al (eşzamanlı isteklerde tek yükleme).
+        # Hata önbelleğe ve anlık görüntüye girmez; sonraki çağrı yeniden dener.
+        try:
+            words = self.cache.get_or_load(cache_key, load)
+        except Exception as e:
+            print(f"✗ Yükleme hatası: {e}")
+            return []
+        if not loaded:
+            print(f"✓ Önbellekten yüklendi: {len(words)} kelime")
+        return words
         
-        return filtered_words
+    def save_snapshot(self) -> int:
+        """
+        Önbelleği snapshot_file dosyasına yaz (bir sonraki açılışta çözmeden yüklenir)
         
+        Returns:
+            Yazılan girdi sayısı
+        """
+        if not self.snapshot_file:
+            return 0
+        try:
+            count = self.cache.save_snapshot(self.snapshot_file, dict(self._sources))
+            print(f"✓ {count} önbellek girdisi {self.snapshot_file} dosyasına yazıldı")
+            return count
+        except Exception as e:
+            print(f"✗ Önbellek anlık görüntüsü yazılamadı: {e}")
+            return 0
+            
     def get_cache_info(self):
         """Önbellek bilgilerini döndür"""
         return self.cache.get_cache_stats()
@@ -364,12 +1540,74 @@ if __name__ == '__main__':
     cache_info = manager.get_cache_info()
     print(f"Önbellek kullanımı: {cache_info['usage_percent']:.1f}%")
     
+    # 4. Paket ve JSON yükleme karşılaştırması
+    print("\n=== Paket Karşılaştırması ===")
+    source = 'kelimeler_tr.txt' if os.path.exists('kelimeler_tr.txt') else test_file
+    bundle_file = 'test_words.bundle'
+    manager.convert_plaintext_to_encrypted(source, encrypted_file)
+    sources = {'tr': source}
+    if os.path.exists('kelimeler_en.txt'):
+        sources['en'] = 'kelimeler_en.txt'
+    manager.convert_plaintext_to_bundle(sources, bundle_file)
+    
+    import tracemalloc
+    for label, path, load in (
+        ('JSON (tümü)', encrypted_file, encryption.load_encrypted_words),
+        ('Paket (tümü)', bundle_file, encryption.load_bundle),
+        ('Paket (tr, 5 harf)', bundle_file, lambda path: encryption.load_bundle(path, 5, 'tr'))
+    ):
+        start = time.perf_counter()
+        for _ in range(10):
+            loaded = load(path)
+        elapsed = (time.perf_counter() - start) / 10
+        tracemalloc.start()
+        load(path)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        print(f"{label}: {len(loaded)} kelime, {os.path.getsize(path) / 1024:.0f} KB dosya, "
+              f"{elapsed * 1000:.2f} ms/yükleme, en çok {peak / 1024:.0f} KB bellek")
+    
+    # 5. Soğuk ve sıcak (anlık görüntüden) açılış karşılaştırması
+    print("\n=== Anlık Görüntü Karşılaştırması ===")
+    snapshot_file = 'test_words.cache'
+    for label, path in (('JSON', encrypted_file), ('Paket', bundle_file)):
+        if os.path.exists(snapshot_file):
+            os.remove(snapshot_file)
+        start = time.perf_counter()
+        cold = SecureWordManager(snapshot_file=snapshot_file)
+        for length in (4, 5, 6, 7):
+            cold.load_words_secure(path, length)
+        cold_elapsed = time.perf_counter() - start
+        cold.save_snapshot()
+        
+        start = time.perf_counter()
+        warm = SecureWordManager(snapshot_file=snapshot_file)
+        for length in (4, 5, 6, 7):
+            warm.load_words_secure(path, length)
+        warm_elapsed = time.perf_counter() - start
+        print(f"{label}: soğuk {cold_elapsed * 1000:.2f} ms, sıcak {warm_elapsed * 1000:.2f} ms "
+              f"(isabet %{warm.get_cache_info()['hit_rate']:.0f})")
+    
+    # 6. Özet deposu ve str listesi bellek karşılaştırması
+    print("\n=== Özet Deposu ===")
+    with open(source, encoding='utf-8') as f:
+        text = f.read()
+    tracemalloc.start()
+    plain = [w for w in text.upper().split() if len(w) == 5]
+    plain_index = {}
+    for i, w in enumerate(plain):
+        plain_index.setdefault(w, i)
+    plain_bytes = tracemalloc.get_traced_memory()[0]
+    tracemalloc.stop()
+    store = HashedAnswerStore(plain, encryption)
+    print(f"{len(plain)} kelime: str listesi + indeks {plain_bytes / len(plain):.0f} bayt/kelime, "
+          f"özet deposu {store.memory_bytes() / len(store):.0f} bayt/kelime")
+    
     # Temizlik
     print("\n=== Temizlik ===")
-    if os.path.exists(test_file):
-        os.remove(test_file)
-    if os.path.exists(encrypted_file):
-        os.remove(encrypted_file)
+    for path in (test_file, encrypted_file, bundle_file, snapshot_file):
+        if os.path.exists(path):
+            os.remove(path)
     print("✓ Test dosyaları silindi")
     
     print("\n✓ Tüm testler tamamlandı!")
@@ -0,0 +1,657 @@
+"""
+Oyun Sunucusu Modülü
+Çok sayıda eşzamanlı oyun oturumunu asyncio üzerinde HTTP ve WebSocket ile sunar
+
+Kivy içe aktarılmaz; yalnızca WordManager ve GameLogic kullanılır.
+
+HTTP uç noktaları (JSON):
+    POST   /sessions               {"language": "tr", "word_length": 5, "mode": "classic"}
+    GET    /sessions/<id>
+    POST   /sessions/<id>/guess    {"guess": "ELMA"}
+    DELETE /sessions/<id>
+    GET    /ws                     WebSocket; mesajlar {"action": "new" | "guess" | "state", ...}
+"""
+
+import asyncio
+import base64
+import hashlib
+import json
+import secrets
+import struct
+import weakref
+from typing import Callable, Dict, List, Optional, Tuple
+
+from words import WordManager
+from game_logic import GameLogic, AbsurdleGameLogic, encode_pattern, decode_pattern
+from batching import GuessBatcher
+from sessions import SessionRegistry, DEFAULT_SPILL_CAPACITY
+from metrics import REGISTRY
+
+
+WEBSOCKET_GUID = b'258EAFA5-E914-47DA-95CA-C5AB0DC85B11'
+MAX_HEADER_BYTES = 16 * 1024
+MAX_BODY_BYTES = 64 * 1024
+# Desteklenmeyen veri (parçalı mesajlar) için kapatma kodu
+WS_CLOSE_UNSUPPORTED = 1003
+
+HTTP_REASONS = {
+    200: 'OK',
+    201: 'Created',
+    400: 'Bad Request',
+    404: 'Not Found',
+    405: 'Method Not Allowed',
+    413: 'Payload Too Large',
+}
+
+
+class RequestError(Exception):
+    """İstemciye HTTP durum koduyla döndürülecek hata"""
+
+    def __init__(self, status: int, message: str):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+
+
+class UnsupportedFrame(Exception):
+    """Sunucunun işlemediği WebSocket çerçevesi (parçalı/devam çerçeveleri)"""
+
+
+def _field(payload: Dict, name: str, expected: type, default):
+    """
+    İstek alanını tür denetimiyle al
+
+    Args:
+        payload: İstek gövdesi
+        name: Alan adı
+        expected: Beklenen tür
+        default: Alan yoksa kullanılacak değer
+
+    Returns:
+        Alan değeri
+    """
+    value = payload.get(name, default)
+    if not isinstance(value, expected) or isinstance(value, bool):
+        raise RequestError(400, f"Geçersiz alan: {name}")
+    return value
+
+
+class GameServer:
+    """Eşzamanlı oyun oturumlarını yöneten asyncio sunucusu"""
+
+    def __init__(self, word_manager: Optional[WordManager] = None,
+                 host: str = '127.0.0.1', port: int = 8765,
+                 sessions: Optional[SessionRegistry] = None,
+                 batcher: Optional[GuessBatcher] = None):
+        """
+        Sunucuyu hazırla
+
+        Args:
+            word_manager: Tüm oturumların paylaştığı kelime yöneticisi
+            host: Dinlenecek adres
+            port: Dinlenecek port (0 ise işletim sistemi seçer)
+            sessions: Oturum kaydı (None ise varsayılan kapasite ve TTL)
+            batcher: Klasik oyun tahminlerini toplu puanlayan değerlendirici
+                (None ise aynı olay döngüsü turunda gelen tahminler birlikte puanlanır)
+        """
+        self.word_manager = word_manager or WordManager()
+        self.host = host
+        self.port = port
+        self.sessions = sessions if sessions is not None else SessionRegistry()
+        self.batcher = batcher if batcher is not None else GuessBatcher(max_wait=0.0)
+        # Aynı oturuma eşzamanlı gelen tahminleri sıraya koyan kilitler
+        self._guess_locks: 'weakref.WeakValueDictionary[str, asyncio.Lock]' = (
+            weakref.WeakValueDictionary()
+        )
+        self._server: Optional[asyncio.AbstractServer] = None
+
+    # ------------------------------------------------------------------
+    # Oturum işlemleri (taşıma katmanından bağımsız)
+    # ------------------------------------------------------------------
+
+    async def _sessions_call(self, method: Callable, *args):
+        """
+        Oturum kaydı işlemini çalıştır
+
+        Disk taşması açıkken kayıt işlemleri dosya okuyup yazabildiğinden
+        olay döngüsünü bloklamamak için iş parçacığı havuzunda yürütülür.
+
+        Args:
+            method: SessionRegistry metodu
+            *args: Metot argümanları
+
+        Returns:
+            Metodun dönüş değeri
+        """
+        if not self.sessions.spill_dir:
+            return method(*args)
+        return await asyncio.get_running_loop().run_in_executor(None, method, *args)
+
+    async def create_session(self, language: str = 'tr', word_length: int = 5,
+                       mode: str = 'classic') -> Dict:
+        """
+        Yeni oyun oturumu oluştur
+
+        Args:
+            language: Dil kodu ('tr' veya 'en')
+            word_length: Kelime uzunluğu (5, 6 veya 7)
+            mode: 'classic' veya 'absurdle'
+
+        Returns:
+            Oturum durumu dictionary'si
+        """
+        if language not in ('tr', 'en') or word_length not in (5, 6, 7):
+            raise RequestError(400, "Geçersiz dil veya kelime uzunluğu")
+
+        words = self.word_manager.load_words(word_length, language)
+        if not words:
+            raise RequestError(400, "Kelime listesi yüklenemedi")
+
+        max_attempts = word_length
+        if mode == 'absurdle':
+            game = AbsurdleGameLogic(words, max_attempts, verbose=False)
+        elif mode == 'classic':
+            game = GameLogic(secrets.choice(words), max_attempts, verbose=False)
+        else:
+            raise RequestError(400, f"Bilinmeyen oyun modu: {mode}")
+        game.language = language
+
+        session_id = secrets.token_urlsafe(12)
+        await self._sessions_call(self.sessions.put, session_id, game)
+
+        state = self.describe_session(session_id, game)
+        state['mode'] = mode
+        return state
+
+    async def get_session(self, session_id: str) -> GameLogic:
+        """
+        Oturumu bul
+
+        Args:
+            session_id: Oturum kimliği
+
+        Returns:
+            GameLogic nesnesi
+        """
+        game = await self._sessions_call(self.sessions.get, session_id)
+        if game is None:
+            raise RequestError(404, "Oturum bulunamadı")
+        return game
+
+    async def submit_guess(self, session_id: str, guess: str) -> Dict:
+        """
+        Oturuma tahmin gönder
+
+        Tahmin, arayüzde olduğu gibi paylaşılan kelime listesinde olmalıdır.
+        Klasik oyunlarda tahmin, eşzamanlı diğer oturumların tahminleriyle
+        birlikte GuessBatcher üzerinden puanlanır; Absurdle aday bölümlemesi
+        ise olay döngüsünü bloklamamak için iş parçacığı havuzunda yapılır.
+
+        Args:
+            session_id: Oturum kimliği
+            guess: Tahmin edilen kelime
+
+        Returns:
+            Sonuç ve oturum durumu
+        """
+        game = await self.get_session(session_id)
+
+        if not isinstance(guess, str) or not guess:
+            raise RequestError(400, "Tahmin gerekli")
+        guess = guess.upper()
+        if len(guess) != len(game.secret_word):
+            raise RequestError(400, "Geçersiz tahmin")
+        if game.language and not self.word_manager.is_word_in_list(
+                guess, len(guess), game.language):
+            raise RequestError(400, "Kelime listede yok")
+
+        lock = self._guess_locks.get(session_id)
+        if lock is None:
+            lock = self._guess_locks[session_id] = asyncio.Lock()
+
+        async with lock:
+            if game.is_game_over():
+                raise RequestError(400, "Oyun zaten bitti")
+
+            if isinstance(game, AbsurdleGameLogic):
+                loop = asyncio.get_running_loop()
+                result = await loop.run_in_executor(None, game.make_guess, guess)
+            else:
+                code = await self.batcher.evaluate_code(guess, game.secret_word)
+                result = game.make_guess(guess, decode_pattern(code, len(guess)))
+        if result is None:
+            raise RequestError(400, "Geçersiz tahmin")
+
+        state = self.describe_session(session_id, game)
+        state['result'] = result
+        state['pattern'] = encode_pattern(result)
+        return state
+
+    async def delete_session(self, session_id: str) -> Dict:
+        """
+        Oturumu sil
+
+        Args:
+            session_id: Oturum kimliği
+
+        Returns:
+            Silme onayı
+        """
+        if not await self._sessions_call(self.sessions.remove, session_id):
+            raise RequestError(404, "Oturum bulunamadı")
+        return {'session_id': session_id, 'deleted': True}
+
+    def describe_session(self, session_id: str, game: GameLogic) -> Dict:
+        """
+        Oturum durumunu istemciye gönderilecek biçimde hazırla
+
+        Gizli kelime yalnızca oyun bittiğinde eklenir.
+
+        Args:
+            session_id: Oturum kimliği
+            game: GameLogic nesnesi
+
+        Returns:
+            Durum dictionary'si
+        """
+        state = {
+            'session_id': session_id,
+            'word_length': len(game.secret_word),
+            'max_attempts': game.max_attempts,
+            'attempts_used': game.current_attempt,
+            'remaining_attempts': game.get_remaining_attempts(),
+            'guesses': list(game.guesses),
+            'won': game.won,
+            'game_over': game.is_game_over()
+        }
+        if state['game_over']:
+            state['secret_word'] = game.secret_word
+        return state
+
+    async def dispatch(self, action: str, payload: Dict) -> Dict:
+        """
+        WebSocket mesajını oturum işlemine yönlendir
+
+        Args:
+            action: 'new', 'guess', 'state' veya 'delete'
+            payload: Mesaj gövdesi
+
+        Returns:
+            Yanıt dictionary'si
+        """
+        if action == 'new':
+            word_length = _field(payload, 'word_length', (int, str), 5)
+            if isinstance(word_length, str):
+                if not word_length.isdigit():
+                    raise RequestError(400, "Geçersiz alan: word_length")
+                word_length = int(word_length)
+            return await self.create_session(
+                _field(payload, 'language', str, 'tr'),
+                word_length,
+                _field(payload, 'mode', str, 'classic')
+            )
+        if action == 'guess':
+            return await self.submit_guess(_field(payload, 'session_id', str, ''),
+                                           payload.get('guess', ''))
+        if action == 'state':
+            session_id = _field(payload, 'session_id', str, '')
+            return self.describe_session(session_id, await self.get_session(session_id))
+        if action == 'delete':
+            return await self.delete_session(_field(payload, 'session_id', str, ''))
+        raise RequestError(400, f"Bilinmeyen işlem: {action}")
+
+    # ------------------------------------------------------------------
+    # HTTP
+    # ------------------------------------------------------------------
+
+    async def route(self, method: str, path: str, body: Dict) -> Tuple[int, Dict]:
+        """
+        HTTP isteğini ilgili işleme yönlendir
+
+        Args:
+            method: HTTP metodu
+            path: İstek yolu
+            body: JSON gövdesi
+
+        Returns:
+            (durum_kodu, yanıt) tuple'ı
+        """
+        parts = [part for part in path.split('?', 1)[0].split('/') if part]
+
+        if parts == ['sessions']:
+            if method != 'POST':
+                raise RequestError(405, "Yalnızca POST desteklenir")
+            return 201, await self.dispatch('new', body)
+
+        if len(parts) == 2 and parts[0] == 'sessions':
+            if method == 'GET':
+                return 200, await self.dispatch('state', {'session_id': parts[1]})
+            if method == 'DELETE':
+                return 200, await self.dispatch('delete', {'session_id': parts[1]})
+            raise RequestError(405, "Desteklenmeyen metot")
+
+        if len(parts) == 3 and parts[0] == 'sessions' and parts[2] == 'guess':
+            if method != 'POST':
+                raise RequestError(405, "Yalnızca POST desteklenir")
+            return 200, await self.submit_guess(parts[1], body.get('guess', ''))
+
+        raise RequestError(404, "Bulunamadı")
+
+    async def handle_connection(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter):
+        """
+        Bir istemci bağlantısını işle (keep-alive destekli)
+
+        Args:
+            reader: Akış okuyucu
+            writer: Akış yazıcı
+        """
+        try:
+            while True:
+                try:
+                    head = await reader.readuntil(b'\r\n\r\n')
+                except (asyncio.IncompleteReadError, ConnectionError):
+                    break
+                except asyncio.LimitOverrunError:
+                    await self._send_http(writer, 413, {'error': "Başlık çok büyük"}, False)
+                    break
+
+                method, path, headers = self._parse_head(head)
+
+                if headers.get('upgrade', '').lower() == 'websocket':
+                    await self._handle_websocket(reader, writer, headers)
+                    break
+
+                keep_alive = headers.get('connection', '').lower() != 'close'
+                status, response = await self._handle_http(reader, method, path, headers)
+                await self._send_http(writer, status, response, keep_alive)
+
+                if not keep_alive:
+                    break
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _handle_http(self, reader: asyncio.StreamReader, method: str,
+                           path: str, headers: Dict[str, str]) -> Tuple[int, Dict]:
+        """İstek gövdesini oku ve yönlendir"""
+        try:
+            length = int(headers.get('content-length', '0') or 0)
+            if length > MAX_BODY_BYTES:
+                raise RequestError(413, "Gövde çok büyük")
+
+            body = {}
+            if length:
+                raw = await reader.readexactly(length)
+                try:
+                    body = json.loads(raw.decode('utf-8'))
+                except ValueError:
+                    raise RequestError(400, "Geçersiz JSON")
+                if not isinstance(body, dict):
+                    raise RequestError(400, "JSON nesnesi bekleniyor")
+
+            return await self.route(method, path, body)
+        except RequestError as e:
+            return e.status, {'error': e.message}
+        except (ValueError, TypeError):
+            return 400, {'error': "Geçersiz istek"}
+
+    @staticmethod
+    def _parse_head(head: bytes) -> Tuple[str, str, Dict[str, str]]:
+        """İstek satırını ve başlıkları ayrıştır"""
+        lines = head.decode('latin-1').split('\r\n')
+        request_line = lines[0].split(' ')
+        method = request_line[0].upper() if request_line else ''
+        path = request_line[1] if len(request_line) > 1 else '/'
+
+        headers = {}
+        for line in lines[1:]:
+            if ':' in line:
+                name, value = line.split(':', 1)
+                headers[name.strip().lower()] = value.strip()
+        return method, path, headers
+
+    @staticmethod
+    async def _send_http(writer: asyncio.StreamWriter, status: int,
+                         payload: Dict, keep_alive: bool):
+        """JSON yanıtı gönder"""
+        body = json.dumps(payload, ensure_ascii=False, separators=(',', ':')).encode('utf-8')
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, 'Error')}\r\n"
+            f"Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            f"Connection: {'keep-alive' if keep_alive else 'close'}\r\n\r\n"
+        )
+        writer.write(head.encode('latin-1') + body)
+        await writer.drain()
+
+    # ------------------------------------------------------------------
+    # WebSocket (RFC 6455, yalnızca metin çerçeveleri)
+    # ------------------------------------------------------------------
+
+    async def _handle_websocket(self, reader: asyncio.StreamReader,
+                                writer: asyncio.StreamWriter, headers: Dict[str, str]):
+        """WebSocket el sıkışmasını yap ve mesaj döngüsünü çalıştır"""
+        key = headers.get('sec-websocket-key')
+        if not key:
+            await self._send_http(writer, 400, {'error': "Sec-WebSocket-Key eksik"}, False)
+            return
+
+        accept = base64.b64encode(
+            hashlib.sha1(key.encode('latin-1') + WEBSOCKET_GUID).digest()
+        ).decode('ascii')
+        writer.write(
+            b"HTTP/1.1 101 Switching Protocols\r\n"
+            b"Upgrade: websocket\r\n"
+            b"Connection: Upgrade\r\n"
+            b"Sec-WebSocket-Accept: " + accept.encode('ascii') + b"\r\n\r\n"
+        )
+        await writer.drain()
+
+        while True:
+            try:
+                opcode, payload = await read_ws_frame(reader)
+            except (asyncio.IncompleteReadError, ConnectionError):
+                return
+            except UnsupportedFrame:
+                writer.write(encode_ws_frame(struct.pack('!H', WS_CLOSE_UNSUPPORTED),
+                                             opcode=0x8))
+                await writer.drain()
+                return
+
+            if opcode == 0x8:  # Kapat
+                writer.write(encode_ws_frame(payload[:2], opcode=0x8))
+                await writer.drain()
+                return
+            if opcode == 0x9:  # Ping
+                writer.write(encode_ws_frame(payload, opcode=0xA))
+                await writer.drain()
+                continue
+            if opcode != 0x1:
+                continue
+
+            try:
+                message = json.loads(payload.decode('utf-8'))
+                if not isinstance(message, dict):
+                    raise RequestError(400, "JSON nesnesi bekleniyor")
+                response = await self.dispatch(message.get('action', ''), message)
+            except RequestError as e:
+                response = {'error': e.message, 'status': e.status}
+            except (ValueError, TypeError):
+                response = {'error': "Geçersiz mesaj", 'status': 400}
+
+            text = json.dumps(response, ensure_ascii=False, separators=(',', ':'))
+            writer.write(encode_ws_frame(text.encode('utf-8')))
+            await writer.drain()
+
+    # ------------------------------------------------------------------
+    # Yaşam döngüsü
+    # ------------------------------------------------------------------
+
+    async def start(self) -> asyncio.AbstractServer:
+        """
+        Sunucuyu başlat
+
+        Returns:
+            asyncio sunucu nesnesi
+        """
+        self._server = await asyncio.start_server(
+            self.handle_connection, self.host, self.port,
+            limit=MAX_HEADER_BYTES, backlog=1024
+        )
+        # Port 0 verildiyse gerçek portu kaydet
+        self.port = self._server.sockets[0].getsockname()[1]
+        print(f"✓ Oyun sunucusu http://{self.host}:{self.port} adresinde dinliyor")
+        return self._server
+
+    async def stop(self):
+        """Sunucuyu durdur"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        await self.batcher.close()
+
+    def preload(self, languages=('tr', 'en'), lengths=(5, 6, 7)):
+        """
+        Kelime listelerini önceden yükle (ilk isteğin olay döngüsünü bloklamaması için)
+
+        Args:
+            languages: Dil kodları
+            lengths: Kelime uzunlukları
+        """
+        for language in languages:
+            for length in lengths:
+                self.word_manager.load_words(length, language)
+
+
+async def read_ws_frame(reader: asyncio.StreamReader) -> Tuple[int, bytes]:
+    """
+    Tek bir WebSocket çerçevesi oku
+
+    Args:
+        reader: Akış okuyucu
+
+    Returns:
+        (opcode, payload) tuple'ı
+
+    Raises:
+        UnsupportedFrame: Parçalı mesaj (FIN biti yok veya devam çerçevesi)
+    """
+    first, second = await reader.readexactly(2)
+    fin = first & 0x80
+    opcode = first & 0x0F
+    masked = second & 0x80
+    length = second & 0x7F
+
+    if length == 126:
+        length = struct.unpack('!H', await reader.readexactly(2))[0]
+    elif length == 127:
+        length = struct.unpack('!Q', await reader.readexactly(8))[0]
+    if length > MAX_BODY_BYTES:
+        raise ConnectionError("WebSocket çerçevesi çok büyük")
+
+    mask = await reader.readexactly(4) if masked else b''
+    payload = await reader.readexactly(length)
+
+    if masked and length:
+        # Maskeyi tek bir büyük tamsayı XOR'u ile uygula
+        full_mask = (mask * (length // 4 + 1))[:length]
+        payload = (
+            int.from_bytes(payload, 'big') ^ int.from_bytes(full_mask, 'big')
+        ).to_bytes(length, 'big')
+
+    # Çerçevenin tamamı okunduktan sonra reddet; akış hizası bozulmaz
+    if not fin or opcode == 0x0:
+        raise UnsupportedFrame(f"Parçalı WebSocket çerçevesi (opcode {opcode})")
+    return opcode, payload
+
+
+def encode_ws_frame(payload: bytes, opcode: int = 0x1, mask: bytes = b'') -> bytes:
+    """
+    WebSocket çerçevesi oluştur
+
+    Args:
+        payload: Gönderilecek veri
+        opcode: Çerçeve türü (varsayılan metin)
+        mask: İstemci tarafı için 4 baytlık maske (sunucu maskelemez)
+
+    Returns:
+        Çerçeve baytları
+    """
+    length = len(payload)
+    mask_bit = 0x80 if mask else 0
+    header = bytes([0x80 | opcode])
+
+    if length < 126:
+        header += bytes([mask_bit | length])
+    elif length < 65536:
+        header += bytes([mask_bit | 126]) + struct.pack('!H', length)
+    else:
+        header += bytes([mask_bit | 127]) + struct.pack('!Q', length)
+
+    if mask and length:
+        full_mask = (mask * (length // 4 + 1))[:length]
+        payload = (
+            int.from_bytes(payload, 'big') ^ int.from_bytes(full_mask, 'big')
+        ).to_bytes(length, 'big')
+
+    return header + mask + payload
+
+
+async def serve(host: str = '127.0.0.1', port: int = 8765,
+                capacity: int = 10000, ttl: float = 1800.0,
+                spill_dir: Optional[str] = None, word_sources: Optional[List[str]] = None,
+                spill_capacity: int = DEFAULT_SPILL_CAPACITY):
+    """
+    Sunucuyu başlat ve sonsuza kadar çalıştır
+
+    Args:
+        host: Dinlenecek adres
+        port: Dinlenecek port
+        capacity: Bellekte tutulacak en fazla oturum
+        ttl: Oturum boşta kalma süresi (saniye)
+        spill_dir: Çıkarılan oturumların yazılacağı dizin
+        word_sources: Kelime kaynakları öncelik sırasıyla (None ise en hızlı kullanılabilir)
+        spill_capacity: spill_dir içinde tutulacak en fazla oturum dosyası
+    """
+    registry = SessionRegistry(capacity=capacity, ttl=ttl, spill_dir=spill_dir,
+                               spill_capacity=spill_capacity)
+    game_server = GameServer(WordManager(word_sources), host=host, port=port, sessions=registry)
+    game_server.preload()
+    server = await game_server.start()
+    async with server:
+        await server.serve_forever()
+
+
+if __name__ == '__main__':
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Wordle oyun sunucusu")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--capacity', type=int, default=10000)
+    parser.add_argument('--ttl', type=float, default=1800.0)
+    parser.add_argument('--spill-dir', default=None)
+    parser.add_argument('--spill-capacity', type=int, default=DEFAULT_SPILL_CAPACITY)
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="Prometheus /metrics için yerel port")
+    parser.add_argument('--word-sources', default=None,
+                        help="Virgülle ayrılmış kelime kaynakları (ör. bundle,text)")
+    args = parser.parse_args()
+
+    if args.metrics_port is not None:
+        port = REGISTRY.start_http_server(args.metrics_port)
+        print(f"✓ Metrikler http://127.0.0.1:{port}/metrics adresinde")
+
+    try:
+        word_sources = args.word_sources.split(',') if args.word_sources else None
+        asyncio.run(serve(args.host, args.port, args.capacity, args.ttl, args.spill_dir,
+                          word_sources, args.spill_capacity))
+    except KeyboardInterrupt:
+        print("\nSunucu durduruldu")
@@ -0,0 +1,310 @@
+"""
+Oturum Kayıt Modülü
+Çok sayıda eşzamanlı GameLogic oturumunu sınırlı bellekle tutar
+
+Kapasite aşıldığında en uzun süredir kullanılmayan (LRU) oturum, boşta
+kalma süresi (TTL) dolduğunda ise süresi dolan oturum çıkarılır. İsteğe
+bağlı olarak kapasite yüzünden çıkarılan oyunlar diske kompakt anlık
+görüntü olarak yazılır ve sonraki erişimde yeniden canlandırılır. Diske
+yazılan oturumlara da aynı TTL uygulanır ve dizindeki dosya sayısı
+spill_capacity ile sınırlıdır; süresi dolan veya sınırı aşan dosyalar silinir.
+
+Tüm işlemler iş parçacığı güvenlidir; disk taşması kullanıldığında
+çağıranlar kaydı olay döngüsü dışında (ör. run_in_executor) kullanabilir.
+"""
+
+import json
+import os
+import re
+import threading
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, Optional, Tuple
+
+from game_logic import GameLogic
+from persistence import atomic_write_json
+
+
+# Diske yazılabilecek oturum kimlikleri (dizin dışına çıkmayı engeller)
+SESSION_ID_PATTERN = re.compile(r'^[A-Za-z0-9_-]{1,64}$')
+DEFAULT_SPILL_CAPACITY = 100000
+
+
+class SessionRegistry:
+    """LRU ve TTL ile sınırlandırılmış oturum kaydı"""
+
+    def __init__(self, capacity: int = 10000, ttl: Optional[float] = 1800.0,
+                 spill_dir: Optional[str] = None,
+                 clock: Callable[[], float] = time.monotonic,
+                 spill_capacity: int = DEFAULT_SPILL_CAPACITY):
+        """
+        Oturum kaydını başlat
+
+        Args:
+            capacity: Bellekte tutulacak en fazla oturum sayısı
+            ttl: Boşta kalma süresi (saniye, None ise süresiz)
+            spill_dir: Çıkarılan oturumların yazılacağı dizin (None ise atılır)
+            clock: Zaman kaynağı (testler için değiştirilebilir)
+            spill_capacity: Dizinde tutulacak en fazla oturum dosyası
+        """
+        self.capacity = capacity
+        self.ttl = ttl
+        self.spill_dir = spill_dir
+        self.clock = clock
+        self.spill_capacity = spill_capacity
+        self._lock = threading.RLock()
+        # session_id -> (GameLogic, son_erişim); sıra = LRU sırası
+        self._sessions: 'OrderedDict[str, Tuple[GameLogic, float]]' = OrderedDict()
+        # Diskteki oturumlar: session_id -> son_erişim; sıra = yazılma sırası
+        self._spilled: 'OrderedDict[str, float]' = OrderedDict()
+        self._metrics = {
+            'hits': 0,
+            'misses': 0,
+            'evictions': 0,
+            'expirations': 0,
+            'spills': 0,
+            'revivals': 0,
+            'spill_errors': 0,
+            'spill_expirations': 0,
+            'spill_drops': 0
+        }
+
+        if self.spill_dir:
+            os.makedirs(self.spill_dir, exist_ok=True)
+            self._adopt_spilled()
+
+    def _adopt_spilled(self):
+        """
+        Önceki çalıştırmadan kalan dosyaları dizine ekle
+
+        Dosyaların son erişimi saat kaynağıyla karşılaştırılamadığından
+        şimdi erişilmiş sayılırlar (en eskiden en yeniye); TTL bu andan işler.
+        """
+        now = self.clock()
+        entries = []
+        for entry in os.scandir(self.spill_dir):
+            session_id, ext = os.path.splitext(entry.name)
+            if ext == '.json' and SESSION_ID_PATTERN.match(session_id) and entry.is_file():
+                entries.append((entry.stat().st_mtime, session_id))
+        for _, session_id in sorted(entries):
+            self._spilled[session_id] = now
+        self._trim_spilled()
+
+    def put(self, session_id: str, game: GameLogic):
+        """
+        Oturum ekle veya güncelle
+
+        Args:
+            session_id: Oturum kimliği
+            game: GameLogic nesnesi
+        """
+        with self._lock:
+            now = self.clock()
+            self._sessions[session_id] = (game, now)
+            self._sessions.move_to_end(session_id)
+
+            self.evict_expired(now)
+            while len(self._sessions) > self.capacity:
+                oldest_id, (oldest_game, last_access) = self._sessions.popitem(last=False)
+                self._metrics['evictions'] += 1
+                self._spill(oldest_id, oldest_game, last_access)
+
+    def get(self, session_id: str) -> Optional[GameLogic]:
+        """
+        Oturumu al ve son erişim zamanını güncelle
+
+        Bellekte yoksa diskteki anlık görüntüden canlandırılır.
+
+        Args:
+            session_id: Oturum kimliği
+
+        Returns:
+            GameLogic nesnesi veya None
+        """
+        with self._lock:
+            now = self.clock()
+            self.evict_expired(now)
+
+            entry = self._sessions.get(session_id)
+            if entry is not None:
+                self._metrics['hits'] += 1
+                self._sessions[session_id] = (entry[0], now)
+                self._sessions.move_to_end(session_id)
+                return entry[0]
+
+            game = self._revive(session_id)
+            if game is None:
+                self._metrics['misses'] += 1
+                return None
+
+            self._metrics['revivals'] += 1
+            self.put(session_id, game)
+            return game
+
+    def touch(self, session_id: str) -> bool:
+        """
+        Oturumun son erişim zamanını güncelle
+
+        Args:
+            session_id: Oturum kimliği
+
+        Returns:
+            Oturum bellekteyse True
+        """
+        with self._lock:
+            entry = self._sessions.get(session_id)
+            if entry is None:
+                return False
+            self._sessions[session_id] = (entry[0], self.clock())
+            self._sessions.move_to_end(session_id)
+            return True
+
+    def remove(self, session_id: str) -> bool:
+        """
+        Oturumu bellekten ve diskten sil
+
+        Args:
+            session_id: Oturum kimliği
+
+        Returns:
+            Oturum bulunduysa True
+        """
+        with self._lock:
+            found = self._sessions.pop(session_id, None) is not None
+            if self._spilled.pop(session_id, None) is not None:
+                self._delete_spill(session_id)
+                found = True
+            return found
+
+    def evict_expired(self, now: Optional[float] = None) -> int:
+        """
+        Süresi dolan oturumları bellekten ve diskten çıkar
+
+        Süresi dolan oturum diske yazılmaz, atılır. LRU sırası erişim zamanı
+        sırasıyla aynı olduğundan yalnızca baştaki oturumlara bakmak yeterlidir;
+        diskteki oturumlar da yazılma (yaklaşık son erişim) sırasıyla tutulur.
+
+        Args:
+            now: Şu anki zaman (None ise clock kullanılır)
+
+        Returns:
+            Çıkarılan bellekteki oturum sayısı
+        """
+        if self.ttl is None:
+            return 0
+        if now is None:
+            now = self.clock()
+
+        expired = 0
+        with self._lock:
+            while self._sessions:
+                session_id, (_, last_access) = next(iter(self._sessions.items()))
+                if now - last_access < self.ttl:
+                    break
+                del self._sessions[session_id]
+                expired += 1
+
+            while self._spilled:
+                session_id, last_access = next(iter(self._spilled.items()))
+                if now - last_access < self.ttl:
+                    break
+                del self._spilled[session_id]
+                self._delete_spill(session_id)
+                self._metrics['spill_expirations'] += 1
+
+            self._metrics['expirations'] += expired
+        return expired
+
+    def _spill_path(self, session_id: str) -> Optional[str]:
+        """Oturumun anlık görüntü dosya yolunu döndür"""
+        if not self.spill_dir or not SESSION_ID_PATTERN.match(session_id):
+            return None
+        return os.path.join(self.spill_dir, f"{session_id}.json")
+
+    def _spill(self, session_id: str, game: GameLogic, last_access: float):
+        """Çıkarılan oturumu diske atomik olarak yaz"""
+        path = self._spill_path(session_id)
+        if path is None:
+            return
+
+        try:
+            # Oturumlar yeniden üretilebilir; fsync maliyetine gerek yok
+            atomic_write_json(path, game.to_snapshot(), fsync=False)
+            self._metrics['spills'] += 1
+        except Exception as e:
+            self._metrics['spill_errors'] += 1
+            print(f"Oturum diske yazılamadı ({session_id}): {e}")
+            return
+
+        self._spilled[session_id] = last_access
+        self._spilled.move_to_end(session_id)
+        self._trim_spilled()
+
+    def _trim_spilled(self):
+        """Dizindeki dosya sayısını spill_capacity ile sınırla (en eskiler silinir)"""
+        while len(self._spilled) > self.spill_capacity:
+            session_id, _ = self._spilled.popitem(last=False)
+            self._delete_spill(session_id)
+            self._metrics['spill_drops'] += 1
+
+    def _delete_spill(self, session_id: str):
+        """Oturumun diskteki dosyasını sil"""
+        try:
+            os.remove(self._spill_path(session_id))
+        except OSError:
+            pass
+
+    def _revive(self, session_id: str) -> Optional[GameLogic]:
+        """Diskteki anlık görüntüden oturumu yükle ve dosyayı sil"""
+        if self._spilled.pop(session_id, None) is None:
+            return None
+
+        path = self._spill_path(session_id)
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                game = GameLogic.from_snapshot(json.load(f))
+            return game
+        except Exception as e:
+            print(f"Oturum geri yüklenemedi ({session_id}): {e}")
+            return None
+        finally:
+            self._delete_spill(session_id)
+
+    def __len__(self) -> int:
+        return len(self._sessions)
+
+    def __contains__(self, session_id: str) -> bool:
+        with self._lock:
+            return session_id in self._sessions
+
+    def get_metrics(self) -> Dict:
+        """
+        Kayıt metriklerini döndür
+
+        Returns:
+            Metrik dictionary'si
+        """
+        with self._lock:
+            metrics = dict(self._metrics)
+            metrics['size'] = len(self._sessions)
+            metrics['spilled'] = len(self._spilled)
+        lookups = metrics['hits'] + metrics['misses'] + metrics['revivals']
+        metrics['capacity'] = self.capacity
+        metrics['hit_rate'] = (metrics['hits'] / lookups * 100) if lookups else 0.0
+        return metrics
+
+
+# Test fonksiyonu
+if __name__ == '__main__':
+    """Modül testleri"""
+    print("=== Oturum Kaydı Test ===\n")
+
+    registry = SessionRegistry(capacity=2, ttl=None)
+    registry.put('a', GameLogic('ELMA', 6, verbose=False))
+    registry.put('b', GameLogic('ARMUT', 6, verbose=False))
+    registry.get('a')
+    registry.put('c', GameLogic('KİRAZ', 6, verbose=False))
+
+    print(f"a bellekte: {'a' in registry}")
+    print(f"b bellekte: {'b' in registry}")
+    print(f"Metrikler: {registry.get_metrics()}")
@@ -5,132 +5,70 @@ Oyuncu performansını takip eder ve analiz eder
 
 import json
 import os
-from datetime import datetime
-from typing import Dict, List, Optional
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import nullcontext
+from datetime import date, datetime
+from typing import Dict, Iterator, List, Optional, Tuple
 
+from metrics import REGISTRY, GAMES_TOTAL, STATS_SAVE_SECONDS
+from persistence import FileLock, FlushScheduler, WriteBehind, atomic_write_bytes
+from history import GameHistory, GameRecord
 
-class Statistics:
-    """Oyun istatistiklerini yöneten sınıf"""
+
+STATS_WRITES_TOTAL = REGISTRY.counter(
+    'wordle_stats_writes_total', 'İstatistik dosyası yazma denemeleri', ('result',)
+)
+
+# Günlük halka tamponlarının uzunluğu (en uzun kayan pencere)
+ROLLING_DAYS = 30
+
+
+def day_number(timestamp: float) -> int:
+    """Unix zamanını yerel takvim günü sırasına çevir (date.toordinal)"""
+    return date.fromtimestamp(timestamp).toordinal()
+
+
+class StatisticsBase(ABC):
+    """
+    İstatistik sorgularının ortak temeli
     
-    def __init__(self, stats_file: str = 'statistics.json'):
-        """
-        İstatistik yöneticisini başlat
-        
-        Args:
-            stats_file: İstatistik dosyasının yolu
-        """
-        self.stats_file = stats_file
-        self.stats = self.load_stats()
-        
-    def load_stats(self) -> Dict:
-        """
-        İstatistikleri dosyadan yükle
+    Alt sınıflar stats özelliğini (_default_stats biçiminde bir dictionary)
+    ve yazma işlemlerini (record_game, reset_stats, flush, close) sağlar.
+    """
+    
+    stats: Dict
+    
+    @abstractmethod
+    def record_game(self, won: bool, attempts: int, word_length: int, language: str,
+                    duration: float = 0.0, word_id: int = -1):
+        """Oyun sonucunu kaydet"""
         
-        Returns:
-            İstatistik dictionary'si
-        """
-        default_stats = {
-            'games_played': 0,
-            'games_won': 0,
-            'current_streak': 0,
-            'max_streak': 0,
-            'guess_distribution': {
-                '1': 0,
-                '2': 0,
-                '3': 0,
-                '4': 0,
-                '5': 0,
-                '6': 0,
-                '7': 0
-            },
-            'total_guesses': 0,
-            'best_game': None,  # En az tahminde kazanma
-            'last_played': None,
-            'by_word_length': {
-                '5': {'played': 0, 'won': 0},
-                '6': {'played': 0, 'won': 0},
-                '7': {'played': 0, 'won': 0}
-            },
-            'by_language': {
-                'tr': {'played': 0, 'won': 0},
-                'en': {'played': 0, 'won': 0}
-            }
-        }
+    @abstractmethod
+    def reset_stats(self):
+        """Tüm istatistikleri sıfırla"""
         
-        if os.path.exists(self.stats_file):
-            try:
-                with open(self.stats_file, 'r', encoding='utf-8') as f:
-                    loaded_stats = json.load(f)
-                    # Eksik anahtarları ekle
-                    for key, value in default_stats.items():
-                        if key not in loaded_stats:
-                            loaded_stats[key] = value
-                    return loaded_stats
-            except Exception as e:
-                print(f"İstatistikler yüklenirken hata: {e}")
-                
-        return default_stats
+    @abstractmethod
+    def query(self, since: Optional[float] = None, language: Optional[str] = None,
+              word_length: Optional[int] = None) -> Dict:
+        """Filtrelenmiş oyunların özetini hesapla (bkz. GameHistory.query)"""
         
-    def save_stats(self):
-        """İstatistikleri dosyaya kaydet"""
-        try:
-            with open(self.stats_file, 'w', encoding='utf-8') as f:
-                json.dump(self.stats, f, indent=4, ensure_ascii=False)
-        except Exception as e:
-            print(f"İstatistikler kaydedilirken hata: {e}")
-            
-    def record_game(self, won: bool, attempts: int, word_length: int, language: str):
-        """
-        Oyun sonucunu kaydet
+    @abstractmethod
+    def iter_games(self, since: Optional[float] = None, language: Optional[str] = None,
+                   word_length: Optional[int] = None) -> Iterator[GameRecord]:
+        """Oyunları kayıt sırasıyla akış halinde döndür"""
         
-        Args:
-            won: Oyun kazanıldı mı
-            attempts: Kullanılan tahmin sayısı
-            word_length: Kelime uzunluğu
-            language: Oyun dili
-        """
-        self.stats['games_played'] += 1
-        self.stats['last_played'] = datetime.now().isoformat()
+    @abstractmethod
+    def _daily_buckets(self, first_day: int, last_day: int) -> Dict[int, Tuple[int, int, int, int]]:
+        """Gün aralığındaki {gün: (oynanan, kazanılan, tahmin, gün_sonu_serisi)} değerleri"""
         
-        # Kelime uzunluğuna göre istatistik
-        length_key = str(word_length)
-        if length_key in self.stats['by_word_length']:
-            self.stats['by_word_length'][length_key]['played'] += 1
-            
-        # Dile göre istatistik
-        if language in self.stats['by_language']:
-            self.stats['by_language'][language]['played'] += 1
+    def flush(self) -> bool:
+        """Bekleyen değişiklikleri diske yaz"""
+        return True
         
-        if won:
-            self.stats['games_won'] += 1
-            self.stats['current_streak'] += 1
-            self.stats['total_guesses'] += attempts
-            
-            # Kelime uzunluğuna göre kazanma
-            if length_key in self.stats['by_word_length']:
-                self.stats['by_word_length'][length_key]['won'] += 1
-                
-            # Dile göre kazanma
-            if language in self.stats['by_language']:
-                self.stats['by_language'][language]['won'] += 1
-            
-            # Maksimum seriyi güncelle
-            if self.stats['current_streak'] > self.stats['max_streak']:
-                self.stats['max_streak'] = self.stats['current_streak']
-            
-            # Tahmin dağılımını güncelle
-            attempt_key = str(attempts)
-            if attempt_key in self.stats['guess_distribution']:
-                self.stats['guess_distribution'][attempt_key] += 1
-            
-            # En iyi oyunu güncelle
-            if self.stats['best_game'] is None or attempts < self.stats['best_game']:
-                self.stats['best_game'] = attempts
-        else:
-            # Kaybedildiğinde seriyi sıfırla
-            self.stats['current_streak'] = 0
-            
-        self.save_stats()
+    def close(self):
+        """Kaynakları serbest bırak"""
         
     def get_win_rate(self) -> float:
         """
@@ -209,11 +147,60 @@ class Statistics:
         summary['distribution_percentages'] = self.get_distribution_percentages()
         summary['by_word_length'] = self.stats['by_word_length']
         summary['by_language'] = self.stats['by_language']
+        summary['last_7_days'] = self.get_rolling_stats(7)
+        summary['last_30_days'] = self.get_rolling_stats(30)
         return summary
         
-    def reset_stats(self):
-        """Tüm istatistikleri sıfırla"""
-        self.stats = {
+    def get_rolling_stats(self, days: int = 7, now: Optional[float] = None) -> Dict:
+        """
+        Son N günün istatistiklerini günlük kovalardan hesapla (O(gün))
+        
+        Args:
+            days: Pencere uzunluğu (en fazla ROLLING_DAYS)
+            now: Şu anki unix zamanı (None ise şimdi)
+            
+        Returns:
+            {days, played, won, win_rate, average_guesses, max_streak,
+             played_per_day, streak_trend} dictionary'si. Trend listeleri
+            eskiden yeniye sıralıdır; oyun olmayan günlerin serisi None'dır.
+        """
+        if not 1 <= days <= ROLLING_DAYS:
+            raise ValueError(f"Pencere 1-{ROLLING_DAYS} gün olmalı")
+            
+        today = day_number(time.time() if now is None else now)
+        first_day = today - days + 1
+        buckets = self._daily_buckets(first_day, today)
+        
+        played = won = guesses = 0
+        played_per_day = []
+        streak_trend = []
+        for day in range(first_day, today + 1):
+            bucket = buckets.get(day)
+            if bucket is None:
+                played_per_day.append(0)
+                streak_trend.append(None)
+                continue
+            played += bucket[0]
+            won += bucket[1]
+            guesses += bucket[2]
+            played_per_day.append(bucket[0])
+            streak_trend.append(bucket[3])
+            
+        return {
+            'days': days,
+            'played': played,
+            'won': won,
+            'win_rate': round(won / played * 100, 1) if played else 0.0,
+            'average_guesses': round(guesses / won, 2) if won else 0.0,
+            'max_streak': max((s for s in streak_trend if s is not None), default=0),
+            'played_per_day': played_per_day,
+            'streak_trend': streak_trend
+        }
+        
+    @staticmethod
+    def _default_stats() -> Dict:
+        """Boş istatistik yapısını döndür"""
+        return {
             'games_played': 0,
             'games_won': 0,
             'current_streak': 0,
@@ -224,6 +211,17 @@ class Statistics:
             'total_guesses': 0,
             'best_game': None,
             'last_played': None,
+            'history_count': 0,
+            # Her sıfırlamada artar; diğer süreçler sıfırlamayı buradan anlar
+            'reset_epoch': 0,
+            # Son ROLLING_DAYS gün için günlük halka tamponları (indeks = gün % ROLLING_DAYS)
+            'daily': {
+                'day': [0] * ROLLING_DAYS,
+                'played': [0] * ROLLING_DAYS,
+                'won': [0] * ROLLING_DAYS,
+                'guesses': [0] * ROLLING_DAYS,
+                'streak': [0] * ROLLING_DAYS
+            },
             'by_word_length': {
                 '5': {'played': 0, 'won': 0},
                 '6': {'played': 0, 'won': 0},
@@ -234,8 +232,6 @@ class Statistics:
                 'en': {'played': 0, 'won': 0}
             }
         }
-        self.save_stats()
-        print("İstatistikler sıfırlandı")
         
     def export_stats(self, filename: str = 'stats_export.json'):
         """
@@ -256,6 +252,405 @@ class Statistics:
             print(f"İstatistikler dışa aktarılırken hata: {e}")
 
 
+class Statistics(StatisticsBase):
+    """Oyun istatistiklerini JSON dosyası ve geçmiş günlüğüyle yöneten sınıf"""
+    
+    def __init__(self, stats_file: str = 'statistics.json',
+                 flush_delay: Optional[float] = 2.0,
+                 history_file: Optional[str] = None,
+                 history_keep_open: bool = True,
+                 flush_scheduler: Optional[FlushScheduler] = None,
+                 read_only: bool = False):
+        """
+        İstatistik yöneticisini başlat
+        
+        Toplamlar, oyun geçmişi günlüğünün bir kontrol noktasıdır: dosyada
+        kaç kaydın işlendiği (history_count) tutulur ve açılışta yalnızca
+        sonraki kayıtlar toplamlara eklenir.
+        
+        Aynı dosyaları kullanan birden fazla süreç (iki uygulama örneği,
+        sunucu işçileri) güvenle kayıt yapabilir: günlüğe ekleme ve
+        toplamların yazılması stats_file + '.lock' dosya kilidi altında
+        yapılır ve her süreç yazmadan önce diğerlerinin eklediği kayıtları
+        kendi toplamlarına katar. Böylece hiçbir oyun kaybolmaz.
+        
+        Args:
+            stats_file: İstatistik dosyasının yolu
+            flush_delay: Değişikliklerin arka planda yazılmadan önce
+                birleştirileceği süre (saniye). None veya 0 ise her
+                kaydetme hemen (yine atomik olarak) yapılır.
+            history_file: Oyun geçmişi günlüğü (None ise stats_file yanında .history)
+            history_keep_open: Günlüğün ekleme tanıtıcısı açık tutulsun mu
+            flush_scheduler: Gecikmeli yazmayı yapacak paylaşılan zamanlayıcı
+                (None ise kendi zamanlayıcı iş parçacığı kullanılır)
+            read_only: True ise dosyalara (kilit dosyası dahil) hiç yazılmaz;
+                günlükteki yeni kayıtlar yalnızca bellekteki toplamlara katılır
+                ve değiştiren çağrılar PermissionError fırlatır
+        """
+        self.stats_file = stats_file
+        self.flush_delay = flush_delay
+        self.read_only = read_only
+        self._lock = threading.RLock()
+        self._file_lock = FileLock(stats_file + '.lock')
+        self._writer = WriteBehind(self._write_stats, flush_delay or 0, flush_scheduler)
+        # Diskteki dosyanın ((mtime, boyut), reset_epoch) önbelleği
+        self._disk_epoch_cache: Tuple[Optional[Tuple[int, int]], int] = (None, 0)
+        if history_file is None:
+            history_file = os.path.splitext(stats_file)[0] + '.history'
+        
+        # Salt okunur açılışta kilit dosyası da oluşturulmaz
+        file_lock = nullcontext() if read_only else self._file_lock
+        with self._lock, file_lock:
+            # Günlük açılırken yarım kalan kuyruk kesilir; başka bir süreç o
+            # sırada kayıt ekliyor olabileceğinden bu da kilit altında yapılır
+            self.history = GameHistory(history_file, keep_open=history_keep_open,
+                                       read_only=read_only)
+            self.stats = self.load_stats()
+            replayed = self._catch_up()
+        if replayed and not read_only:
+            print(f"Geçmişten {replayed} oyun toplamlara eklendi")
+            self.save_stats()
+        
+    def load_stats(self) -> Dict:
+        """
+        İstatistikleri dosyadan yükle
+        
+        Returns:
+            İstatistik dictionary'si
+        """
+        default_stats = self._default_stats()
+        
+        if os.path.exists(self.stats_file):
+            try:
+                with open(self.stats_file, 'r', encoding='utf-8') as f:
+                    loaded_stats = json.load(f)
+                    # Eksik anahtarları ekle
+                    for key, value in default_stats.items():
+                        if key not in loaded_stats:
+                            loaded_stats[key] = value
+                    return loaded_stats
+            except Exception as e:
+                print(f"İstatistikler yüklenirken hata: {e}")
+                
+        return default_stats
+        
+    def save_stats(self):
+        """
+        İstatistikleri kaydet
+        
+        flush_delay ayarlıysa yazma kirli bayrakla birleştirilir ve arka
+        plan iş parçacığında yapılır; aksi halde hemen yazılır.
+        """
+        self._check_writable()
+        self._writer.mark_dirty()
+            
+    def flush(self) -> bool:
+        """
+        Bekleyen değişiklikleri hemen diske yaz (uygulama duraklatılırken/kapanırken)
+        
+        Returns:
+            Başarılıysa True
+        """
+        return self._writer.flush()
+        
+    def close(self):
+        """Zamanlayıcıyı durdur, bekleyen değişiklikleri yaz ve günlüğü kapat"""
+        self._writer.close()
+        self.history.close()
+        
+    def get_write_stats(self) -> Dict[str, int]:
+        """
+        Dosya yazma sayaçlarını döndür
+        
+        Returns:
+            {writes, failures, coalesced} dictionary'si
+        """
+        return self._writer.get_stats()
+        
+    def _check_writable(self):
+        """Salt okunur açılmış depoda değişikliği reddet"""
+        if self.read_only:
+            raise PermissionError(f"İstatistikler salt okunur açıldı: {self.stats_file}")
+            
+    def _write_stats(self):
+        """İstatistikleri geçici dosya + fsync + yeniden adlandırma ile yaz"""
+        try:
+            with STATS_SAVE_SECONDS.time():
+                # Yazmadan önce diğer süreçlerin kayıtlarını kat; kilit altında
+                # yazıldığı için diskteki kontrol noktası hiç geriye gitmez
+                with self._lock, self._file_lock:
+                    self._catch_up()
+                    self._dump_stats()
+            STATS_WRITES_TOTAL.inc(result='ok')
+        except Exception:
+            STATS_WRITES_TOTAL.inc(result='error')
+            raise
+            
+    def _dump_stats(self):
+        """Toplamları atomik olarak yaz (self._lock ve dosya kilidi tutulurken)"""
+        payload = json.dumps(self.stats, ensure_ascii=False, separators=(',', ':'))
+        atomic_write_bytes(self.stats_file, payload.encode('utf-8'))
+        st = os.stat(self.stats_file)
+        self._disk_epoch_cache = ((st.st_mtime_ns, st.st_size), self.stats['reset_epoch'])
+        
+    def _disk_epoch(self) -> int:
+        """
+        Diskteki toplamların reset_epoch değerini oku
+        
+        Dosya yalnızca değiştiğinde (mtime veya boyut) yeniden okunur.
+        
+        Returns:
+            Dosyadaki reset_epoch (dosya yoksa bellekteki değer)
+        """
+        try:
+            st = os.stat(self.stats_file)
+        except OSError:
+            return self.stats.get('reset_epoch', 0)
+        stamp = (st.st_mtime_ns, st.st_size)
+        cached_stamp, epoch = self._disk_epoch_cache
+        if stamp != cached_stamp:
+            try:
+                with open(self.stats_file, 'r', encoding='utf-8') as f:
+                    epoch = json.load(f).get('reset_epoch', 0)
+            except (OSError, ValueError) as e:
+                print(f"İstatistik dosyası okunamadı: {e}")
+                return self.stats.get('reset_epoch', 0)
+            self._disk_epoch_cache = (stamp, epoch)
+        return epoch
+        
+    def record_game(self, won: bool, attempts: int, word_length: int, language: str,
+                    duration: float = 0.0, word_id: int = -1):
+        """
+        Oyun sonucunu kaydet
+        
+        Oyun dosya kilidi altında geçmiş günlüğüne eklenir, ardından
+        toplamlar günlüğün sonuna kadar (diğer süreçlerin eklediği oyunlar
+        dahil) artımlı olarak ilerletilir.
+        
+        Args:
+            won: Oyun kazanıldı mı
+            attempts: Kullanılan tahmin sayısı
+            word_length: Kelime uzunluğu
+            language: Oyun dili
+            duration: Oyun süresi (saniye)
+            word_id: Gizli kelimenin listedeki sırası (-1 ise bilinmiyor)
+        """
+        self._check_writable()
+        record = GameRecord(int(time.time()), language, word_length, attempts,
+                            won, int(duration * 1000), word_id)
+        with self._lock, self._file_lock:
+            try:
+                self.history.append(record)
+            except OSError as e:
+                # Günlüğe yazılamasa da bu süreçteki toplamlara ekle
+                print(f"Oyun geçmişe eklenemedi: {e}")
+                self._apply_record(record)
+            self._catch_up()
+        GAMES_TOTAL.inc(language=language, result='won' if won else 'lost')
+            
+        self.save_stats()
+        
+    def _apply_record(self, record: GameRecord):
+        """Tek bir geçmiş kaydını toplamlara ekle"""
+        self.stats['games_played'] += 1
+        self.stats['last_played'] = datetime.fromtimestamp(record.timestamp).isoformat()
+        
+        # Kelime uzunluğuna göre istatistik
+        length_key = str(record.word_length)
+        if length_key in self.stats['by_word_length']:
+            self.stats['by_word_length'][length_key]['played'] += 1
+            
+        # Dile göre istatistik
+        if record.language in self.stats['by_language']:
+            self.stats['by_language'][record.language]['played'] += 1
+        
+        if record.won:
+            self.stats['games_won'] += 1
+            self.stats['current_streak'] += 1
+            self.stats['total_guesses'] += record.attempts
+            
+            # Kelime uzunluğuna göre kazanma
+            if length_key in self.stats['by_word_length']:
+                self.stats['by_word_length'][length_key]['won'] += 1
+                
+            # Dile göre kazanma
+            if record.language in self.stats['by_language']:
+                self.stats['by_language'][record.language]['won'] += 1
+            
+            # Maksimum seriyi güncelle
+            if self.stats['current_streak'] > self.stats['max_streak']:
+                self.stats['max_streak'] = self.stats['current_streak']
+            
+            # Tahmin dağılımını güncelle
+            attempt_key = str(record.attempts)
+            if attempt_key in self.stats['guess_distribution']:
+                self.stats['guess_distribution'][attempt_key] += 1
+            
+            # En iyi oyunu güncelle
+            if self.stats['best_game'] is None or record.attempts < self.stats['best_game']:
+                self.stats['best_game'] = record.attempts
+        else:
+            # Kaybedildiğinde seriyi sıfırla
+            self.stats['current_streak'] = 0
+            
+        self._update_daily(record)
+        
+    def _update_daily(self, record: GameRecord):
+        """Oyunu günlük halka tamponundaki kovasına ekle (O(1))"""
+        daily = self.stats['daily']
+        day = day_number(record.timestamp)
+        index = day % ROLLING_DAYS
+        
+        if daily['day'][index] != day:
+            if daily['day'][index] > day:
+                # Pencereden daha eski bir oyun (geriye dönük yeniden oynatma)
+                return
+            # Kova eski bir güne ait: yeni gün için sıfırla
+            daily['day'][index] = day
+            daily['played'][index] = 0
+            daily['won'][index] = 0
+            daily['guesses'][index] = 0
+            
+        daily['played'][index] += 1
+        if record.won:
+            daily['won'][index] += 1
+            daily['guesses'][index] += record.attempts
+        daily['streak'][index] = self.stats['current_streak']
+        
+    def _daily_buckets(self, first_day: int, last_day: int) -> Dict[int, Tuple[int, int, int, int]]:
+        """Halka tamponundan gün aralığındaki kovaları oku"""
+        daily = self.stats['daily']
+        buckets = {}
+        for day in range(first_day, last_day + 1):
+            index = day % ROLLING_DAYS
+            if daily['day'][index] == day:
+                buckets[day] = (daily['played'][index], daily['won'][index],
+                                daily['guesses'][index], daily['streak'][index])
+        return buckets
+        
+    def _catch_up(self) -> int:
+        """
+        Toplamları günlüğün sonuna kadar ilerlet
+        
+        self._lock ve dosya kilidi tutulurken çağrılır. Diğer süreçlerin
+        eklediği kayıtlar da burada katılır; toplamlar günlüğün saf bir
+        katlaması olduğundan aynı noktaya gelen her süreç aynı sonucu üretir.
+        
+        Returns:
+            Toplamlara eklenen kayıt sayısı
+        """
+        count = self.history.refresh()
+        checkpoint = self.stats.get('history_count', 0)
+        if checkpoint > count or self._disk_epoch() != self.stats.get('reset_epoch', 0):
+            # Başka bir süreç sıfırlamış (günlük yeniden büyümüş olabilir):
+            # bellekteki eski toplamları bırak, diskteki toplamlardan devam et
+            self.stats = self.load_stats()
+            # Günlük kesilmişse (elle silinmiş) toplamlara dokunma
+            checkpoint = min(self.stats.get('history_count', 0), count)
+            
+        replayed = 0
+        for record in self.history.iter_records(start=checkpoint):
+            self._apply_record(record)
+            replayed += 1
+        self.stats['history_count'] = checkpoint + replayed
+        return replayed
+        
+    def rebuild_from_history(self) -> int:
+        """
+        Toplamları tüm geçmişten yeniden hesapla (ör. bir hata düzeltmesinden sonra)
+        
+        Returns:
+            İşlenen kayıt sayısı
+        """
+        self._check_writable()
+        with self._lock, self._file_lock:
+            epoch = self.stats.get('reset_epoch', 0)
+            self.stats = self._default_stats()
+            self.stats['reset_epoch'] = epoch
+            self._catch_up()
+        self.save_stats()
+        return self.stats['history_count']
+        
+    def checkpoint(self) -> bool:
+        """
+        Toplamları kontrol noktası olarak hemen diske yaz
+        
+        Sonraki açılışta yalnızca bu noktadan sonraki kayıtlar işlenir;
+        günlüğün kendisi analiz için olduğu gibi korunur.
+        
+        Returns:
+            Başarılıysa True
+        """
+        self.save_stats()
+        return self.flush()
+        
+    def query(self, since: Optional[float] = None, language: Optional[str] = None,
+              word_length: Optional[int] = None) -> Dict:
+        """
+        Filtrelenmiş oyunların özetini geçmiş günlüğünden hesapla
+        
+        Args:
+            since: Yalnızca bu unix zamanından sonraki oyunlar
+            language: Yalnızca bu dil
+            word_length: Yalnızca bu uzunluk
+            
+        Returns:
+            {played, won, win_rate, average_attempts, average_duration} dictionary'si
+        """
+        return self.history.query(since, language, word_length)
+        
+    def iter_games(self, since: Optional[float] = None, language: Optional[str] = None,
+                   word_length: Optional[int] = None) -> Iterator[GameRecord]:
+        """
+        Oyunları geçmiş günlüğünden parça parça oku
+        
+        Args:
+            since: Yalnızca bu unix zamanından sonraki oyunlar
+            language: Yalnızca bu dil
+            word_length: Yalnızca bu uzunluk
+            
+        Yields:
+            GameRecord nesneleri
+        """
+        return self.history.iter_records(since=since, language=language,
+                                         word_length=word_length)
+        
+    def reset_stats(self):
+        """Tüm istatistikleri ve geçmişi sıfırla (diğer süreçler dahil)"""
+        self._check_writable()
+        with self._lock, self._file_lock:
+            epoch = max(self.stats.get('reset_epoch', 0), self._disk_epoch()) + 1
+            self.stats = self._default_stats()
+            self.stats['reset_epoch'] = epoch
+            self.history.clear()
+            # Diğer süreçler sıfırlamayı diskteki reset_epoch'tan görür; günlükle
+            # aynı kilit altında hemen yaz. WriteBehind burada kullanılmaz: onun
+            # zamanlayıcısı önce kendi kilidini, sonra bu kilitleri alır.
+            self._dump_stats()
+        print("İstatistikler sıfırlandı")
+
+
+def open_statistics(backend: str = 'json', stats_file: Optional[str] = None,
+                    **kwargs) -> StatisticsBase:
+    """
+    Ayara göre istatistik deposunu aç
+    
+    Args:
+        backend: 'json' (varsayılan, statistics.json + geçmiş günlüğü) veya 'sqlite'
+        stats_file: Depo dosyası (None ise arka uca göre varsayılan)
+        **kwargs: Arka uca özgü parametreler
+        
+    Returns:
+        Statistics veya SQLiteStatistics nesnesi
+    """
+    if backend == 'sqlite':
+        from statistics_sqlite import SQLiteStatistics
+        return SQLiteStatistics(stats_file or 'statistics.db', **kwargs)
+    if backend != 'json':
+        print(f"Bilinmeyen istatistik arka ucu: {backend}, JSON kullanılıyor")
+    return Statistics(stats_file or 'statistics.json', **kwargs)
+
+
 # Test fonksiyonu
 if __name__ == '__main__':
     """Modül testleri"""
@@ -308,8 +703,9 @@ if __name__ == '__main__':
     
     # Temizlik
     print("\n=== Temizlik ===")
-    if os.path.exists('test_statistics.json'):
-        os.remove('test_statistics.json')
-    if os.path.exists('test_export.json'):
-        os.remove('test_export.json')
+    stats.close()
+    for path in ('test_statistics.json', 'test_statistics.json.lock',
+                 stats.history.path, 'test_export.json'):
+        if os.path.exists(path):
+            os.remove(path)
     print("Test dosyaları silindi")
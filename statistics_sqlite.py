@@ -0,0 +1,586 @@
+"""
+SQLite İstatistik Modülü
+Statistics API'sinin SQLite veritabanı üzerinde çalışan sürümü
+
+Her oyun games tablosuna bir satır olarak eklenir. Toplamlar
+(game_totals, streak) tetikleyicilerle aynı işlemde güncellenir; böylece
+özet istatistikler milyonlarca satırda da küçük bir tablodan okunur.
+Tarih/dil/uzunluk filtreli sorgular kapsayan dizinden yanıtlanır.
+
+Veritabanı ilk kez oluşturulurken yanındaki statistics.json ve oyun
+geçmişi günlüğü otomatik olarak içe aktarılır.
+"""
+
+import json
+import os
+import sqlite3
+import threading
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, Iterator, Optional, Tuple
+
+from metrics import GAMES_TOTAL
+from history import GameHistory, GameRecord
+from statistics import StatisticsBase
+
+
+SCHEMA_VERSION = 2
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS games (
+    id INTEGER PRIMARY KEY,
+    played_at INTEGER NOT NULL,
+    language TEXT NOT NULL,
+    word_length INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    duration_ms INTEGER NOT NULL DEFAULT 0,
+    word_id INTEGER NOT NULL DEFAULT -1
+);
+CREATE INDEX IF NOT EXISTS idx_games_lang_len_date
+    ON games (language, word_length, played_at, won, attempts, duration_ms);
+CREATE INDEX IF NOT EXISTS idx_games_date ON games (played_at);
+
+CREATE TABLE IF NOT EXISTS game_totals (
+    language TEXT NOT NULL,
+    word_length INTEGER NOT NULL,
+    attempts INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    games INTEGER NOT NULL,
+    PRIMARY KEY (language, word_length, attempts, won)
+) WITHOUT ROWID;
+
+CREATE TABLE IF NOT EXISTS streak (
+    id INTEGER PRIMARY KEY CHECK (id = 1),
+    current INTEGER NOT NULL DEFAULT 0,
+    best INTEGER NOT NULL DEFAULT 0,
+    last_played INTEGER
+);
+INSERT OR IGNORE INTO streak (id) VALUES (1);
+
+-- Günlük kovalar; gün = date.toordinal() ile aynı yerel takvim günü
+CREATE TABLE IF NOT EXISTS daily (
+    day INTEGER PRIMARY KEY,
+    played INTEGER NOT NULL,
+    won INTEGER NOT NULL,
+    guesses INTEGER NOT NULL,
+    streak INTEGER
+);
+
+CREATE TABLE IF NOT EXISTS meta (
+    key TEXT PRIMARY KEY,
+    value TEXT NOT NULL
+);
+
+CREATE TRIGGER IF NOT EXISTS games_after_insert AFTER INSERT ON games
+BEGIN
+    INSERT INTO game_totals (language, word_length, attempts, won, games)
+        VALUES (NEW.language, NEW.word_length, NEW.attempts, NEW.won, 1)
+        ON CONFLICT DO UPDATE SET games = games + 1;
+    UPDATE streak SET
+        current = CASE WHEN NEW.won THEN current + 1 ELSE 0 END,
+        best = MAX(best, CASE WHEN NEW.won THEN current + 1 ELSE 0 END),
+        last_played = MAX(COALESCE(last_played, 0), NEW.played_at)
+    WHERE id = 1;
+    INSERT INTO daily (day, played, won, guesses, streak)
+        VALUES (
+            CAST(julianday(NEW.played_at, 'unixepoch', 'localtime') - 1721424.5 AS INTEGER),
+            1, NEW.won, CASE WHEN NEW.won THEN NEW.attempts ELSE 0 END,
+            (SELECT current FROM streak WHERE id = 1)
+        )
+        ON CONFLICT DO UPDATE SET
+            played = played + 1,
+            won = won + excluded.won,
+            guesses = guesses + excluded.guesses,
+            streak = excluded.streak;
+END;
+"""
+
+# Eski JSON toplamlarından, satır karşılığı olmayan sayaçlar
+BASELINE_COUNTERS = ('games_played', 'games_won', 'total_guesses')
+
+# Her oyunun ardından geçerli seri: son kayıptan bu yana (id sırasıyla) kazanılan oyunlar
+STREAK_ROWS = """
+SELECT id, played_at, won, attempts,
+       SUM(won) OVER (PARTITION BY losses ORDER BY id) AS streak
+FROM (SELECT id, played_at, won, attempts,
+             SUM(1 - won) OVER (ORDER BY id) AS losses
+      FROM games)
+"""
+
+
+class SQLiteStatistics(StatisticsBase):
+    """SQLite veritabanında tutulan oyun istatistikleri"""
+
+    def __init__(self, db_file: str = 'statistics.db',
+                 legacy_stats_file: Optional[str] = None,
+                 read_only: bool = False):
+        """
+        Veritabanını aç (yoksa oluştur ve eski verileri içe aktar)
+
+        Args:
+            db_file: Veritabanı dosyası (':memory:' da olabilir)
+            legacy_stats_file: İçe aktarılacak statistics.json
+                (None ise veritabanıyla aynı dizindeki statistics.json)
+            read_only: True ise var olan veritabanı salt okunur açılır; şema
+                oluşturma, yükseltme ve içe aktarma yapılmaz
+        """
+        self.db_file = db_file
+        self.read_only = read_only
+        self._lock = threading.Lock()
+        self._stats_cache: Optional[Dict] = None
+        self._stats_version = None
+        # Okuma bağlantıları veritabanını hiçbir zaman oluşturmaz veya değiştirmez
+        self._read_uri = (None if db_file == ':memory:'
+                          else Path(db_file).absolute().as_uri() + '?mode=ro')
+
+        if read_only:
+            self._conn = sqlite3.connect(self._read_uri, uri=True, isolation_level=None,
+                                         check_same_thread=False)
+            return
+
+        self._conn = sqlite3.connect(db_file, isolation_level=None,
+                                     check_same_thread=False)
+        # WAL: okuyucular yazarı beklemez; NORMAL: her işlemde fsync yok
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+
+        version = self._get_meta('schema_version')
+        created = version is None
+        with self._lock:
+            if not created and int(version) < 2:
+                # Tetikleyici günlük kovalarla yeniden oluşturulacak
+                self._conn.execute('DROP TRIGGER IF EXISTS games_after_insert')
+            self._conn.executescript(SCHEMA)
+        if not created and int(version) < SCHEMA_VERSION:
+            self._rebuild_daily()
+            self._set_meta('schema_version', str(SCHEMA_VERSION))
+        if created:
+            self._set_meta('schema_version', str(SCHEMA_VERSION))
+            if legacy_stats_file is None and db_file != ':memory:':
+                legacy_stats_file = os.path.join(
+                    os.path.dirname(os.path.abspath(db_file)), 'statistics.json'
+                )
+            if legacy_stats_file and os.path.exists(legacy_stats_file):
+                self.migrate_from_json(legacy_stats_file)
+
+    def _get_meta(self, key: str) -> Optional[str]:
+        """meta tablosundan değer oku (tablo yoksa None)"""
+        try:
+            row = self._conn.execute('SELECT value FROM meta WHERE key = ?', (key,)).fetchone()
+        except sqlite3.OperationalError:
+            return None
+        return row[0] if row else None
+
+    def _set_meta(self, key: str, value: str):
+        """meta tablosuna değer yaz"""
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO meta (key, value) VALUES (?, ?) '
+                'ON CONFLICT (key) DO UPDATE SET value = excluded.value', (key, value)
+            )
+
+    def record_game(self, won: bool, attempts: int, word_length: int, language: str,
+                    duration: float = 0.0, word_id: int = -1):
+        """
+        Oyun sonucunu tek bir INSERT ile kaydet (toplamlar tetikleyicide)
+
+        Args:
+            won: Oyun kazanıldı mı
+            attempts: Kullanılan tahmin sayısı
+            word_length: Kelime uzunluğu
+            language: Oyun dili
+            duration: Oyun süresi (saniye)
+            word_id: Gizli kelimenin listedeki sırası (-1 ise bilinmiyor)
+        """
+        with self._lock:
+            self._conn.execute(
+                'INSERT INTO games (played_at, language, word_length, attempts, won, '
+                'duration_ms, word_id) VALUES (?, ?, ?, ?, ?, ?, ?)',
+                (int(time.time()), language, word_length, attempts, int(won),
+                 int(duration * 1000), word_id)
+            )
+            self._stats_cache = None
+        GAMES_TOTAL.inc(language=language, result='won' if won else 'lost')
+
+    @property
+    def stats(self) -> Dict:
+        """
+        Toplamları Statistics.stats ile aynı biçimde döndür
+
+        Sonuç önbelleğe alınır; başka bir bağlantı yazdığında
+        PRAGMA data_version değiştiği için yeniden hesaplanır.
+        """
+        with self._lock:
+            version = self._conn.execute('PRAGMA data_version').fetchone()[0]
+            if self._stats_cache is None or version != self._stats_version:
+                self._stats_cache = self._build_stats()
+                self._stats_version = version
+            return self._stats_cache
+
+    def _build_stats(self) -> Dict:
+        """Toplam tablolarından istatistik dictionary'si oluştur"""
+        stats = self._default_stats()
+
+        rows = self._conn.execute(
+            'SELECT language, word_length, attempts, won, games FROM game_totals'
+        ).fetchall()
+        for language, word_length, attempts, won, games in rows:
+            stats['games_played'] += games
+            length_key = str(word_length)
+            by_length = stats['by_word_length'].get(length_key)
+            by_language = stats['by_language'].get(language)
+            if by_length is not None:
+                by_length['played'] += games
+            if by_language is not None:
+                by_language['played'] += games
+            if not won:
+                continue
+
+            stats['games_won'] += games
+            stats['total_guesses'] += attempts * games
+            if by_length is not None:
+                by_length['won'] += games
+            if by_language is not None:
+                by_language['won'] += games
+            attempt_key = str(attempts)
+            if attempt_key in stats['guess_distribution']:
+                stats['guess_distribution'][attempt_key] += games
+            if stats['best_game'] is None or attempts < stats['best_game']:
+                stats['best_game'] = attempts
+
+        current, best, last_played = self._conn.execute(
+            'SELECT current, best, last_played FROM streak WHERE id = 1'
+        ).fetchone()
+        stats['current_streak'] = current
+        stats['max_streak'] = best
+        if last_played:
+            stats['last_played'] = datetime.fromtimestamp(last_played).isoformat()
+
+        baseline = self._get_meta('baseline')
+        if baseline:
+            self._add_baseline(stats, json.loads(baseline))
+        return stats
+
+    @staticmethod
+    def _add_baseline(stats: Dict, baseline: Dict):
+        """Satır karşılığı olmayan içe aktarılmış toplamları ekle"""
+        for key in BASELINE_COUNTERS:
+            stats[key] += baseline.get(key, 0)
+        for key, count in baseline.get('guess_distribution', {}).items():
+            if key in stats['guess_distribution']:
+                stats['guess_distribution'][key] += count
+        for group in ('by_word_length', 'by_language'):
+            for key, values in baseline.get(group, {}).items():
+                if key in stats[group]:
+                    stats[group][key]['played'] += values.get('played', 0)
+                    stats[group][key]['won'] += values.get('won', 0)
+        best_game = baseline.get('best_game')
+        if best_game is not None and (stats['best_game'] is None or best_game < stats['best_game']):
+            stats['best_game'] = best_game
+        if stats['last_played'] is None:
+            stats['last_played'] = baseline.get('last_played')
+
+    def _daily_buckets(self, first_day: int, last_day: int) -> Dict[int, Tuple[int, int, int, int]]:
+        """daily tablosundan gün aralığındaki kovaları oku (birincil anahtar aralığı)"""
+        with self._lock:
+            rows = self._conn.execute(
+                'SELECT day, played, won, guesses, streak FROM daily WHERE day BETWEEN ? AND ?',
+                (first_day, last_day)
+            ).fetchall()
+        return {day: (played, won, guesses, streak) for day, played, won, guesses, streak in rows}
+
+    def _rebuild_daily(self):
+        """Günlük kovaları games tablosundan yeniden oluştur (seri bilgisi olmadan)"""
+        with self._lock:
+            self._conn.execute('BEGIN')
+            self._conn.execute('DELETE FROM daily')
+            self._conn.execute(
+                "INSERT INTO daily (day, played, won, guesses, streak) "
+                "SELECT CAST(julianday(played_at, 'unixepoch', 'localtime') - 1721424.5 AS INTEGER) AS d, "
+                "COUNT(*), TOTAL(won), TOTAL(CASE WHEN won THEN attempts ELSE 0 END), NULL "
+                "FROM games GROUP BY d"
+            )
+            self._conn.execute('COMMIT')
+
+    @staticmethod
+    def _where(since: Optional[float], language: Optional[str],
+               word_length: Optional[int]) -> Tuple[str, list]:
+        """Filtrelerden dizine uygun WHERE cümlesi ve parametreleri oluştur"""
+        conditions = []
+        params = []
+        if language is not None:
+            conditions.append('language = ?')
+            params.append(language)
+        if word_length is not None:
+            conditions.append('word_length = ?')
+            params.append(word_length)
+        if since is not None:
+            conditions.append('played_at >= ?')
+            params.append(int(since))
+        where = f"WHERE {' AND '.join(conditions)}" if conditions else ''
+        return where, params
+
+    def iter_games(self, since: Optional[float] = None, language: Optional[str] = None,
+                   word_length: Optional[int] = None) -> Iterator[GameRecord]:
+        """
+        Oyunları ayrı bir okuma bağlantısıyla satır satır döndür
+
+        WAL sayesinde uzun süren bir dışa aktarma yazmaları engellemez
+        (':memory:' veritabanında ana bağlantı kullanılır).
+
+        Args:
+            since: Yalnızca bu unix zamanından sonraki oyunlar
+            language: Yalnızca bu dil
+            word_length: Yalnızca bu uzunluk
+
+        Yields:
+            GameRecord nesneleri
+        """
+        where, params = self._where(since, language, word_length)
+        in_memory = self.db_file == ':memory:'
+        reader = self._conn if in_memory else sqlite3.connect(self._read_uri, uri=True)
+        try:
+            cursor = reader.execute(
+                'SELECT played_at, language, word_length, attempts, won, duration_ms, word_id '
+                f'FROM games {where} ORDER BY id', params
+            )
+            for row in cursor:
+                yield GameRecord(row[0], row[1], row[2], row[3], bool(row[4]), row[5], row[6])
+        finally:
+            if not in_memory:
+                reader.close()
+
+    def query(self, since: Optional[float] = None, language: Optional[str] = None,
+              word_length: Optional[int] = None) -> Dict:
+        """
+        Filtrelenmiş oyunların özetini dizinli sorguyla hesapla
+
+        Args:
+            since: Yalnızca bu unix zamanından sonraki oyunlar
+            language: Yalnızca bu dil
+            word_length: Yalnızca bu uzunluk
+
+        Returns:
+            {played, won, win_rate, average_attempts, average_duration} dictionary'si
+        """
+        where, params = self._where(since, language, word_length)
+        with self._lock:
+            played, won, attempts, duration_ms = self._conn.execute(
+                'SELECT COUNT(*), TOTAL(won), TOTAL(CASE WHEN won THEN attempts END), '
+                f'TOTAL(duration_ms) FROM games {where}', params
+            ).fetchone()
+
+        return {
+            'played': played,
+            'won': int(won),
+            'win_rate': (won / played * 100) if played else 0.0,
+            'average_attempts': (attempts / won) if won else 0.0,
+            'average_duration': (duration_ms / played / 1000) if played else 0.0
+        }
+
+    def migrate_from_json(self, stats_file: str) -> int:
+        """
+        statistics.json ve geçmiş günlüğünü veritabanına aktar
+
+        Günlükteki oyunlar satır olarak eklenir; JSON toplamlarında olup
+        günlükte karşılığı olmayan oyunlar (günlükten önceki sürümler)
+        'baseline' olarak saklanır. Seri değerleri JSON'dan alınır ve
+        JSON'a işlenmemiş günlük kayıtlarıyla ilerletilir. Kaynak dosyalar
+        değiştirilmez.
+
+        Args:
+            stats_file: Eski istatistik dosyası
+
+        Returns:
+            Aktarılan oyun satırı sayısı
+        """
+        legacy_stats = self._default_stats()
+        try:
+            with open(stats_file, 'r', encoding='utf-8') as f:
+                legacy_stats.update(json.load(f))
+        except (OSError, ValueError) as e:
+            print(f"İstatistikler yüklenirken hata: {e}")
+
+        # Kaynak dosyalar yalnızca okunur: Statistics açılışta günlüğü
+        # toplamlara işleyip dosyayı yeniden yazardı
+        legacy_history = GameHistory(os.path.splitext(stats_file)[0] + '.history',
+                                     keep_open=False, read_only=True)
+        migrated = len(legacy_history)
+        # JSON'a henüz işlenmemiş günlük kuyruğu seriyi ilerletir
+        current, best = legacy_stats['current_streak'], legacy_stats['max_streak']
+        checkpoint = min(legacy_stats.get('history_count', 0), migrated)
+        for record in legacy_history.iter_records(start=checkpoint):
+            current = current + 1 if record.won else 0
+            best = max(best, current)
+
+        rows = (
+            (r.timestamp, r.language, r.word_length, r.attempts, int(r.won),
+             r.duration_ms, r.word_id)
+            for r in legacy_history.iter_records()
+        )
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.executemany(
+                    'INSERT INTO games (played_at, language, word_length, attempts, won, '
+                    'duration_ms, word_id) VALUES (?, ?, ?, ?, ?, ?, ?)', rows
+                )
+                self._conn.execute(
+                    'UPDATE streak SET current = ?, best = ? WHERE id = 1', (current, best)
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._stats_cache = None
+            imported = self._build_stats()
+
+        baseline = {
+            key: max(legacy_stats.get(key, 0) - imported[key], 0)
+            for key in BASELINE_COUNTERS
+        }
+        baseline['guess_distribution'] = {
+            key: max(count - imported['guess_distribution'].get(key, 0), 0)
+            for key, count in legacy_stats.get('guess_distribution', {}).items()
+        }
+        for group in ('by_word_length', 'by_language'):
+            baseline[group] = {
+                key: {
+                    field: max(values.get(field, 0) - imported[group].get(key, {}).get(field, 0), 0)
+                    for field in ('played', 'won')
+                }
+                for key, values in legacy_stats.get(group, {}).items()
+            }
+        baseline['best_game'] = legacy_stats.get('best_game')
+        baseline['last_played'] = legacy_stats.get('last_played')
+
+        self._set_meta('baseline', json.dumps(baseline, ensure_ascii=False))
+        self._set_meta('migrated_from', os.path.abspath(stats_file))
+        self._stats_cache = None
+        print(f"{stats_file} SQLite veritabanına aktarıldı ({migrated} oyun)")
+        return migrated
+
+    def reset_stats(self):
+        """Tüm oyunları ve toplamları sil"""
+        with self._lock:
+            self._conn.execute('BEGIN')
+            self._conn.execute('DELETE FROM games')
+            self._conn.execute('DELETE FROM game_totals')
+            self._conn.execute('DELETE FROM daily')
+            self._conn.execute('UPDATE streak SET current = 0, best = 0, last_played = NULL')
+            self._conn.execute("DELETE FROM meta WHERE key = 'baseline'")
+            self._conn.execute('COMMIT')
+            self._stats_cache = None
+        print("İstatistikler sıfırlandı")
+
+    def rebuild_from_history(self) -> int:
+        """
+        Türetilmiş tüm tabloları (game_totals, streak, daily) games
+        tablosundan yeniden hesapla
+
+        Seriler oyunlar id sırasıyla yeniden oynatılmış gibi hesaplanır;
+        tetikleyicinin yaptığı gibi her günün serisi o günün son oyunundan
+        sonraki seridir.
+
+        Returns:
+            İşlenen oyun sayısı
+        """
+        with self._lock:
+            self._conn.execute('BEGIN')
+            try:
+                self._conn.execute('DELETE FROM game_totals')
+                self._conn.execute(
+                    'INSERT INTO game_totals (language, word_length, attempts, won, games) '
+                    'SELECT language, word_length, attempts, won, COUNT(*) FROM games '
+                    'GROUP BY language, word_length, attempts, won'
+                )
+                self._conn.execute('DELETE FROM daily')
+                # MAX(id) ile seçilen satırın streak değeri (SQLite çıplak sütun kuralı)
+                self._conn.execute(
+                    "INSERT INTO daily (day, played, won, guesses, streak) "
+                    "SELECT d, played, won, guesses, streak FROM ("
+                    "SELECT CAST(julianday(played_at, 'unixepoch', 'localtime') - 1721424.5 AS INTEGER) AS d, "
+                    "COUNT(*) AS played, TOTAL(won) AS won, "
+                    "TOTAL(CASE WHEN won THEN attempts ELSE 0 END) AS guesses, "
+                    "MAX(id), streak "
+                    f"FROM ({STREAK_ROWS}) GROUP BY d)"
+                )
+                self._conn.execute(
+                    'UPDATE streak SET '
+                    f'current = COALESCE((SELECT streak FROM ({STREAK_ROWS}) ORDER BY id DESC LIMIT 1), 0), '
+                    f'best = COALESCE((SELECT MAX(streak) FROM ({STREAK_ROWS})), 0), '
+                    'last_played = (SELECT MAX(played_at) FROM games) '
+                    'WHERE id = 1'
+                )
+                self._conn.execute('COMMIT')
+            except Exception:
+                self._conn.execute('ROLLBACK')
+                raise
+            self._stats_cache = None
+            return self._conn.execute('SELECT COUNT(*) FROM games').fetchone()[0]
+
+    def compact(self) -> bool:
+        """
+        WAL dosyasını ana veritabanına aktar ve kısalt
+
+        Returns:
+            Başarılıysa True
+        """
+        with self._lock:
+            busy = self._conn.execute('PRAGMA wal_checkpoint(TRUNCATE)').fetchone()[0]
+        return busy == 0
+
+    def close(self):
+        """Bağlantıyı kapat"""
+        with self._lock:
+            self._conn.close()
+
+
+# Test fonksiyonu
+if __name__ == '__main__':
+    """Modül testleri: 1 milyon satırda kayıt ve sorgu süreleri"""
+    import random
+    import tempfile
+
+    db_file = os.path.join(tempfile.mkdtemp(), 'bench.db')
+    stats = SQLiteStatistics(db_file)
+
+    print("=== SQLite İstatistik Test ===\n")
+    now = int(time.time())
+    rows = [
+        (now - random.randint(0, 365 * 86400), random.choice(('tr', 'en')),
+         random.choice((5, 6, 7)), random.randint(1, 6), int(random.random() < 0.7),
+         random.randint(20000, 300000), random.randint(0, 7000))
+        for _ in range(1_000_000)
+    ]
+    start = time.perf_counter()
+    with stats._lock:
+        stats._conn.execute('BEGIN')
+        stats._conn.executemany(
+            'INSERT INTO games (played_at, language, word_length, attempts, won, '
+            'duration_ms, word_id) VALUES (?, ?, ?, ?, ?, ?, ?)', rows
+        )
+        stats._conn.execute('COMMIT')
+    print(f"1.000.000 satır toplu ekleme: {time.perf_counter() - start:.1f}s")
+
+    samples = []
+    for _ in range(1000):
+        start = time.perf_counter()
+        stats.record_game(True, 3, 5, 'tr', duration=60.0)
+        samples.append(time.perf_counter() - start)
+    samples.sort()
+    print(f"record_game p50: {samples[500] * 1e6:.0f} µs, p99: {samples[990] * 1e6:.0f} µs")
+
+    start = time.perf_counter()
+    detailed = stats.get_detailed_stats()
+    print(f"get_detailed_stats: {(time.perf_counter() - start) * 1000:.2f} ms "
+          f"({detailed['games_played']} oyun)")
+
+    start = time.perf_counter()
+    result = stats.query(since=now - 30 * 86400, language='tr', word_length=6)
+    print(f"Son 30 gün, TR, 6 harf: {result['played']} oyun, "
+          f"%{result['win_rate']:.1f} ({(time.perf_counter() - start) * 1000:.1f} ms)")
+
+    stats.close()
@@ -0,0 +1,271 @@
+"""
+İstatistik Dışa Aktarma Modülü
+Oyun geçmişini ve toplamları NDJSON veya CSV olarak akış halinde yazar
+
+Satırlar üreteçlerle tek tek üretilir ve hemen dosyaya yazılır; bellekte
+tüm geçmiş hiçbir zaman birlikte tutulmaz. Dosya adı .gz ile bitiyorsa
+çıktı gzip ile sıkıştırılır. Komut satırından da kullanılabilir:
+
+    python stats_export.py --kind games --format csv -o oyunlar.csv.gz
+
+Kaynak depo salt okunur açılır (kilit, yazma veya göç yapılmaz); tüm
+tanılama mesajları standart hataya gider, standart çıktıda yalnızca veri olur.
+"""
+
+import csv
+import gzip
+import io
+import json
+import os
+import sys
+import tempfile
+from contextlib import redirect_stdout
+from datetime import datetime
+from typing import Dict, Iterable, Iterator, Optional, Tuple
+
+from statistics import StatisticsBase, open_statistics
+
+
+GAME_FIELDS = (
+    'timestamp', 'played_at', 'language', 'word_length', 'attempts',
+    'won', 'duration_ms', 'word_id'
+)
+AGGREGATE_FIELDS = ('section', 'key', 'value')
+FORMATS = ('ndjson', 'csv')
+KINDS = ('games', 'aggregates')
+
+
+def iter_game_rows(stats: StatisticsBase, since: Optional[float] = None,
+                   language: Optional[str] = None,
+                   word_length: Optional[int] = None) -> Iterator[Dict]:
+    """
+    Oyun geçmişini satır satır dictionary olarak üret
+
+    Args:
+        stats: İstatistik deposu (JSON veya SQLite)
+        since: Yalnızca bu unix zamanından sonraki oyunlar
+        language: Yalnızca bu dil
+        word_length: Yalnızca bu uzunluk
+
+    Yields:
+        GAME_FIELDS anahtarlı dictionary'ler
+    """
+    for record in stats.iter_games(since, language, word_length):
+        yield {
+            'timestamp': record.timestamp,
+            'played_at': datetime.fromtimestamp(record.timestamp).isoformat(),
+            'language': record.language,
+            'word_length': record.word_length,
+            'attempts': record.attempts,
+            'won': record.won,
+            'duration_ms': record.duration_ms,
+            'word_id': record.word_id
+        }
+
+
+def iter_aggregate_rows(stats: StatisticsBase) -> Iterator[Dict]:
+    """
+    Toplamları (section, key, value) satırları olarak üret
+
+    Args:
+        stats: İstatistik deposu
+
+    Yields:
+        AGGREGATE_FIELDS anahtarlı dictionary'ler
+    """
+    for key, value in stats.get_summary().items():
+        yield {'section': 'summary', 'key': key, 'value': value}
+    for key, value in stats.get_guess_distribution().items():
+        yield {'section': 'guess_distribution', 'key': key, 'value': value}
+    for group in ('by_word_length', 'by_language'):
+        for key, values in stats.stats[group].items():
+            for field, value in values.items():
+                yield {'section': group, 'key': f"{key}.{field}", 'value': value}
+    for days in (7, 30):
+        window = stats.get_rolling_stats(days)
+        for key in ('played', 'won', 'win_rate', 'average_guesses', 'max_streak'):
+            yield {'section': f'last_{days}_days', 'key': key, 'value': window[key]}
+
+
+def iter_ndjson(rows: Iterable[Dict]) -> Iterator[str]:
+    """
+    Satırları NDJSON satırlarına çevir
+
+    Args:
+        rows: Dictionary satırları
+
+    Yields:
+        Sonunda yeni satır olan JSON metinleri
+    """
+    for row in rows:
+        yield json.dumps(row, ensure_ascii=False, separators=(',', ':')) + '\n'
+
+
+def iter_csv(rows: Iterable[Dict], fields: Tuple[str, ...]) -> Iterator[str]:
+    """
+    Satırları başlıklı CSV satırlarına çevir
+
+    Args:
+        rows: Dictionary satırları
+        fields: Sütun sırası
+
+    Yields:
+        CSV satırları (önce başlık)
+    """
+    buffer = io.StringIO()
+    writer = csv.DictWriter(buffer, fieldnames=fields, lineterminator='\n')
+
+    writer.writeheader()
+    yield buffer.getvalue()
+    for row in rows:
+        buffer.seek(0)
+        buffer.truncate()
+        writer.writerow(row)
+        yield buffer.getvalue()
+
+
+def iter_export(stats: StatisticsBase, kind: str = 'games',
+                fmt: str = 'ndjson', **filters) -> Iterator[str]:
+    """
+    Dışa aktarma çıktısını metin parçaları olarak üret
+
+    Args:
+        stats: İstatistik deposu
+        kind: 'games' (oyun geçmişi) veya 'aggregates' (toplamlar)
+        fmt: 'ndjson' veya 'csv'
+        **filters: Oyun geçmişi için since/language/word_length
+
+    Yields:
+        Yazılacak metin parçaları
+    """
+    if kind not in KINDS:
+        raise ValueError(f"Bilinmeyen dışa aktarma türü: {kind}")
+    if fmt not in FORMATS:
+        raise ValueError(f"Bilinmeyen biçim: {fmt}")
+
+    if kind == 'games':
+        rows, fields = iter_game_rows(stats, **filters), GAME_FIELDS
+    else:
+        rows, fields = iter_aggregate_rows(stats), AGGREGATE_FIELDS
+
+    if fmt == 'ndjson':
+        return iter_ndjson(rows)
+    return iter_csv(rows, fields)
+
+
+def export_to_file(stats: StatisticsBase, path: str, kind: str = 'games',
+                   fmt: Optional[str] = None, compress: Optional[bool] = None,
+                   **filters) -> int:
+    """
+    Dışa aktarmayı dosyaya sabit bellekle yaz
+
+    Çıktı önce aynı dizinde geçici dosyaya yazılır ve tamamlanınca yerine
+    konur; yarıda kalan bir dışa aktarma eski dosyayı bozmaz.
+
+    Args:
+        stats: İstatistik deposu
+        path: Hedef dosya ('-' ise standart çıktı, compress ile gzip akışı)
+        kind: 'games' veya 'aggregates'
+        fmt: 'ndjson' veya 'csv' (None ise dosya uzantısından)
+        compress: gzip kullanılsın mı (None ise .gz uzantısından)
+        **filters: Oyun geçmişi için since/language/word_length
+
+    Returns:
+        Yazılan veri satırı sayısı (CSV başlığı hariç)
+    """
+    name = path[:-3] if path.endswith('.gz') else path
+    if fmt is None:
+        fmt = 'csv' if name.endswith('.csv') else 'ndjson'
+    if compress is None:
+        compress = path.endswith('.gz')
+
+    chunks = iter_export(stats, kind, fmt, **filters)
+    lines = 0
+
+    if path == '-':
+        if compress:
+            # Sıkıştırılmış çıktı ikili akışa yazılır; standart çıktı açık kalır
+            stream = gzip.GzipFile(fileobj=sys.stdout.buffer, mode='wb')
+            try:
+                for chunk in chunks:
+                    stream.write(chunk.encode('utf-8'))
+                    lines += 1
+            finally:
+                stream.close()
+            sys.stdout.buffer.flush()
+        else:
+            for chunk in chunks:
+                sys.stdout.write(chunk)
+                lines += 1
+        return lines - (1 if fmt == 'csv' else 0)
+
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix=f".{os.path.basename(path)}.",
+                                    suffix='.tmp')
+    try:
+        with os.fdopen(fd, 'wb') as raw:
+            stream = gzip.GzipFile(fileobj=raw, mode='wb') if compress else raw
+            try:
+                for chunk in chunks:
+                    stream.write(chunk.encode('utf-8'))
+                    lines += 1
+            finally:
+                if compress:
+                    stream.close()
+        os.replace(tmp_path, path)
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+    return lines - (1 if fmt == 'csv' else 0)
+
+
+def main(argv=None) -> int:
+    """Komut satırı girişi"""
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Wordle istatistiklerini dışa aktar")
+    parser.add_argument('--backend', choices=('json', 'sqlite'), default='json')
+    parser.add_argument('--stats', default=None,
+                        help="İstatistik dosyası (varsayılan statistics.json / statistics.db)")
+    parser.add_argument('--kind', choices=KINDS, default='games')
+    parser.add_argument('--format', choices=FORMATS, default=None,
+                        help="Varsayılan: çıktı uzantısından")
+    parser.add_argument('--gzip', action='store_true', help="Çıktıyı sıkıştır")
+    parser.add_argument('--language', default=None)
+    parser.add_argument('--word-length', type=int, default=None)
+    parser.add_argument('--since-days', type=float, default=None,
+                        help="Yalnızca son N günün oyunları")
+    parser.add_argument('-o', '--output', default='-', help="Çıktı dosyası ('-' standart çıktı)")
+    args = parser.parse_args(argv)
+
+    filters = {}
+    if args.kind == 'games':
+        filters['language'] = args.language
+        filters['word_length'] = args.word_length
+        if args.since_days is not None:
+            import time
+            filters['since'] = time.time() - args.since_days * 86400
+
+    # Depoların kendi mesajları da standart çıktıdaki veriye karışmasın
+    try:
+        with redirect_stdout(sys.stderr):
+            stats = open_statistics(args.backend, args.stats, read_only=True)
+    except Exception as e:
+        print(f"İstatistikler açılamadı: {e}", file=sys.stderr)
+        return 1
+    try:
+        lines = export_to_file(stats, args.output, args.kind, args.format,
+                               True if args.gzip else None, **filters)
+    finally:
+        with redirect_stdout(sys.stderr):
+            stats.close()
+
+    if args.output != '-':
+        print(f"{lines} satır {args.output} dosyasına aktarıldı", file=sys.stderr)
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -5,16 +5,40 @@ Tüm modüller için kapsamlı testler
 
 import unittest
 import os
+import sys
 import json
+import time
+import asyncio
+import subprocess
+import shutil
 import tempfile
 from unittest.mock import Mock, patch, MagicMock
 
 # Modülleri import et
-from game_logic import GameLogic
-from words import WordManager
-from statistics import Statistics
-from themes import ThemeManager, Theme
-from security import WordEncryption, WordCache, SecureWordManager
+from game_logic import (
+    GameLogic, AbsurdleGameLogic, score_batch, pattern_code,
+    encode_pattern, decode_pattern, HashedGameLogic
+)
+from words import (
+    WordManager, WordSource, PlainTextSource, StreamingTextSource, EncryptedJSONSource,
+    BundleSource
+)
+from statistics import Statistics, StatisticsBase, open_statistics
+from statistics_sqlite import SQLiteStatistics
+from history import GameHistory, GameRecord, RECORD
+from profiles import ProfileStore
+from leaderboard import Leaderboard, LeaderboardSet
+from stats_export import export_to_file, iter_export, main as export_main
+from themes import ThemeManager, Theme, CLASSIC_COLORS, build_index
+from security import (
+    WordEncryption, WordBundle, WordCache, ConcurrentWordCache, HashedAnswerStore,
+    SecureWordManager,
+    GameStateToken
+)
+from server import GameServer, RequestError, encode_ws_frame, read_ws_frame
+from sessions import SessionRegistry
+from batching import GuessBatcher
+from metrics import MetricsRegistry, StartupTimeline, GAMES_TOTAL
 
 
 class TestGameLogic(unittest.TestCase):
@@ -75,6 +99,15 @@ class TestGameLogic(unittest.TestCase):
         result = self.game.make_guess('ABC')
         self.assertIsNone(result)
         
+    def test_quiet_invalid_guess(self):
+        """verbose=False iken geçersiz tahmin konsola yazmamalı"""
+        game = GameLogic('ELMA', 1, verbose=False)
+        with patch('builtins.print') as mock_print:
+            self.assertIsNone(game.make_guess('ABC'))
+            game.make_guess('ARMA')
+            self.assertIsNone(game.make_guess('ELMA'))
+        mock_print.assert_not_called()
+        
     def test_win_condition(self):
         """Kazanma durumu"""
         self.game.make_guess('ELMA')
@@ -111,6 +144,47 @@ class TestGameLogic(unittest.TestCase):
         self.assertEqual(len(stats['guesses']), 1)
 
 
+class TestAbsurdle(unittest.TestCase):
+    """Desen kodu ve Absurdle modu testleri"""
+    
+    def test_pattern_code_matches_evaluate(self):
+        """Desen kodu evaluate_guess ile aynı sonucu vermeli"""
+        pairs = [('ELMA', 'ALMA'), ('BOOKS', 'ROBOT'), ('BOOKS', 'SPOON'),
+                 ('ABBEY', 'BABBB'), ('ELMA', 'XYZT')]
+        for secret, guess in pairs:
+            game = GameLogic(secret, 6, verbose=False)
+            expected = game.evaluate_guess(guess)
+            code = pattern_code(guess, secret)
+            self.assertEqual(decode_pattern(code, len(guess)), expected)
+            self.assertEqual(encode_pattern(expected), code)
+            
+    def test_score_batch(self):
+        """Toplu puanlama"""
+        codes = score_batch('ELMA', ['ELMA', 'ALMA'])
+        self.assertEqual(codes[0], 3 ** 4 - 1)
+        self.assertEqual(codes[1], pattern_code('ELMA', 'ALMA'))
+        
+    def test_keeps_largest_bucket(self):
+        """En büyük desen grubu tutulmalı"""
+        game = AbsurdleGameLogic(['ELMA', 'ALMA', 'OLMA', 'ARMA'], 6, verbose=False)
+        result = game.make_guess('ELMA')
+        
+        # ALMA ve OLMA aynı deseni verir, ELMA tek başına kalır
+        self.assertEqual(game.get_remaining_candidates(), ['ALMA', 'OLMA'])
+        self.assertNotIn('ELMA', game.get_remaining_candidates())
+        self.assertFalse(game.is_won())
+        self.assertEqual(result, game.evaluate_guess('ELMA'))
+        
+    def test_public_api(self):
+        """GameLogic API'si korunmalı"""
+        game = AbsurdleGameLogic(['ELMA'], 6, verbose=False)
+        self.assertIsNone(game.make_guess('ABC'))
+        game.make_guess('ELMA')
+        self.assertTrue(game.is_won())
+        self.assertEqual(game.secret_word, 'ELMA')
+        self.assertEqual(game.get_statistics()['attempts_used'], 1)
+
+
 class TestWordManager(unittest.TestCase):
     """Kelime yöneticisi testleri"""
     
@@ -128,7 +202,6 @@ class TestWordManager(unittest.TestCase):
         
     def tearDown(self):
         """Test sonrası temizlik"""
-        import shutil
         if os.path.exists(self.temp_dir):
             shutil.rmtree(self.temp_dir)
             
@@ -160,6 +233,96 @@ class TestWordManager(unittest.TestCase):
         
         self.manager.clear_cache()
         self.assertFalse(self.manager.cache_loaded['tr'][5])
+        
+    def test_sources_feed_same_index(self):
+        """Tüm kaynak arka uçları aynı kelimeleri ve indeksleri üretmeli"""
+        pattern = os.path.join(self.temp_dir, 'words_{language}.txt')
+        with open(pattern.replace('{language}', 'tr'), 'w', encoding='utf-8') as f:
+            f.write('elma\narmut\nmango\nkarpuz\nAB1CD\narmut\n')
+        encryption = WordEncryption(key="TEST_KEY")
+        json_pattern = os.path.join(self.temp_dir, 'words_{language}.json')
+        encryption.save_encrypted_words(['ARMUT', 'MANGO', 'ARMUT'],
+                                        json_pattern.replace('{language}', 'tr'))
+        bundle = os.path.join(self.temp_dir, 'words.bundle')
+        encryption.save_bundle({'tr': ['ARMUT', 'MANGO', 'ARMUT', 'KARPUZ']}, bundle)
+        
+        for source in (PlainTextSource(pattern), StreamingTextSource(pattern),
+                       EncryptedJSONSource(json_pattern, encryption),
+                       BundleSource(bundle, encryption)):
+            manager = WordManager([source])
+            self.assertEqual(manager.load_words(5, 'tr'), ['ARMUT', 'MANGO', 'ARMUT'])
+            self.assertEqual(manager.get_word_index('MANGO', 5, 'tr'), 1)
+            self.assertEqual(manager.get_word_index('armut', 5, 'tr'), 0)
+            self.assertTrue(manager.is_word_in_list('mango', 5, 'tr'))
+            self.assertFalse(manager.is_word_in_list('ELMAS', 5, 'tr'))
+            
+    def test_source_priority_and_fallback(self):
+        """İlk kullanılabilir kaynak seçilmeli; bilinmeyen ad reddedilmeli"""
+        missing = BundleSource(os.path.join(self.temp_dir, 'yok.bundle'))
+        text = PlainTextSource(self.test_file)
+        manager = WordManager([missing, text])
+        self.assertIs(manager.get_source('tr'), text)
+        self.assertEqual(manager.load_words(5, 'tr'), ['ARMUT', 'MANGO'])
+        
+        manager.clear_cache()
+        self.assertEqual(manager.load_words(5, 'tr'), ['ARMUT', 'MANGO'])
+        
+        with self.assertRaises(ValueError):
+            WordManager(['yok'])
+            
+    def test_incomplete_source_rejected(self):
+        """Eksik kelime kaynağı oluşturulurken hata vermeli"""
+        class PartialSource(WordSource):
+            def is_available(self, language):
+                return True
+                
+        with self.assertRaises(TypeError):
+            PartialSource()
+            
+    def test_hashed_mode(self):
+        """hashed kipte liste düz metin önbelleğe alınmadan sorgulanabilmeli"""
+        manager = WordManager([PlainTextSource(self.test_file)], hashed=True,
+                              encryption=WordEncryption(key="TEST_KEY"))
+        self.assertTrue(manager.is_word_in_list('mango', 5, 'tr'))
+        self.assertFalse(manager.is_word_in_list('ELMAS', 5, 'tr'))
+        self.assertEqual(manager.get_word_index('MANGO', 5, 'tr'), 1)
+        self.assertEqual(manager.get_word_count(5, 'tr'), 2)
+        self.assertIn(manager.get_random_word(5, 'tr'), ('ARMUT', 'MANGO'))
+        self.assertFalse(manager.cache_loaded['tr'][5])
+        self.assertEqual(manager.word_cache['tr'][5], [])
+        self.assertEqual(manager.load_words(6, 'tr'), [])
+        
+    def test_hashed_new_game(self):
+        """hashed kipte gizli kelime yalnızca oyun sonunda çözülmeli"""
+        manager = WordManager([PlainTextSource(self.test_file)], hashed=True,
+                              encryption=WordEncryption(key="TEST_KEY"))
+        store = manager.get_answer_store(5, 'tr')
+        with patch.object(store, 'random_index', return_value=1):
+            with patch.object(type(store), 'reveal', wraps=store.reveal) as reveal:
+                game, word_id = manager.new_game(5, 'tr', 5, verbose=False)
+                reveal.assert_not_called()
+                
+        self.assertEqual(word_id, 1)
+        self.assertNotIn('MANGO', vars(game).values())
+        self.assertEqual(game.make_guess('ARMUT'), ['present', 'absent', 'present', 'absent', 'absent'])
+        self.assertEqual(game.make_guess('mango'), ['correct'] * 5)
+        self.assertTrue(game.is_won())
+        self.assertEqual(game.reveal_secret(), 'MANGO')
+        
+    def test_absurdle_new_game(self):
+        """absurdle modu tüm adaylarla düşmanca oyun kurmalı"""
+        manager = WordManager([PlainTextSource(self.test_file)])
+        game, word_id = manager.new_game(5, 'tr', 5, verbose=False, mode='absurdle')
+        
+        self.assertIsInstance(game, AbsurdleGameLogic)
+        self.assertEqual(word_id, -1)
+        self.assertEqual(sorted(game.candidates), ['ARMUT', 'MANGO'])
+        self.assertEqual(manager.new_game(9, 'tr', 9, verbose=False, mode='absurdle'), None)
+        
+        hashed = WordManager([PlainTextSource(self.test_file)], hashed=True,
+                             encryption=WordEncryption(key="TEST_KEY"))
+        game, _ = hashed.new_game(5, 'tr', 5, verbose=False, mode='absurdle')
+        self.assertIsInstance(game, HashedGameLogic)
 
 
 class TestStatistics(unittest.TestCase):
@@ -177,8 +340,11 @@ class TestStatistics(unittest.TestCase):
         
     def tearDown(self):
         """Temizlik"""
-        if os.path.exists(self.temp_file.name):
-            os.remove(self.temp_file.name)
+        self.stats.close()
+        for path in (self.temp_file.name, self.temp_file.name + '.lock',
+                     self.stats.history.path):
+            if os.path.exists(path):
+                os.remove(path)
             
     def test_initial_stats(self):
         """Başlangıç istatistikleri"""
@@ -260,6 +426,696 @@ class TestStatistics(unittest.TestCase):
         
         summary = self.stats.get_summary()
         self.assertEqual(summary['games_played'], 0)
+        
+    def test_write_behind_coalesces(self):
+        """Ardışık kayıtlar tek yazmada birleşmeli"""
+        for _ in range(5):
+            self.stats.record_game(True, 3, 5, 'tr')
+        self.assertEqual(self.stats.get_write_stats()['writes'], 0)
+        
+        self.assertTrue(self.stats.flush())
+        write_stats = self.stats.get_write_stats()
+        self.assertEqual(write_stats['writes'], 1)
+        self.assertEqual(write_stats['coalesced'], 4)
+        
+        with open(self.temp_file.name, encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['games_played'], 5)
+            
+    def test_immediate_atomic_write(self):
+        """flush_delay=None ise hemen ve geçici dosya bırakmadan yazılmalı"""
+        stats = Statistics(self.temp_file.name, flush_delay=None)
+        stats.record_game(True, 3, 5, 'tr')
+        self.assertEqual(stats.get_write_stats()['writes'], 1)
+        
+        directory = os.path.dirname(self.temp_file.name)
+        prefix = '.' + os.path.basename(self.temp_file.name)
+        self.assertFalse([n for n in os.listdir(directory) if n.startswith(prefix)])
+        
+    def test_failed_write_counted(self):
+        """Yazma hatası sayılmalı ve veri kirli kalmalı"""
+        stats = Statistics(os.path.join(self.temp_file.name + '_yok', 'x.json'))
+        stats.record_game(True, 3, 5, 'tr')
+        self.assertFalse(stats.flush())
+        self.assertEqual(stats.get_write_stats()['failures'], 1)
+        stats._writer._dirty = False
+        
+    def test_history_replayed_after_crash(self):
+        """Kontrol noktasından sonraki oyunlar açılışta toplamlara eklenmeli"""
+        self.stats.record_game(True, 3, 5, 'tr')
+        self.stats.flush()
+        # Toplamlar yazılmadan önce çökme: yalnızca günlüğe eklenen oyun
+        self.stats.history.record(False, 6, 6, 'en', duration=42.5)
+        self.stats._writer._dirty = False
+        
+        reopened = Statistics(self.temp_file.name)
+        try:
+            self.assertEqual(reopened.stats['games_played'], 2)
+            self.assertEqual(reopened.stats['current_streak'], 0)
+            self.assertEqual(reopened.stats['by_language']['en']['played'], 1)
+            self.assertEqual(reopened.stats['history_count'], 2)
+        finally:
+            reopened.close()
+            
+    def test_rebuild_from_history(self):
+        """Toplamlar günlükten yeniden hesaplanabilmeli"""
+        self.stats.record_game(True, 2, 5, 'tr', duration=30.0, word_id=7)
+        self.stats.record_game(True, 4, 6, 'tr')
+        self.stats.stats['games_won'] = 99  # bozuk toplam
+        
+        self.assertEqual(self.stats.rebuild_from_history(), 2)
+        self.assertEqual(self.stats.stats['games_won'], 2)
+        self.assertEqual(self.stats.stats['max_streak'], 2)
+        self.assertEqual(self.stats.stats['best_game'], 2)
+        
+    def test_rolling_windows(self):
+        """7 ve 30 günlük pencereler günlük kovalardan hesaplanmalı"""
+        now = time.time()
+        day = 86400
+        for offset, won, attempts in ((40, True, 1), (10, True, 4), (2, False, 6),
+                                      (0, True, 3), (0, True, 5)):
+            self.stats.history.record(won, attempts, 5, 'tr', timestamp=now - offset * day)
+        self.stats.close()
+        
+        # Kovalar açılışta günlükten doldurulmalı ve dosyada saklanmalı
+        self.stats = Statistics(self.temp_file.name)
+        self.stats.close()
+        self.stats = Statistics(self.temp_file.name)
+        
+        week = self.stats.get_rolling_stats(7, now=now)
+        self.assertEqual((week['played'], week['won']), (3, 2))
+        self.assertEqual(week['win_rate'], 66.7)
+        self.assertEqual(week['average_guesses'], 4.0)
+        self.assertEqual(week['streak_trend'][-3:], [0, None, 2])
+        self.assertEqual(len(week['played_per_day']), 7)
+        
+        month = self.stats.get_rolling_stats(30, now=now)
+        self.assertEqual(month['played'], 4)
+        self.assertEqual(self.stats.get_detailed_stats()['last_30_days']['days'], 30)
+        
+        with self.assertRaises(ValueError):
+            self.stats.get_rolling_stats(31)
+
+
+def _record_games_worker(stats_file, worker, games):
+    """Çok süreçli testte ayrı bir süreçte oyun kaydet"""
+    stats = Statistics(stats_file, flush_delay=0.005)
+    for _ in range(games):
+        # Her süreç ayırt edilebilir sonuçlar yazar
+        stats.record_game(worker % 2 == 0, worker + 1, 5, 'tr')
+    stats.close()
+
+
+class TestStatisticsMultiprocess(unittest.TestCase):
+    """Süreçler arası eşzamanlı kayıt testleri"""
+    
+    def test_concurrent_processes_lose_no_games(self):
+        """Aynı dosyaya aynı anda kayıt yapan süreçler hiçbir oyunu kaybetmemeli"""
+        import multiprocessing
+        temp_dir = tempfile.mkdtemp()
+        stats_file = os.path.join(temp_dir, 'statistics.json')
+        workers, games = 4, 50
+        try:
+            context = multiprocessing.get_context('spawn')
+            processes = [
+                context.Process(target=_record_games_worker, args=(stats_file, w, games))
+                for w in range(workers)
+            ]
+            for process in processes:
+                process.start()
+            for process in processes:
+                process.join(60)
+                self.assertEqual(process.exitcode, 0)
+                
+            # Diskteki kontrol noktası kendi içinde tutarlı olmalı
+            with open(stats_file, encoding='utf-8') as f:
+                checkpoint = json.load(f)
+            self.assertEqual(checkpoint['games_played'], checkpoint['history_count'])
+            
+            stats = Statistics(stats_file, flush_delay=None)
+            total = workers * games
+            self.assertEqual(len(stats.history), total)
+            self.assertEqual(stats.stats['games_played'], total)
+            self.assertEqual(stats.stats['games_won'], 2 * games)
+            self.assertEqual(stats.stats['guess_distribution']['1'], games)
+            self.assertEqual(stats.stats['guess_distribution']['3'], games)
+            self.assertEqual(stats.stats['guess_distribution']['2'], 0)
+            stats.close()
+        finally:
+            shutil.rmtree(temp_dir)
+            
+    def test_reset_seen_by_other_instance(self):
+        """Bir örnekte yapılan sıfırlama diğerinde eski toplamları geri getirmemeli"""
+        temp_dir = tempfile.mkdtemp()
+        stats_file = os.path.join(temp_dir, 'statistics.json')
+        try:
+            first = Statistics(stats_file, flush_delay=None)
+            second = Statistics(stats_file, flush_delay=None)
+            first.record_game(True, 3, 5, 'tr')
+            second.record_game(True, 4, 5, 'tr')
+            self.assertEqual(second.stats['games_played'], 2)
+            
+            with patch('builtins.print'):
+                first.reset_stats()
+            second.record_game(False, 6, 5, 'tr')
+            self.assertEqual(second.stats['games_played'], 1)
+            self.assertEqual(second.stats['games_won'], 0)
+            first.close()
+            second.close()
+        finally:
+            shutil.rmtree(temp_dir)
+            
+    def test_reset_seen_after_log_regrows(self):
+        """Günlük eski kontrol noktasını geçecek kadar büyüse de sıfırlama fark edilmeli"""
+        temp_dir = tempfile.mkdtemp()
+        stats_file = os.path.join(temp_dir, 'statistics.json')
+        try:
+            first = Statistics(stats_file, flush_delay=None)
+            second = Statistics(stats_file, flush_delay=None)
+            second.record_game(True, 3, 5, 'tr')
+            
+            with patch('builtins.print'):
+                first.reset_stats()
+            for _ in range(3):
+                first.record_game(False, 6, 5, 'tr')
+            second.record_game(False, 6, 5, 'tr')
+            self.assertEqual(second.stats['games_played'], 4)
+            self.assertEqual(second.stats['games_won'], 0)
+            first.close()
+            second.close()
+        finally:
+            shutil.rmtree(temp_dir)
+            
+    def test_history_opened_under_lock(self):
+        """Günlük (ve yarım kuyruğun kesilmesi) dosya kilidi altında açılmalı"""
+        from persistence import FileLock
+        held, seen = [], []
+        acquire, release = FileLock.acquire, FileLock.release
+        
+        def tracked_acquire(lock):
+            acquire(lock)
+            held.append(lock.path)
+            
+        def tracked_release(lock):
+            held.remove(lock.path)
+            release(lock)
+            
+        def spy(path, **kwargs):
+            seen.append(list(held))
+            return GameHistory(path, **kwargs)
+            
+        temp_dir = tempfile.mkdtemp()
+        stats_file = os.path.join(temp_dir, 'statistics.json')
+        try:
+            with patch.object(FileLock, 'acquire', tracked_acquire), \
+                    patch.object(FileLock, 'release', tracked_release), \
+                    patch('statistics.GameHistory', spy):
+                stats = Statistics(stats_file, flush_delay=None)
+            self.assertIn(stats_file + '.lock', seen[0])
+            stats.close()
+        finally:
+            shutil.rmtree(temp_dir)
+            
+    def test_reset_during_timer_flush(self):
+        """Zamanlayıcı yazması beklerken sıfırlama kilitlenmemeli"""
+        import threading
+        temp_dir = tempfile.mkdtemp()
+        stats = Statistics(os.path.join(temp_dir, 'statistics.json'), flush_delay=0.05)
+        
+        def reset_while_flush_pending():
+            stats.record_game(True, 3, 5, 'tr')
+            with stats._lock:
+                # Zamanlayıcı yazma kilidini alıp self._lock'u bekler
+                time.sleep(0.3)
+                with patch('builtins.print'):
+                    stats.reset_stats()
+                    
+        try:
+            worker = threading.Thread(target=reset_while_flush_pending, daemon=True)
+            worker.start()
+            worker.join(5)
+            self.assertFalse(worker.is_alive())
+            stats.close()
+            self.assertEqual(Statistics(stats.stats_file).stats['games_played'], 0)
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestSQLiteStatistics(unittest.TestCase):
+    """SQLite istatistik deposu testleri"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.db_file = os.path.join(self.temp_dir, 'statistics.db')
+        
+    def tearDown(self):
+        for name in os.listdir(self.temp_dir):
+            os.remove(os.path.join(self.temp_dir, name))
+        os.rmdir(self.temp_dir)
+        
+    def test_same_api_as_json_backend(self):
+        """Aynı oyunlar iki arka uçta aynı özeti vermeli"""
+        json_stats = Statistics(os.path.join(self.temp_dir, 'other.json'), flush_delay=None)
+        sqlite_stats = open_statistics('sqlite', self.db_file)
+        games = [(True, 3, 5, 'tr'), (True, 2, 6, 'en'), (False, 6, 5, 'tr'), (True, 4, 7, 'tr')]
+        for game in games:
+            json_stats.record_game(*game)
+            sqlite_stats.record_game(*game)
+            
+        expected = json_stats.get_detailed_stats()
+        actual = sqlite_stats.get_detailed_stats()
+        for key in ('games_played', 'games_won', 'current_streak', 'max_streak',
+                    'average_guesses', 'best_game', 'guess_distribution',
+                    'by_word_length', 'by_language'):
+            self.assertEqual(actual[key], expected[key], key)
+            
+        json_stats.close()
+        sqlite_stats.close()
+        
+    def test_migrates_json_and_history(self):
+        """statistics.json ve günlük ilk açılışta içe aktarılmalı"""
+        legacy = Statistics(os.path.join(self.temp_dir, 'statistics.json'), flush_delay=None)
+        legacy.record_game(True, 3, 5, 'tr')
+        legacy.record_game(True, 5, 6, 'en')
+        legacy.close()
+        # Günlükten önceki bir sürümden kalan, satır karşılığı olmayan oyunlar
+        path = os.path.join(self.temp_dir, 'statistics.json')
+        with open(path, encoding='utf-8') as f:
+            data = json.load(f)
+        data['games_played'] += 10
+        data['by_language']['tr']['played'] += 10
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f)
+            
+        stats = SQLiteStatistics(self.db_file)
+        self.assertEqual(stats.stats['games_played'], 12)
+        self.assertEqual(stats.stats['games_won'], 2)
+        self.assertEqual(stats.stats['by_language']['tr']['played'], 11)
+        self.assertEqual(stats.query(language='en')['played'], 1)
+        stats.close()
+        
+        # İkinci açılışta tekrar aktarılmamalı
+        stats = SQLiteStatistics(self.db_file)
+        self.assertEqual(stats.stats['games_played'], 12)
+        stats.close()
+        
+    def test_migration_leaves_source_untouched(self):
+        """İçe aktarma kaynak dosyaları değiştirmemeli, işlenmemiş günlüğü de saymalı"""
+        path = os.path.join(self.temp_dir, 'statistics.json')
+        legacy = Statistics(path, flush_delay=None)
+        legacy.record_game(True, 3, 5, 'tr')
+        legacy.close()
+        # JSON toplamlarına henüz işlenmemiş bir günlük kaydı
+        history = GameHistory(os.path.join(self.temp_dir, 'statistics.history'))
+        history.record(True, 4, 5, 'tr')
+        history.close()
+        
+        sources = {}
+        for name in ('statistics.json', 'statistics.history'):
+            with open(os.path.join(self.temp_dir, name), 'rb') as f:
+                sources[name] = f.read()
+                
+        with patch('builtins.print'):
+            stats = SQLiteStatistics(self.db_file)
+        self.assertEqual(stats.stats['games_played'], 2)
+        self.assertEqual(stats.stats['current_streak'], 2)
+        stats.close()
+        
+        for name, data in sources.items():
+            with open(os.path.join(self.temp_dir, name), 'rb') as f:
+                self.assertEqual(f.read(), data, name)
+                
+    def test_rebuild_recomputes_all_tables(self):
+        """rebuild_from_history seri ve günlük kovaları da yeniden hesaplamalı"""
+        stats = SQLiteStatistics(self.db_file)
+        for won in (True, True, False, True):
+            stats.record_game(won, 3, 5, 'tr')
+        expected = (stats.stats['current_streak'], stats.stats['max_streak'],
+                    stats.get_rolling_stats(7))
+        
+        stats._conn.execute('UPDATE streak SET current = 9, best = 9, last_played = NULL')
+        stats._conn.execute('UPDATE daily SET played = 0, won = 0, guesses = 0, streak = NULL')
+        stats._conn.execute('DELETE FROM game_totals')
+        
+        self.assertEqual(stats.rebuild_from_history(), 4)
+        self.assertEqual((stats.stats['current_streak'], stats.stats['max_streak'],
+                          stats.get_rolling_stats(7)), expected)
+        self.assertEqual(expected[:2], (1, 2))
+        self.assertEqual(stats.stats['games_played'], 4)
+        self.assertIsNotNone(stats.stats['last_played'])
+        stats.close()
+        
+    def test_indexed_query_and_other_connection(self):
+        """Filtreli sorgu ve başka bağlantının yazdıkları görülmeli"""
+        reader = SQLiteStatistics(self.db_file)
+        self.assertEqual(reader.stats['games_played'], 0)
+        
+        writer = SQLiteStatistics(self.db_file)
+        writer.record_game(True, 2, 6, 'tr', duration=30.0)
+        writer.record_game(False, 6, 6, 'tr', duration=90.0)
+        writer.record_game(True, 4, 5, 'tr')
+        
+        self.assertEqual(reader.stats['games_played'], 3)
+        result = reader.query(since=time.time() - 60, language='tr', word_length=6)
+        self.assertEqual(result['played'], 2)
+        self.assertEqual(result['win_rate'], 50.0)
+        self.assertEqual(result['average_duration'], 60.0)
+        
+        week = reader.get_rolling_stats(7)
+        self.assertEqual((week['played'], week['won']), (3, 2))
+        self.assertEqual(week['streak_trend'][-1], 1)
+        
+        writer.reset_stats()
+        self.assertEqual(reader.get_summary()['games_played'], 0)
+        self.assertEqual(reader.get_rolling_stats(30)['played'], 0)
+        reader.close()
+        writer.close()
+        
+    def test_incomplete_backend_rejected(self):
+        """Eksik arka uç oyun ortasında değil, oluşturulurken hata vermeli"""
+        class PartialStatistics(StatisticsBase):
+            def record_game(self, *args, **kwargs):
+                pass
+                
+        with self.assertRaises(TypeError):
+            PartialStatistics()
+
+
+class TestProfileStore(unittest.TestCase):
+    """Oyuncu profili deposu testleri"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.store = ProfileStore(self.temp_dir, capacity=2)
+        
+    def tearDown(self):
+        self.store.close()
+        shutil.rmtree(self.temp_dir)
+        
+    def test_sharded_layout(self):
+        """Profil dosyası iki seviyeli özet dizininde olmalı"""
+        path = self.store.profile_path('oyuncu1')
+        relative = os.path.relpath(path, self.temp_dir).split(os.sep)
+        self.assertEqual(len(relative), 3)
+        self.assertEqual(relative[-1], 'oyuncu1.json')
+        with self.assertRaises(ValueError):
+            self.store.profile_path('../disari')
+            
+    def test_lazy_load_and_lru_eviction(self):
+        """Profiller erişimde yüklenmeli, kapasite aşılınca yazılıp çıkarılmalı"""
+        self.assertEqual(len(self.store), 0)
+        self.store.record_game('a', True, 3, 5, 'tr')
+        self.store.record_game('b', False, 6, 5, 'tr')
+        self.store.get('a')
+        self.store.record_game('c', True, 2, 5, 'en')
+        
+        self.assertIn('a', self.store)
+        self.assertNotIn('b', self.store)
+        self.assertTrue(os.path.exists(self.store.profile_path('b')))
+        self.assertEqual(self.store.get_metrics()['evictions'], 1)
+        
+        # Çıkarılan profil diskten aynen geri yüklenmeli
+        self.assertEqual(self.store.get('b').stats['games_played'], 1)
+        self.assertEqual(self.store.get('b').stats['current_streak'], 0)
+        
+    def test_iter_player_ids(self):
+        """Diskteki oyuncular yüklenmeden listelenmeli"""
+        for player in ('x', 'y', 'z'):
+            self.store.record_game(player, True, 4, 5, 'tr')
+        self.store.flush()
+        self.assertEqual(sorted(self.store.iter_player_ids()), ['x', 'y', 'z'])
+        
+    @unittest.skipUnless(os.path.isdir('/proc/self/fd'), "yalnızca Linux")
+    def test_hot_profiles_hold_no_fds(self):
+        """Sıcak profiller açık dosya tanıtıcısı tutmamalı"""
+        store = ProfileStore(os.path.join(self.temp_dir, 'hot'), capacity=100,
+                             flush_delay=None)
+        before = len(os.listdir('/proc/self/fd'))
+        for i in range(50):
+            store.record_game(f"oyuncu{i}", True, 3, 5, 'tr')
+        self.assertEqual(len(store), 50)
+        self.assertLess(len(os.listdir('/proc/self/fd')) - before, 5)
+        store.close()
+
+
+    def test_shared_flusher(self):
+        """Kirli profiller tek bir yazma iş parçacığını paylaşmalı"""
+        import threading
+        store = ProfileStore(os.path.join(self.temp_dir, 'shared'), capacity=100,
+                             flush_delay=0.05)
+        before = threading.active_count()
+        for i in range(20):
+            store.record_game(f"oyuncu{i}", True, 3, 5, 'tr')
+        self.assertLessEqual(threading.active_count() - before, 1)
+        self.assertEqual(len(store._flusher), 20)
+        
+        deadline = time.time() + 5
+        while len(store._flusher) and time.time() < deadline:
+            time.sleep(0.01)
+        self.assertEqual(len(store._flusher), 0)
+        with open(store.profile_path('oyuncu7'), 'r', encoding='utf-8') as f:
+            self.assertEqual(json.load(f)['games_played'], 1)
+        store.close()
+        
+    def test_load_outside_lock(self):
+        """Profil yüklenirken depo kilidi tutulmamalı"""
+        held = []
+        real_statistics = Statistics
+        
+        def loading(*args, **kwargs):
+            held.append(self.store._lock.locked())
+            return real_statistics(*args, **kwargs)
+            
+        with patch('profiles.Statistics', side_effect=loading):
+            self.store.get('a')
+        self.assertEqual(held, [False])
+        self.assertIn('a', self.store)
+
+
+class TestLeaderboard(unittest.TestCase):
+    """Liderlik tablosu testleri"""
+    
+    def test_order_and_best_result_only(self):
+        """Önce tahmin, sonra süre; oyuncu başına yalnızca en iyi sonuç"""
+        board = Leaderboard()
+        board.submit('a', 4, 90000)
+        board.submit('b', 3, 120000)
+        board.submit('c', 3, 60000)
+        self.assertFalse(board.submit('c', 5, 1000))
+        self.assertTrue(board.submit('a', 2, 300000))
+        
+        self.assertEqual([row['player_id'] for row in board.top(3)], ['a', 'c', 'b'])
+        self.assertEqual(board.rank('b'), 3)
+        self.assertIsNone(board.rank('yok'))
+        self.assertEqual(len(board), 3)
+        
+    def test_persist_and_feed_from_profiles(self):
+        """Profil deposundan beslenmeli ve kompakt dosyadan geri yüklenmeli"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            path = os.path.join(temp_dir, 'leaderboard.bin')
+            store = ProfileStore(os.path.join(temp_dir, 'profiles'),
+                                 leaderboards=LeaderboardSet(path))
+            store.record_game('ayse', True, 3, 5, 'tr', duration=80.0)
+            store.record_game('mehmet', True, 3, 5, 'tr', duration=45.0)
+            store.record_game('mehmet', False, 6, 5, 'tr')
+            store.record_game('john', True, 2, 5, 'en', duration=30.0)
+            store.close()
+            
+            boards = LeaderboardSet(path)
+            self.assertEqual(boards.rank('mehmet', 'tr', 5), 1)
+            self.assertEqual(boards.rank('ayse', 'tr', 5), 2)
+            self.assertEqual(boards.top('en', 5), [
+                {'rank': 1, 'player_id': 'john', 'attempts': 2, 'time_ms': 30000}
+            ])
+            
+            # Profillerden yeniden oluşturma aynı sonucu vermeli
+            rebuilt = LeaderboardSet(None)
+            self.assertEqual(rebuilt.rebuild_from_profiles(
+                ProfileStore(os.path.join(temp_dir, 'profiles'))), 4)
+            self.assertEqual(rebuilt.top('tr', 5), boards.top('tr', 5))
+        finally:
+            shutil.rmtree(temp_dir)
+            
+    def test_oversize_player_id_rejected(self):
+        """Kaydedilemeyecek uzunluktaki kimlik sonraki yazmaları bozmamalı"""
+        temp_dir = tempfile.mkdtemp()
+        try:
+            boards = LeaderboardSet(os.path.join(temp_dir, 'leaderboard.bin'), flush_delay=None)
+            with self.assertRaises(ValueError):
+                boards.record_game('ş' * 128, True, 3, 5, 'tr')
+            self.assertEqual(boards.record_game('ayse', True, 3, 5, 'tr'), 1)
+            self.assertTrue(boards.flush())
+            self.assertEqual(LeaderboardSet(boards.path).rank('ayse', 'tr', 5), 1)
+        finally:
+            shutil.rmtree(temp_dir)
+
+
+class TestStatsExport(unittest.TestCase):
+    """Akışlı dışa aktarma testleri"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.stats_file = os.path.join(self.temp_dir, 'statistics.json')
+        self.stats = Statistics(self.stats_file, flush_delay=None)
+        self.stats.record_game(True, 3, 5, 'tr', duration=61.5, word_id=12)
+        self.stats.record_game(False, 6, 6, 'en')
+        
+    def tearDown(self):
+        self.stats.close()
+        shutil.rmtree(self.temp_dir)
+        
+    def test_ndjson_games(self):
+        """Her oyun bir JSON satırı olmalı"""
+        path = os.path.join(self.temp_dir, 'games.ndjson')
+        self.assertEqual(export_to_file(self.stats, path), 2)
+        with open(path, encoding='utf-8') as f:
+            rows = [json.loads(line) for line in f]
+        self.assertEqual(rows[0]['duration_ms'], 61500)
+        self.assertEqual(rows[0]['word_id'], 12)
+        self.assertFalse(rows[1]['won'])
+        
+    def test_gzip_csv_and_filters(self):
+        """gzip'li CSV ve filtreler"""
+        import csv
+        import gzip
+        path = os.path.join(self.temp_dir, 'games.csv.gz')
+        self.assertEqual(export_to_file(self.stats, path, language='en'), 1)
+        with gzip.open(path, 'rt', encoding='utf-8') as f:
+            rows = list(csv.DictReader(f))
+        self.assertEqual(len(rows), 1)
+        self.assertEqual(rows[0]['language'], 'en')
+        self.assertEqual(rows[0]['word_length'], '6')
+        
+    def test_aggregates_and_cli(self):
+        """Toplamlar komut satırından dışa aktarılabilmeli"""
+        self.stats.close()
+        path = os.path.join(self.temp_dir, 'aggregates.ndjson')
+        with patch('builtins.print'):
+            export_main(['--stats', self.stats_file, '--kind', 'aggregates', '-o', path])
+        with open(path, encoding='utf-8') as f:
+            rows = {(r['section'], r['key']): r['value'] for r in map(json.loads, f)}
+        self.assertEqual(rows[('summary', 'games_played')], 2)
+        self.assertEqual(rows[('by_language', 'en.played')], 1)
+        self.assertEqual(rows[('last_7_days', 'played')], 2)
+        
+    def test_gzip_to_stdout(self):
+        """--gzip standart çıktıda da sıkıştırmalı"""
+        import gzip
+        self.stats.close()
+        output = subprocess.run(
+            [sys.executable, 'stats_export.py', '--stats', self.stats_file, '--gzip'],
+            check=True, capture_output=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        ).stdout
+        lines = gzip.decompress(output).decode('utf-8').splitlines()
+        self.assertEqual(len(lines), 2)
+        self.assertEqual(json.loads(lines[0])['word_id'], 12)
+        
+    def test_cli_source_read_only(self):
+        """Kaynak depo değiştirilmemeli; standart çıktıda yalnızca veri olmalı"""
+        self.stats.history.record(True, 2, 5, 'tr', timestamp=1700000000)
+        self.stats.close()
+        history_file = self.stats.history.path
+        with open(history_file, 'ab') as f:
+            f.write(b'\x01\x02')  # yarım kayıt
+        os.remove(self.stats_file + '.lock')
+        before = {path: open(path, 'rb').read() for path in (self.stats_file, history_file)}
+        
+        result = subprocess.run(
+            [sys.executable, 'stats_export.py', '--stats', self.stats_file],
+            check=True, capture_output=True, text=True,
+            cwd=os.path.dirname(os.path.abspath(__file__))
+        )
+        rows = [json.loads(line) for line in result.stdout.splitlines()]
+        self.assertEqual(len(rows), 3)
+        for path, data in before.items():
+            with open(path, 'rb') as f:
+                self.assertEqual(f.read(), data)
+        self.assertFalse(os.path.exists(self.stats_file + '.lock'))
+        
+        readonly = Statistics(self.stats_file, read_only=True)
+        self.assertEqual(readonly.stats['games_played'], 3)
+        with self.assertRaises(PermissionError):
+            readonly.record_game(True, 3, 5, 'tr')
+        readonly.close()
+        
+    def test_streaming_constant_memory(self):
+        """Büyük geçmiş bellekte biriktirilmeden aktarılmalı"""
+        import tracemalloc
+        for i in range(20000):
+            self.stats.history.record(i % 3 != 0, 4, 5, 'tr', timestamp=1700000000 + i)
+            
+        chunks = iter_export(self.stats, 'games', 'csv')
+        self.assertFalse(isinstance(chunks, (list, tuple, str)))
+        
+        tracemalloc.start()
+        count = export_to_file(self.stats, os.path.join(self.temp_dir, 'big.csv'))
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        self.assertEqual(count, 20002)
+        self.assertLess(peak, 1024 * 1024)
+
+
+class TestGameHistory(unittest.TestCase):
+    """Oyun geçmişi günlüğü testleri"""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.mkdtemp()
+        self.path = os.path.join(self.temp_dir, 'games.history')
+        self.history = GameHistory(self.path)
+        
+    def tearDown(self):
+        self.history.close()
+        shutil.rmtree(self.temp_dir)
+        
+    def test_record_roundtrip(self):
+        """Kayıt 16 bayt olmalı ve aynen geri okunmalı"""
+        record = self.history.record(True, 3, 6, 'tr', duration=12.345,
+                                     word_id=4021, timestamp=1700000000)
+        self.assertEqual(RECORD.size, 16)
+        self.assertEqual(os.path.getsize(self.path), 16)
+        self.assertEqual(list(self.history.iter_records()), [record])
+        self.assertEqual(record, GameRecord(1700000000, 'tr', 6, 3, True, 12345, 4021))
+        
+    def test_query_filters(self):
+        """Zaman, dil ve uzunluk filtreleri"""
+        self.history.record(True, 3, 6, 'tr', timestamp=1000)
+        self.history.record(True, 5, 6, 'tr', timestamp=5000)
+        self.history.record(False, 6, 6, 'tr', timestamp=6000)
+        self.history.record(True, 2, 5, 'tr', timestamp=6000)
+        self.history.record(True, 2, 6, 'en', timestamp=6000)
+        
+        result = self.history.query(since=2000, language='tr', word_length=6)
+        self.assertEqual(result['played'], 2)
+        self.assertEqual(result['won'], 1)
+        self.assertEqual(result['win_rate'], 50.0)
+        self.assertEqual(result['average_attempts'], 5.0)
+        
+    def test_torn_tail_truncated(self):
+        """Yarım kalan son kayıt açılışta kesilmeli"""
+        self.history.record(True, 3, 5, 'tr')
+        self.history.close()
+        with open(self.path, 'ab') as f:
+            f.write(b'\x01\x02\x03')
+            
+        reopened = GameHistory(self.path)
+        self.assertEqual(len(reopened), 1)
+        reopened.record(False, 6, 5, 'tr')
+        self.assertEqual([r.won for r in reopened.iter_records()], [True, False])
+        reopened.close()
+        
+    def test_append_handle(self):
+        """Ekleme tanıtıcısı açık tutulmalı; keep_open=False ise tutulmamalı"""
+        self.history.record(True, 3, 5, 'tr')
+        handle = self.history._file
+        self.history.record(True, 4, 5, 'tr')
+        self.assertIsNotNone(handle)
+        self.assertIs(self.history._file, handle)
+        
+        transient = GameHistory(os.path.join(self.temp_dir, 'transient.history'), keep_open=False)
+        transient.record(True, 3, 5, 'tr')
+        self.assertIsNone(transient._file)
+        self.assertEqual(len(list(transient.iter_records())), 1)
 
 
 class TestThemes(unittest.TestCase):
@@ -303,6 +1159,117 @@ class TestThemes(unittest.TestCase):
         correct_hex = theme.get_hex_color('correct')
         self.assertTrue(correct_hex.startswith('#'))
         
+    def test_palette_tables(self):
+        """Önceden çözülmüş, değiştirilemez renk tabloları"""
+        theme = self.theme_manager.get_theme('classic')
+        light = self.theme_manager.get_palette(False)
+        dark = self.theme_manager.get_palette(True)
+        
+        self.assertEqual(light['correct'], theme.get_color('correct'))
+        self.assertEqual(dark['background'], theme.get_color('background_dark'))
+        self.assertEqual(self.theme_manager.get_color('background', True), dark['background'])
+        self.assertIsInstance(light['correct'], tuple)
+        with self.assertRaises(TypeError):
+            light['correct'] = (0, 0, 0, 1)
+        
+        # Tanımsız renk beyaz
+        self.assertEqual(self.theme_manager.get_color('nonexistent'), (1.0, 1.0, 1.0, 1.0))
+        
+    def test_change_notification(self):
+        """Sürüm ve abonelere bildirim yalnızca gerçek değişimde"""
+        calls = []
+        self.theme_manager.subscribe(calls.append)
+        version = self.theme_manager.version
+        
+        self.theme_manager.set_current_theme('classic')
+        self.theme_manager.set_current_theme('nonexistent')
+        self.assertEqual(self.theme_manager.version, version)
+        self.assertEqual(calls, [])
+        
+        self.theme_manager.set_current_theme('neon')
+        self.assertEqual(calls, [version + 1])
+        self.assertEqual(self.theme_manager.get_palette()['correct'],
+                         self.theme_manager.get_theme('neon').get_color('correct'))
+        
+        self.theme_manager.unsubscribe(calls.append)
+        self.theme_manager.set_current_theme('ocean')
+        self.assertEqual(len(calls), 1)
+        
+    def test_live_repaint(self):
+        """Tema değişimi kayıtlı widget'ları tek karede yeniden boyar"""
+        from kivy.clock import Clock
+        
+        class FakeWidget:
+            def __init__(self):
+                self.repaints = []
+                self.md_bg_color = None
+                
+            def apply_theme(self, palette):
+                self.repaints.append(palette['correct'])
+                
+        box, button, dropped = FakeWidget(), FakeWidget(), FakeWidget()
+        self.theme_manager.register_widget(box)
+        self.theme_manager.register_widget(dropped)
+        self.theme_manager.bind_color(button, 'md_bg_color', 'correct')
+        self.assertEqual(button.md_bg_color, self.theme_manager.get_color('correct'))
+        del dropped
+        
+        # Aynı karedeki iki değişiklik tek boyama
+        self.theme_manager.set_current_theme('neon')
+        self.theme_manager.set_current_theme('ocean')
+        self.assertEqual(box.repaints, [])
+        Clock.tick()
+        
+        ocean = self.theme_manager.get_theme('ocean').get_color('correct')
+        self.assertEqual(box.repaints, [ocean])
+        self.assertEqual(button.md_bg_color, ocean)
+        self.assertEqual(self.theme_manager.repaint_widgets(), 2)
+        
+        # Koyu kip de yeniden boyar
+        self.theme_manager.set_dark_mode(True)
+        self.theme_manager.repaint_widgets()
+        self.assertEqual(button.md_bg_color, self.theme_manager.get_color('correct', True))
+        
+    def test_theme_packs_lazy(self):
+        """Paket temaları açılışta yalnızca dizinden kaydedilir"""
+        self.assertGreaterEqual(len(self.theme_manager.get_theme_names()), 8)
+        neon = self.theme_manager.get_theme('neon')
+        self.assertEqual(neon.display_name, 'Neon')
+        self.assertFalse(neon.is_loaded)
+        
+        self.theme_manager.set_current_theme('neon')
+        self.assertTrue(neon.is_loaded)
+        self.assertEqual(self.theme_manager.get_hex_color('correct'), '#00ff00')
+        
+    def test_invalid_theme_pack(self):
+        """Geçersiz paketler dizine alınmaz, bozuk dosya klasik renklere düşer"""
+        packs_dir = tempfile.mkdtemp()
+        try:
+            good = dict(CLASSIC_COLORS, correct='#123456')
+            bad = dict(CLASSIC_COLORS, present='sarı')
+            del bad['keyboard']
+            for name, colors in (('good', good), ('bad', bad)):
+                with open(os.path.join(packs_dir, f"{name}.json"), 'w', encoding='utf-8') as f:
+                    json.dump({'name': name, 'display_name': name.title(), 'colors': colors}, f)
+            
+            self.assertEqual(build_index(packs_dir), 1)
+            manager = ThemeManager(packs_dir)
+            self.assertEqual(manager.get_theme_names(), ['classic', 'good'])
+            self.assertEqual(manager.get_theme('good').get_hex_color('correct'), '#123456')
+            
+            # Dizinden sonra bozulan dosya
+            with open(os.path.join(packs_dir, 'good.json'), 'w', encoding='utf-8') as f:
+                f.write('{bozuk')
+            manager = ThemeManager(packs_dir)
+            self.assertTrue(manager.set_current_theme('good'))
+            self.assertEqual(manager.get_hex_color('correct'), CLASSIC_COLORS['correct'])
+            
+            # Dizin yoksa yalnızca klasik tema
+            self.assertEqual(ThemeManager(os.path.join(packs_dir, 'yok')).get_theme_names(),
+                             ['classic'])
+        finally:
+            shutil.rmtree(packs_dir)
+        
     def test_all_themes_loaded(self):
         """Tüm temalar yüklendi mi"""
         themes = self.theme_manager.get_all_themes()
@@ -378,6 +1345,688 @@ class TestSecurity(unittest.TestCase):
         
         self.cache.clear_cache()
         self.assertFalse(self.cache.is_cached('test'))
+        
+    def test_cache_recency_and_counters(self):
+        """Son erişilen girdi korunmalı; isabet/kaçırma/çıkarma sayılmalı"""
+        self.cache.cache_words('key1', ['A'])
+        self.cache.cache_words('key2', ['B'])
+        self.cache.cache_words('key3', ['C'])
+        for _ in range(5):
+            self.cache.get_cached_words('key2')
+        self.cache.get_cached_words('key1')
+        self.cache.get_cached_words('missing')
+        
+        # key2 çok kullanıldı ama key3'ten önce erişildi; sırada key3 ilk
+        self.cache.cache_words('key4', ['D'])
+        self.cache.cache_words('key5', ['E'])
+        self.assertFalse(self.cache.is_cached('key3'))
+        self.assertFalse(self.cache.is_cached('key2'))
+        self.assertTrue(self.cache.is_cached('key1'))
+        
+        stats = self.cache.get_cache_stats()
+        self.assertEqual((stats['hits'], stats['misses'], stats['evictions']), (6, 1, 2))
+        
+    def test_cache_byte_budget(self):
+        """Bayt bütçesi aşılınca eski girdiler çıkarılmalı"""
+        words = ['KELIME%d' % i for i in range(100)]
+        cache = WordCache(cache_size=100, max_bytes=1)
+        cache.cache_words('a', words)
+        self.assertTrue(cache.is_cached('a'))
+        
+        cache.cache_words('b', words)
+        self.assertFalse(cache.is_cached('a'))
+        self.assertTrue(cache.is_cached('b'))
+        self.assertGreater(cache.get_cache_stats()['bytes'], 100 * len(words[0]))
+        
+    def test_word_hash_cache_per_instance(self):
+        """Hash önbelleği örneğe ait olmalı ve örneği canlı tutmamalı"""
+        import gc
+        import weakref
+        cache = WordCache()
+        self.assertEqual(cache.get_word_hash('ELMA'), cache.get_word_hash('ELMA'))
+        self.assertEqual(len(cache.get_word_hash('ELMA')), 16)
+        
+        ref = weakref.ref(cache)
+        del cache
+        gc.collect()
+        self.assertIsNone(ref())
+        
+    def test_hashed_answer_store(self):
+        """Özet deposu üyelik, sıra ve tek kelime çözme sağlamalı"""
+        words = ['ARMUT', 'ÇİÇEK', 'MANGO', 'ARMUT']
+        store = HashedAnswerStore(words, self.encryption)
+        
+        self.assertEqual(len(store), 4)
+        self.assertIn('ÇİÇEK', store)
+        self.assertNotIn('KAVUN', store)
+        self.assertEqual(store.index_of('ARMUT'), 0)
+        self.assertEqual(store.index_of('KAVUN'), -1)
+        self.assertEqual([store.reveal(i) for i in range(len(store))], words)
+        self.assertNotIn('MANGO'.encode('utf-8'), store._blob)
+        
+        # Farklı anahtar farklı özetler üretmeli
+        other = HashedAnswerStore(words, WordEncryption(key="BASKA"))
+        self.assertNotEqual(list(store._slots), list(other._slots))
+        
+    def test_concurrent_cache_api(self):
+        """Şeritli önbellek WordCache arayüzünü korumalı"""
+        cache = ConcurrentWordCache(cache_size=32, stripes=4)
+        cache.cache_words('tr_5', ['ELMA'])
+        self.assertEqual(cache.get_cached_words('tr_5'), ['ELMA'])
+        self.assertIsNone(cache.get_cached_words('en_5'))
+        self.assertTrue(cache.is_cached('tr_5'))
+        
+        stats = cache.get_cache_stats()
+        self.assertEqual((stats['total_items'], stats['hits'], stats['misses']), (1, 1, 1))
+        self.assertEqual(stats['stripes'], 4)
+        cache.clear_cache()
+        self.assertFalse(cache.is_cached('tr_5'))
+        
+    def test_concurrent_cache_single_flight(self):
+        """Eşzamanlı eksik anahtar için yükleyici bir kez çağrılmalı"""
+        import threading
+        from concurrent.futures import ThreadPoolExecutor
+        cache = ConcurrentWordCache(stripes=4)
+        calls = []
+        release = threading.Event()
+        
+        def loader():
+            calls.append(1)
+            release.wait(5)
+            return ['ELMA', 'ARMUT']
+            
+        with ThreadPoolExecutor(max_workers=8) as pool:
+            futures = [pool.submit(cache.get_or_load, 'tr_5', loader) for _ in range(8)]
+            deadline = time.time() + 5
+            while cache.get_cache_stats()['coalesced_loads'] < 7 and time.time() < deadline:
+                time.sleep(0.001)
+            release.set()
+            results = [future.result(timeout=5) for future in futures]
+            
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(result == ['ELMA', 'ARMUT'] for result in results))
+        stats = cache.get_cache_stats()
+        self.assertEqual((stats['loads'], stats['coalesced_loads']), (1, 7))
+        self.assertIn('lock_contended', stats)
+        
+    def test_concurrent_cache_loader_error(self):
+        """Yükleyici hatası bekleyenlere iletilmeli ve anahtar yeniden denenebilmeli"""
+        cache = ConcurrentWordCache(stripes=2)
+        
+        def failing():
+            raise OSError("okunamadı")
+            
+        with self.assertRaises(OSError):
+            cache.get_or_load('k', failing)
+        self.assertEqual(cache.get_or_load('k', lambda: ['A']), ['A'])
+        
+    def test_snapshot_warm_restart(self):
+        """Anlık görüntü kaynak değişmedikçe çözmeden geri yüklenmeli"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, 'words.txt')
+            bundle = os.path.join(temp_dir, 'words.bundle')
+            snapshot = os.path.join(temp_dir, 'words.cache')
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write('elma\narmut\nmango\n')
+                
+            cold = SecureWordManager(encryption_key="TEST_KEY", snapshot_file=snapshot)
+            cold.convert_plaintext_to_bundle(source, bundle)
+            self.assertEqual(cold.load_words_secure(bundle, 5), ['ARMUT', 'MANGO'])
+            self.assertEqual(cold.save_snapshot(), 1)
+            
+            with patch.object(WordBundle, 'read') as read:
+                warm = SecureWordManager(encryption_key="TEST_KEY", snapshot_file=snapshot,
+                                         thread_safe=True)
+                self.assertEqual(warm.load_words_secure(bundle, 5), ['ARMUT', 'MANGO'])
+                read.assert_not_called()
+                
+            # Kaynak değişince eski girdi kullanılmamalı
+            cold.encryption.save_bundle(['KAVUN'], bundle)
+            stale = SecureWordManager(encryption_key="TEST_KEY", snapshot_file=snapshot)
+            self.assertFalse(stale.cache.is_cached(f"{bundle}_5"))
+            self.assertEqual(stale.load_words_secure(bundle, 5), ['KAVUN'])
+        
+    def test_failed_load_not_cached(self):
+        """Geçici okuma hatası önbelleğe ve anlık görüntüye girmemeli"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, 'words.txt')
+            bundle = os.path.join(temp_dir, 'words.bundle')
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write('elma\narmut\n')
+            manager = SecureWordManager(encryption_key="TEST_KEY",
+                                        snapshot_file=os.path.join(temp_dir, 'words.cache'))
+            manager.convert_plaintext_to_bundle(source, bundle)
+            
+            with patch.object(WordBundle, 'read', side_effect=OSError("geçici")):
+                self.assertEqual(manager.load_words_secure(bundle, 5), [])
+            self.assertFalse(manager.cache.is_cached(f"{bundle}_5"))
+            self.assertEqual(manager.save_snapshot(), 0)
+            self.assertEqual(manager.load_words_secure(bundle, 5), ['ARMUT'])
+            
+    def test_bundle_roundtrip(self):
+        """Şifreli paket uzunluğa göre bölümleri geri vermeli"""
+        words = ['ELMA', 'ARMUT', 'ÇİÇEK', 'KARPUZ', 'ŞEKER']
+        data = self.encryption.encode_bundle(words)
+        
+        self.assertNotIn('ARMUT'.encode('utf-8'), data)
+        self.assertEqual(self.encryption.decode_bundle(data),
+                         {('', 4): ['ELMA'], ('', 5): ['ARMUT', 'ÇİÇEK', 'ŞEKER'],
+                          ('', 6): ['KARPUZ']})
+        self.assertEqual(self.encryption.decode_bundle(data, 6), {('', 6): ['KARPUZ']})
+        
+    def test_bundle_tamper_detected(self):
+        """Değiştirilmiş paket veya yanlış anahtar reddedilmeli"""
+        data = bytearray(self.encryption.encode_bundle(['ELMA', 'ARMUT']))
+        with self.assertRaises(ValueError):
+            WordEncryption(key="BASKA").decode_bundle(bytes(data))
+            
+        data[-1] ^= 1
+        with self.assertRaises(ValueError):
+            self.encryption.decode_bundle(bytes(data))
+        # Bozuk bölüm istenmedikçe doğrulanmaz
+        self.assertEqual(self.encryption.decode_bundle(bytes(data), 4), {('', 4): ['ELMA']})
+        
+    def test_bundle_sections_by_language(self):
+        """Paket yalnızca istenen (dil, uzunluk) bölümünü okumalı"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'words.bundle')
+            self.encryption.save_bundle({'tr': ['ELMA', 'ARMUT'], 'en': ['APPLE', 'PEAR']}, path)
+            
+            with WordBundle(path, self.encryption) as bundle:
+                self.assertEqual(
+                    sorted((s.language, s.length, s.count) for s in bundle.sections()),
+                    [('en', 4, 1), ('en', 5, 1), ('tr', 4, 1), ('tr', 5, 1)]
+                )
+                self.assertEqual(bundle.read(5, 'tr'), ['ARMUT'])
+                self.assertEqual(sorted(bundle.read(5)), ['APPLE', 'ARMUT'])
+                
+                # Başka bir bölümün bozulması istenen bölümü etkilememeli
+                section = next(s for s in bundle.sections() if s.language == 'en' and s.length == 4)
+            with open(path, 'r+b') as f:
+                f.seek(section.offset)
+                byte = f.read(1)[0]
+                f.seek(section.offset)
+                f.write(bytes([byte ^ 0xFF]))
+            with WordBundle(path, self.encryption) as bundle:
+                self.assertEqual(bundle.read(4, 'tr'), ['ELMA'])
+                with self.assertRaises(ValueError):
+                    bundle.read(4, 'en')
+        
+    def test_secure_manager_reads_bundle(self):
+        """SecureWordManager paketi biçiminden tanıyıp yüklemeli"""
+        with tempfile.TemporaryDirectory() as temp_dir:
+            source = os.path.join(temp_dir, 'words.txt')
+            bundle = os.path.join(temp_dir, 'words.bundle')
+            with open(source, 'w', encoding='utf-8') as f:
+                f.write('elma\narmut\nkarpuz\nmango\n')
+                
+            manager = SecureWordManager(encryption_key="TEST_KEY")
+            manager.convert_plaintext_to_bundle(source, bundle)
+            self.assertEqual(manager.load_words_secure(bundle, 5), ['ARMUT', 'MANGO'])
+
+
+class TestGameServer(unittest.TestCase):
+    """Asyncio oyun sunucusu testleri (loopback)"""
+    
+    async def _http(self, port, method, path, body=None):
+        """Tek bir HTTP isteği gönder"""
+        reader, writer = await asyncio.open_connection('127.0.0.1', port)
+        data = json.dumps(body).encode('utf-8') if body is not None else b''
+        writer.write(
+            f"{method} {path} HTTP/1.1\r\nHost: x\r\n"
+            f"Content-Length: {len(data)}\r\nConnection: close\r\n\r\n".encode() + data
+        )
+        await writer.drain()
+        raw = await reader.read()
+        writer.close()
+        head, _, payload = raw.partition(b'\r\n\r\n')
+        status = int(head.split(b' ')[1])
+        return status, json.loads(payload.decode('utf-8'))
+        
+    def test_http_session_flow(self):
+        """Oturum oluştur, tahmin yap, sil"""
+        async def scenario():
+            game_server = GameServer(port=0)
+            await game_server.start()
+            try:
+                port = game_server.port
+                status, state = await self._http(
+                    port, 'POST', '/sessions', {'language': 'en', 'word_length': 5}
+                )
+                self.assertEqual(status, 201)
+                session_id = state['session_id']
+                self.assertNotIn('secret_word', state)
+                
+                secret = game_server.sessions.get(session_id).secret_word
+                status, state = await self._http(
+                    port, 'POST', f'/sessions/{session_id}/guess', {'guess': secret}
+                )
+                self.assertEqual(status, 200)
+                self.assertTrue(state['won'])
+                self.assertEqual(state['pattern'], 3 ** 5 - 1)
+                self.assertEqual(state['secret_word'], secret)
+                
+                status, _ = await self._http(port, 'DELETE', f'/sessions/{session_id}')
+                self.assertEqual(status, 200)
+                status, _ = await self._http(port, 'GET', f'/sessions/{session_id}')
+                self.assertEqual(status, 404)
+            finally:
+                await game_server.stop()
+                
+        asyncio.run(scenario())
+        
+    def test_websocket_and_concurrency(self):
+        """WebSocket üzerinden eşzamanlı oturumlar"""
+        guess = WordManager().load_words(5, 'en')[0]
+        
+        async def client(port):
+            reader, writer = await asyncio.open_connection('127.0.0.1', port)
+            writer.write(
+                b"GET /ws HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\n"
+                b"Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n"
+                b"Sec-WebSocket-Version: 13\r\n\r\n"
+            )
+            head = await reader.readuntil(b'\r\n\r\n')
+            self.assertIn(b's3pPLMBiTxaQ9kYGzzhZRbK+xOo=', head)
+            
+            async def call(message):
+                data = json.dumps(message).encode('utf-8')
+                writer.write(encode_ws_frame(data, mask=b'abcd'))
+                await writer.drain()
+                _, payload = await read_ws_frame(reader)
+                return json.loads(payload.decode('utf-8'))
+                
+            state = await call({'action': 'new', 'language': 'en', 'word_length': 5})
+            state = await call({'action': 'guess', 'session_id': state['session_id'],
+                                'guess': guess})
+            writer.close()
+            return state
+            
+        async def scenario():
+            game_server = GameServer(port=0)
+            await game_server.start()
+            try:
+                states = await asyncio.gather(*(client(game_server.port) for _ in range(50)))
+            finally:
+                await game_server.stop()
+            self.assertEqual(len(game_server.sessions), 50)
+            for state in states:
+                self.assertEqual(state['attempts_used'], 1)
+                
+        asyncio.run(scenario())
+        
+    def test_guesses_scored_in_batches(self):
+        """Eşzamanlı klasik tahminler toplu değerlendiriciden geçmeli"""
+        guess = WordManager().load_words(5, 'en')[0]
+        
+        async def scenario():
+            game_server = GameServer(port=0)
+            states = [await game_server.dispatch('new', {'language': 'en'}) for _ in range(20)]
+            responses = await asyncio.gather(*(
+                game_server.submit_guess(state['session_id'], guess.lower()) for state in states
+            ))
+            return game_server, states, responses
+            
+        game_server, states, responses = asyncio.run(scenario())
+        metrics = game_server.batcher.get_metrics()
+        self.assertEqual(metrics['requests'], 20)
+        self.assertEqual(metrics['batches'], 1)
+        for state, response in zip(states, responses):
+            secret = game_server.sessions.get(state['session_id']).secret_word
+            expected = GameLogic(secret, 5, verbose=False).evaluate_guess(guess)
+            self.assertEqual(response['result'], expected)
+            self.assertEqual(response['attempts_used'], 1)
+            
+    def test_guess_validation_and_absurdle(self):
+        """Listede olmayan kelime reddedilmeli; Absurdle tahmini döngü dışında çalışmalı"""
+        guess = WordManager().load_words(5, 'en')[0]
+        
+        async def scenario():
+            with tempfile.TemporaryDirectory() as temp_dir:
+                game_server = GameServer(port=0, sessions=SessionRegistry(spill_dir=temp_dir))
+                state = await game_server.dispatch('new', {'language': 'en', 'mode': 'absurdle'})
+                session_id = state['session_id']
+                with self.assertRaises(RequestError) as ctx:
+                    await game_server.submit_guess(session_id, 'ZZZZZ')
+                self.assertEqual(ctx.exception.status, 400)
+                
+                loop = asyncio.get_running_loop()
+                with patch.object(loop, 'run_in_executor', wraps=loop.run_in_executor) as executor:
+                    state = await game_server.submit_guess(session_id, guess)
+                self.assertTrue(any(call.args[1].__name__ == 'make_guess'
+                                    for call in executor.call_args_list))
+                return state
+                
+        state = asyncio.run(scenario())
+        self.assertEqual(state['attempts_used'], 1)
+        
+    def test_invalid_field_types(self):
+        """Hatalı alan türleri bağlantıyı düşürmeden 400 döndürmeli"""
+        game_server = GameServer(port=0)
+        for payload in ({'word_length': None}, {'word_length': [5]}, {'language': 1}):
+            with self.assertRaises(RequestError) as ctx:
+                asyncio.run(game_server.dispatch('new', payload))
+            self.assertEqual(ctx.exception.status, 400)
+        with self.assertRaises(RequestError):
+            asyncio.run(game_server.dispatch('state', {'session_id': ['x']}))
+            
+        async def scenario():
+            await game_server.start()
+            try:
+                status, body = await self._http(game_server.port, 'POST', '/sessions',
+                                                {'word_length': None})
+                self.assertEqual(status, 400)
+                self.assertIn('error', body)
+                
+                # Parçalı çerçeve 1003 ile kapatılır
+                reader, writer = await asyncio.open_connection('127.0.0.1', game_server.port)
+                writer.write(
+                    b"GET /ws HTTP/1.1\r\nHost: x\r\nUpgrade: websocket\r\n"
+                    b"Connection: Upgrade\r\nSec-WebSocket-Key: dGhlIHNhbXBsZSBub25jZQ==\r\n\r\n"
+                )
+                await reader.readuntil(b'\r\n\r\n')
+                frame = bytearray(encode_ws_frame(b'{"action":', mask=b'abcd'))
+                frame[0] &= 0x7F  # FIN biti yok
+                writer.write(bytes(frame))
+                await writer.drain()
+                opcode, payload = await read_ws_frame(reader)
+                self.assertEqual(opcode, 0x8)
+                self.assertEqual(payload, (1003).to_bytes(2, 'big'))
+                writer.close()
+            finally:
+                await game_server.stop()
+                
+        with patch('builtins.print'):
+            asyncio.run(scenario())
+            
+    def test_no_kivy_import(self):
+        """Sunucu süreci Kivy yüklememeli"""
+        code = (
+            "import sys, server\n"
+            "assert not any(m.split('.')[0] in ('kivy', 'kivymd') for m in sys.modules)"
+        )
+        subprocess.run([sys.executable, '-c', code], check=True,
+                       cwd=os.path.dirname(os.path.abspath(__file__)))
+
+
+class TestSessionRegistry(unittest.TestCase):
+    """Oturum kaydı testleri"""
+    
+    def setUp(self):
+        """Sahte saat ve geçici dizin"""
+        self.now = 0.0
+        self.temp_dir = tempfile.mkdtemp()
+        
+    def tearDown(self):
+        shutil.rmtree(self.temp_dir, ignore_errors=True)
+        
+    def make_registry(self, **kwargs):
+        return SessionRegistry(clock=lambda: self.now, **kwargs)
+        
+    def test_lru_eviction(self):
+        """Kapasite aşılınca en eski oturum çıkarılmalı"""
+        registry = self.make_registry(capacity=2, ttl=None)
+        registry.put('a', GameLogic('ELMA', 6, verbose=False))
+        registry.put('b', GameLogic('ARMUT', 6, verbose=False))
+        self.assertIsNotNone(registry.get('a'))
+        registry.put('c', GameLogic('KAVUN', 6, verbose=False))
+        
+        self.assertIn('a', registry)
+        self.assertNotIn('b', registry)
+        self.assertEqual(registry.get_metrics()['evictions'], 1)
+        
+    def test_ttl_expiration(self):
+        """Süresi dolan oturum çıkarılmalı"""
+        registry = self.make_registry(capacity=10, ttl=60)
+        registry.put('a', GameLogic('ELMA', 6, verbose=False))
+        self.now = 30
+        registry.put('b', GameLogic('ARMUT', 6, verbose=False))
+        self.now = 70
+        
+        self.assertIsNone(registry.get('a'))
+        self.assertIsNotNone(registry.get('b'))
+        metrics = registry.get_metrics()
+        self.assertEqual(metrics['expirations'], 1)
+        self.assertEqual(metrics['hits'], 1)
+        self.assertEqual(metrics['misses'], 1)
+        
+    def test_spill_and_revive(self):
+        """Çıkarılan oyun diskten canlandırılmalı"""
+        registry = self.make_registry(capacity=1, ttl=None, spill_dir=self.temp_dir)
+        game = GameLogic('ELMA', 6, verbose=False)
+        game.make_guess('ALMA')
+        registry.put('a', game)
+        registry.put('b', GameLogic('ARMUT', 6, verbose=False))
+        self.assertNotIn('a', registry)
+        
+        revived = registry.get('a')
+        self.assertEqual(revived.secret_word, 'ELMA')
+        self.assertEqual(revived.get_guess_history(), game.get_guess_history())
+        self.assertEqual(registry.get_metrics()['revivals'], 1)
+        
+    def test_unsafe_session_id_not_spilled(self):
+        """Yol içeren kimlikler diske yazılmamalı"""
+        registry = self.make_registry(capacity=1, ttl=None, spill_dir=self.temp_dir)
+        registry.put('../x', GameLogic('ELMA', 6, verbose=False))
+        registry.put('b', GameLogic('ARMUT', 6, verbose=False))
+        self.assertIsNone(registry.get('../x'))
+        self.assertEqual(os.listdir(self.temp_dir), [])
+        
+    def test_spilled_sessions_expire_and_are_bounded(self):
+        """Diskteki oturumlara TTL uygulanmalı ve dosya sayısı sınırlı olmalı"""
+        registry = self.make_registry(capacity=1, ttl=60, spill_dir=self.temp_dir,
+                                      spill_capacity=2)
+        for i, session_id in enumerate(('a', 'b', 'c', 'd')):
+            self.now = i
+            registry.put(session_id, GameLogic('ELMA', 6, verbose=False))
+        # a silindi (sınır), b ve c diskte, d bellekte
+        self.assertEqual(sorted(os.listdir(self.temp_dir)), ['b.json', 'c.json'])
+        self.assertEqual(registry.get_metrics()['spill_drops'], 1)
+        
+        self.now = 61.5
+        registry.evict_expired()
+        self.assertEqual(os.listdir(self.temp_dir), ['c.json'])
+        self.assertIsNone(registry.get('b'))
+        
+        # Süresi dolan bellekteki oturum diske yazılmaz
+        self.now = 200
+        self.assertIsNone(registry.get('c'))
+        self.assertIsNone(registry.get('d'))
+        self.assertEqual(os.listdir(self.temp_dir), [])
+        self.assertEqual(registry.get_metrics()['spill_expirations'], 2)
+        
+    def test_leftover_spills_adopted(self):
+        """Önceki çalıştırmanın dosyaları yeniden canlandırılabilmeli ve süresi dolmalı"""
+        registry = self.make_registry(capacity=1, ttl=None, spill_dir=self.temp_dir)
+        registry.put('a', GameLogic('ELMA', 6, verbose=False))
+        registry.put('b', GameLogic('ARMUT', 6, verbose=False))
+        registry.put('c', GameLogic('KAVUN', 6, verbose=False))
+        
+        restarted = self.make_registry(capacity=5, ttl=60, spill_dir=self.temp_dir)
+        self.assertEqual(restarted.get_metrics()['spilled'], 2)
+        self.assertEqual(restarted.get('a').secret_word, 'ELMA')
+        self.now = 60
+        restarted.evict_expired()
+        self.assertEqual(os.listdir(self.temp_dir), [])
+
+
+class TestGameStateToken(unittest.TestCase):
+    """İmzalı oyun durumu jetonu testleri"""
+    
+    def setUp(self):
+        self.words = ['ELMA', 'ALMA', 'ARMA', 'OLMA']
+        self.codec = GameStateToken(self.words, WordEncryption(key="TEST_KEY"))
+        
+    def test_round_trip(self):
+        """Jeton oyunu aynen geri kurmalı"""
+        game = GameLogic('ELMA', 6, verbose=False)
+        game.make_guess('ALMA')
+        game.make_guess('XYZT')  # Listede olmayan tahmin
+        
+        restored = self.codec.decode(self.codec.encode(game))
+        self.assertEqual(restored.secret_word, 'ELMA')
+        self.assertEqual(restored.get_guess_history(), game.get_guess_history())
+        self.assertEqual(restored.get_remaining_attempts(), 4)
+        
+        restored.make_guess('ELMA')
+        self.assertTrue(restored.is_won())
+        
+    def test_secret_not_visible(self):
+        """Gizli kelime jetonda açık görünmemeli"""
+        token = self.codec.encode(GameLogic('ELMA', 6, verbose=False))
+        self.assertNotIn('ELMA', token)
+        self.assertNotEqual(token, self.codec.encode(GameLogic('ELMA', 6, verbose=False)))
+        
+    def test_tampering_rejected(self):
+        """Değiştirilmiş veya yanlış anahtarlı jeton reddedilmeli"""
+        token = self.codec.encode(GameLogic('ARMA', 6, verbose=False))
+        tampered = token[:12] + ('A' if token[12] != 'A' else 'B') + token[13:]
+        with self.assertRaises(ValueError):
+            self.codec.decode(tampered)
+            
+        other = GameStateToken(self.words, WordEncryption(key="OTHER_KEY"))
+        with self.assertRaises(ValueError):
+            other.decode(token)
+        with self.assertRaises(ValueError):
+            self.codec.decode('bozuk')
+            
+    def test_secret_key_required(self):
+        """Açık varsayılan anahtarla jeton üretilememeli"""
+        with self.assertRaises(ValueError):
+            GameStateToken(self.words, None)
+        with self.assertRaises(ValueError):
+            GameStateToken(self.words, WordEncryption())
+
+
+class TestGuessBatcher(unittest.TestCase):
+    """Toplu tahmin değerlendirme testleri"""
+    
+    def test_results_match_game_logic(self):
+        """Toplu sonuçlar evaluate_guess ile aynı olmalı"""
+        pairs = [('ELMA', 'ALMA'), ('BOOKS', 'ROBOT'), ('ELMA', 'ARMA'), ('ELMA', 'ALMA')]
+        
+        async def scenario():
+            batcher = GuessBatcher(max_batch_size=100, max_wait=0.01)
+            results = await asyncio.gather(
+                *(batcher.evaluate(guess, secret) for secret, guess in pairs)
+            )
+            return results, batcher.get_metrics()
+            
+        results, metrics = asyncio.run(scenario())
+        for (secret, guess), result in zip(pairs, results):
+            self.assertEqual(result, GameLogic(secret, 6, verbose=False).evaluate_guess(guess))
+        self.assertEqual(metrics['batches'], 1)
+        self.assertEqual(metrics['timer_flushes'], 1)
+        self.assertEqual(metrics['unique_pairs'], 3)
+        
+    def test_batch_size_limit(self):
+        """Toplu iş boyutu aşılınca hemen işlenmeli"""
+        async def scenario():
+            batcher = GuessBatcher(max_batch_size=10, max_wait=0.05)
+            await asyncio.gather(*(batcher.evaluate_code('ELMA', 'ALMA') for _ in range(25)))
+            return batcher.get_metrics()
+            
+        metrics = asyncio.run(scenario())
+        self.assertEqual(metrics['requests'], 25)
+        self.assertEqual(metrics['size_flushes'], 2)
+        self.assertEqual(metrics['max_batch'], 10)
+        
+    def test_reuse_across_event_loops(self):
+        """Aynı değerlendirici yeni bir olay döngüsünde de çalışmalı"""
+        batcher = GuessBatcher(max_batch_size=100, max_wait=0.001)
+        time.sleep(0.2)
+        
+        async def scenario():
+            return await asyncio.gather(*(batcher.evaluate_code('ELMA', 'ALMA') for _ in range(5)))
+            
+        first = asyncio.run(scenario())
+        second = asyncio.run(asyncio.wait_for(scenario(), 5))
+        self.assertEqual(first, second)
+        
+        # Verim oluşturma anından değil ilk istekten ölçülür
+        metrics = batcher.get_metrics()
+        self.assertEqual(metrics['requests'], 10)
+        self.assertGreater(metrics['throughput_per_sec'], 10 / 0.2)
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Metrik kaydı ve Prometheus çıktısı testleri"""
+    
+    def setUp(self):
+        self.registry = MetricsRegistry()
+        
+    def test_render_prometheus(self):
+        """Sayaç, gösterge ve histogram metin biçimi"""
+        counter = self.registry.counter('test_total', 'Sayaç', ('lang',))
+        counter.inc(lang='tr')
+        counter.inc(2, lang='tr')
+        self.registry.gauge('test_fps', 'Gösterge').set(59.5)
+        histogram = self.registry.histogram('test_seconds', 'Histogram', buckets=(0.1, 1.0))
+        histogram.observe(0.05)
+        histogram.observe(0.5)
+        
+        text = self.registry.render()
+        self.assertIn('# TYPE test_total counter', text)
+        self.assertIn('test_total{lang="tr"} 3', text)
+        self.assertIn('test_fps 59.5', text)
+        self.assertIn('test_seconds_bucket{le="0.1"} 1', text)
+        self.assertIn('test_seconds_bucket{le="+Inf"} 2', text)
+        self.assertIn('test_seconds_count 2', text)
+        
+    def test_same_name_returns_same_metric(self):
+        """Aynı ad aynı metriği döndürmeli"""
+        first = self.registry.counter('x_total', 'x')
+        self.assertIs(first, self.registry.counter('x_total', 'x'))
+        with self.assertRaises(ValueError):
+            self.registry.gauge('x_total', 'x')
+            
+    def test_file_and_http_export(self):
+        """Dosya ve yerel HTTP uç noktası"""
+        import urllib.request
+        self.registry.counter('export_total', 'x').inc()
+        
+        with tempfile.TemporaryDirectory() as temp_dir:
+            path = os.path.join(temp_dir, 'metrics.prom')
+            self.registry.write_to_file(path)
+            with open(path, encoding='utf-8') as f:
+                self.assertIn('export_total 1', f.read())
+            
+        port = self.registry.start_http_server(0)
+        try:
+            with urllib.request.urlopen(f'http://127.0.0.1:{port}/metrics') as response:
+                self.assertIn('export_total 1', response.read().decode('utf-8'))
+        finally:
+            self.registry.stop_http_server()
+            
+    def test_record_game_feeds_registry(self):
+        """Statistics.record_game oyun sayacını artırmalı"""
+        before = GAMES_TOTAL.get(language='en', result='lost')
+        temp = tempfile.NamedTemporaryFile(delete=False, suffix='.json')
+        temp.close()
+        try:
+            stats = Statistics(temp.name, flush_delay=None)
+            stats.record_game(False, 6, 5, 'en')
+            stats.close()
+        finally:
+            for path in (temp.name, temp.name + '.lock', stats.history.path):
+                os.remove(path)
+        self.assertEqual(GAMES_TOTAL.get(language='en', result='lost'), before + 1)
+
+            
+    def test_startup_timeline(self):
+        """Açılış zaman çizelgesi bileşen sürelerini kaydetmeli"""
+        timeline = StartupTimeline(self.registry)
+        with timeline.measure('settings'):
+            time.sleep(0.01)
+        with timeline.measure('statistics'):
+            pass
+        
+        self.assertEqual([event[0] for event in timeline.events], ['settings', 'statistics'])
+        self.assertGreaterEqual(timeline.events[0][2], 0.01)
+        self.assertGreaterEqual(timeline.events[1][1], timeline.events[0][1])
+        self.assertIn('settings', timeline.report())
+        self.assertIn('wordle_startup_component_seconds{component="statistics"}',
+                      self.registry.render())
 
 
 class TestIntegration(unittest.TestCase):
@@ -422,11 +2071,14 @@ class TestIntegration(unittest.TestCase):
             self.assertEqual(summary['games_won'], 2)
             
             # Dosyaya kaydedildi mi
+            stats.close()
             self.assertTrue(os.path.exists(stats_file.name))
+            self.assertEqual(Statistics(stats_file.name).stats['games_played'], 3)
             
         finally:
-            if os.path.exists(stats_file.name):
-                os.remove(stats_file.name)
+            for path in (stats_file.name, stats_file.name + '.lock', stats.history.path):
+                if os.path.exists(path):
+                    os.remove(path)
 
 
 def run_all_tests():
@@ -437,10 +2089,22 @@ def run_all_tests():
     
     # Test sınıflarını ekle
     suite.addTests(loader.loadTestsFromTestCase(TestGameLogic))
+    suite.addTests(loader.loadTestsFromTestCase(TestAbsurdle))
     suite.addTests(loader.loadTestsFromTestCase(TestWordManager))
     suite.addTests(loader.loadTestsFromTestCase(TestStatistics))
+    suite.addTests(loader.loadTestsFromTestCase(TestGameHistory))
+    suite.addTests(loader.loadTestsFromTestCase(TestStatisticsMultiprocess))
+    suite.addTests(loader.loadTestsFromTestCase(TestSQLiteStatistics))
+    suite.addTests(loader.loadTestsFromTestCase(TestProfileStore))
+    suite.addTests(loader.loadTestsFromTestCase(TestStatsExport))
+    suite.addTests(loader.loadTestsFromTestCase(TestLeaderboard))
     suite.addTests(loader.loadTestsFromTestCase(TestThemes))
     suite.addTests(loader.loadTestsFromTestCase(TestSecurity))
+    suite.addTests(loader.loadTestsFromTestCase(TestGameServer))
+    suite.addTests(loader.loadTestsFromTestCase(TestSessionRegistry))
+    suite.addTests(loader.loadTestsFromTestCase(TestGameStateToken))
+    suite.addTests(loader.loadTestsFromTestCase(TestGuessBatcher))
+    suite.addTests(loader.loadTestsFromTestCase(TestMetricsRegistry))
     suite.addTests(loader.loadTestsFromTestCase(TestIntegration))
     
     # Test runner
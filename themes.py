@@ -1,32 +1,152 @@
 """
 Tema Yönetim Modülü
 Farklı renk temaları ve özelleştirme seçenekleri
+
+Klasik tema kodun içindedir ve her zaman kullanılabilir. Diğer temalar
+theme_packs/ dizinindeki JSON dosyalarıdır; açılışta yalnızca index.json
+okunur, bir temanın renkleri ilk kullanıldığında dosyasından yüklenir,
+doğrulanır ve RGBA tablolarına bir kez çevrilir.
 """
 
+import json
+import os
+import re
+import weakref
+from kivy.clock import Clock
 from kivy.utils import get_color_from_hex
-from typing import Dict, Tuple, List
+from types import MappingProxyType
+from typing import Callable, Dict, List, Mapping, Optional, Tuple
+
+
+RGBA = Tuple[float, float, float, float]
+# Temada tanımlı olmayan renkler için beyaz
+DEFAULT_RGBA: RGBA = (1.0, 1.0, 1.0, 1.0)
+
+THEME_PACKS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'theme_packs')
+INDEX_FILE = 'index.json'
+# Widget'ların doğrudan okuduğu, her temada bulunması gereken renkler
+REQUIRED_COLORS = ('correct', 'present', 'absent', 'background', 'text', 'border', 'keyboard')
+HEX_COLOR_PATTERN = re.compile(r'^#[0-9A-Fa-f]{6}([0-9A-Fa-f]{2})?$')
+
+# Klasik Tema (Orijinal Wordle) - tema paketleri bozuksa da kullanılır
+CLASSIC_COLORS = {
+    'correct': '#6aaa64',      # Yeşil
+    'present': '#c9b458',      # Sarı/Altın
+    'absent': '#787c7e',       # Gri
+    'correct_dark': '#538d4e', # Koyu yeşil
+    'present_dark': '#b59f3b', # Koyu sarı
+    'absent_dark': '#3a3a3c',  # Koyu gri
+    'background': '#ffffff',    # Beyaz
+    'background_dark': '#121213', # Siyah
+    'text': '#000000',         # Siyah metin
+    'text_dark': '#ffffff',    # Beyaz metin
+    'border': '#d3d6da',       # Açık gri
+    'border_dark': '#3a3a3c',  # Koyu gri
+    'keyboard': '#d3d6da',     # Klavye rengi
+    'keyboard_dark': '#818384' # Koyu klavye
+}
+
+
+def validate_colors(colors) -> List[str]:
+    """
+    Tema renklerini doğrula
+    
+    Args:
+        colors: {renk adı: hex kodu} dictionary'si
+        
+    Returns:
+        Hata mesajları (boşsa geçerli)
+    """
+    if not isinstance(colors, dict):
+        return ["'colors' bir nesne olmalı"]
+    errors = [f"Eksik renk: {name}" for name in REQUIRED_COLORS if name not in colors]
+    for name, value in colors.items():
+        if not isinstance(value, str) or not HEX_COLOR_PATTERN.match(value):
+            errors.append(f"Geçersiz renk kodu: {name}={value!r}")
+    return errors
 
 
 class Theme:
     """Tek bir tema tanımı"""
     
-    def __init__(self, name: str, display_name: str, colors: Dict[str, str], 
-                 description: str = ""):
+    def __init__(self, name: str, display_name: str, colors: Optional[Dict[str, str]] = None,
+                 description: str = "", path: Optional[str] = None):
         """
         Tema oluştur
         
         Args:
             name: Tema kodu (classic, colorblind, vb.)
             display_name: Görünen ad
-            colors: Renk tanımları (hex kodları)
+            colors: Renk tanımları (hex kodları; None ise path'ten yüklenir)
             description: Tema açıklaması
+            path: Tema paketi dosyası
         """
         self.name = name
         self.display_name = display_name
         self.description = description
-        self.colors = colors
+        self.path = path
+        self._colors = colors
+        # (açık, koyu) RGBA tabloları; ilk kullanımda bir kez çözülür
+        self._palettes: Optional[Tuple[Mapping[str, RGBA], Mapping[str, RGBA]]] = None
+        
+    @property
+    def colors(self) -> Dict[str, str]:
+        """Renk tanımları (paket temalarında ilk erişimde yüklenir)"""
+        if self._colors is None:
+            self._colors = self._load_colors()
+        return self._colors
+        
+    @property
+    def is_loaded(self) -> bool:
+        """Renkler yüklendi mi"""
+        return self._colors is not None
+        
+    def _load_colors(self) -> Dict[str, str]:
+        """
+        Renkleri paket dosyasından oku ve doğrula
+        
+        Returns:
+            Renk tanımları (dosya okunamaz veya geçersizse klasik renkler)
+        """
+        try:
+            with open(self.path, 'r', encoding='utf-8') as f:
+                colors = json.load(f).get('colors')
+            errors = validate_colors(colors)
+        except Exception as e:
+            errors = [str(e)]
+            
+        if errors:
+            print(f"✗ '{self.name}' teması geçersiz, klasik renkler kullanılıyor: "
+                  f"{'; '.join(errors)}")
+            return dict(CLASSIC_COLORS)
+        return colors
         
-    def get_color(self, color_name: str) -> Tuple[float, float, float, float]:
+    def get_palette(self, dark_mode: bool = False) -> Mapping[str, RGBA]:
+        """
+        Temanın değiştirilemez RGBA tablosunu döndür
+        
+        Koyu tabloda her renk, tanımlıysa '_dark' karşılığına çözülmüştür;
+        '_dark' adları her iki tabloda da doğrudan bulunur.
+        
+        Args:
+            dark_mode: Koyu tablo mu
+            
+        Returns:
+            {renk adı: RGBA tuple'ı} (salt okunur)
+        """
+        if self._palettes is None:
+            light = {
+                name: tuple(get_color_from_hex(value))
+                for name, value in self.colors.items()
+            }
+            dark = dict(light)
+            for name in light:
+                if f"{name}_dark" in light:
+                    dark[name] = light[f"{name}_dark"]
+            self._palettes = (MappingProxyType(light), MappingProxyType(dark))
+        return self._palettes[1 if dark_mode else 0]
+        
+    def get_color(self, color_name: str) -> RGBA:
         """
         Renk kodunu Kivy formatında döndür
         
@@ -36,8 +156,7 @@ class Theme:
         Returns:
             RGBA renk tuple'ı (0-1 arası)
         """
-        hex_color = self.colors.get(color_name, '#FFFFFF')
-        return get_color_from_hex(hex_color)
+        return self.get_palette().get(color_name, DEFAULT_RGBA)
         
     def get_hex_color(self, color_name: str) -> str:
         """
@@ -55,198 +174,64 @@ class Theme:
 class ThemeManager:
     """Tema yönetim sınıfı"""
     
-    def __init__(self):
-        """Tema yöneticisini başlat ve temaları yükle"""
+    def __init__(self, packs_dir: str = THEME_PACKS_DIR):
+        """
+        Tema yöneticisini başlat ve temaları kaydet
+        
+        Args:
+            packs_dir: Tema paketleri dizini
+        """
+        self.packs_dir = packs_dir
         self.themes: Dict[str, Theme] = {}
         self.current_theme_name = 'classic'
+        # Renkler her değiştiğinde artar; widget'lar önbelleklerini buna göre yeniler
+        self.version = 0
+        self._subscribers: List[Callable[[int], None]] = []
+        self.dark_mode = False
+        # Canlı yeniden boyanacak widget'lar (zayıf referans; silinen widget düşer)
+        self._themed_widgets = weakref.WeakSet()
+        self._color_bindings = weakref.WeakKeyDictionary()
+        # Aynı karedeki tüm değişiklikler tek boyamada birleşir
+        self._repaint_trigger = Clock.create_trigger(self.repaint_widgets)
         self.load_themes()
+        self._palettes = self._resolve_palettes()
         
     def load_themes(self):
-        """Tüm temaları yükle"""
+        """
+        Temaları yükle
         
-        # 1. Klasik Tema (Orijinal Wordle)
+        Klasik tema yerleşiktir; diğerleri tema paketleri dizinindeki
+        index.json'dan yalnızca ad ve açıklamalarıyla kaydedilir. Renkler
+        tema ilk kullanıldığında dosyasından okunur ve doğrulanır.
+        """
         self.themes['classic'] = Theme(
             name='classic',
             display_name='Klasik',
             description='Orijinal Wordle renkleri',
-            colors={
-                'correct': '#6aaa64',      # Yeşil
-                'present': '#c9b458',      # Sarı/Altın
-                'absent': '#787c7e',       # Gri
-                'correct_dark': '#538d4e', # Koyu yeşil
-                'present_dark': '#b59f3b', # Koyu sarı
-                'absent_dark': '#3a3a3c',  # Koyu gri
-                'background': '#ffffff',    # Beyaz
-                'background_dark': '#121213', # Siyah
-                'text': '#000000',         # Siyah metin
-                'text_dark': '#ffffff',    # Beyaz metin
-                'border': '#d3d6da',       # Açık gri
-                'border_dark': '#3a3a3c',  # Koyu gri
-                'keyboard': '#d3d6da',     # Klavye rengi
-                'keyboard_dark': '#818384' # Koyu klavye
-            }
-        )
-        
-        # 2. Renkli Körlük Dostu Tema
-        self.themes['colorblind'] = Theme(
-            name='colorblind',
-            display_name='Renkli Körlük Dostu',
-            description='Yüksek kontrast, ayırt edilebilir renkler',
-            colors={
-                'correct': '#f5793a',      # Turuncu
-                'present': '#85c0f9',      # Mavi
-                'absent': '#787c7e',       # Gri
-                'correct_dark': '#f5793a',
-                'present_dark': '#85c0f9',
-                'absent_dark': '#3a3a3c',
-                'background': '#ffffff',
-                'background_dark': '#121213',
-                'text': '#000000',
-                'text_dark': '#ffffff',
-                'border': '#d3d6da',
-                'border_dark': '#3a3a3c',
-                'keyboard': '#d3d6da',
-                'keyboard_dark': '#818384'
-            }
-        )
-        
-        # 3. Neon Tema
-        self.themes['neon'] = Theme(
-            name='neon',
-            display_name='Neon',
-            description='Canlı neon renkler',
-            colors={
-                'correct': '#00ff00',      # Neon yeşil
-                'present': '#ffff00',      # Neon sarı
-                'absent': '#ff00ff',       # Neon mor
-                'correct_dark': '#00cc00',
-                'present_dark': '#cccc00',
-                'absent_dark': '#cc00cc',
-                'background': '#0a0a0a',
-                'background_dark': '#000000',
-                'text': '#00ffff',         # Neon cyan
-                'text_dark': '#00ffff',
-                'border': '#00ffff',
-                'border_dark': '#008888',
-                'keyboard': '#1a1a1a',
-                'keyboard_dark': '#0f0f0f'
-            }
-        )
-        
-        # 4. Pastel Tema
-        self.themes['pastel'] = Theme(
-            name='pastel',
-            display_name='Pastel',
-            description='Yumuşak pastel renkler',
-            colors={
-                'correct': '#a8e6cf',      # Pastel yeşil
-                'present': '#ffd3b6',      # Pastel turuncu
-                'absent': '#d4a5a5',       # Pastel pembe
-                'correct_dark': '#88c9a8',
-                'present_dark': '#ddb396',
-                'absent_dark': '#b48585',
-                'background': '#fff9f0',
-                'background_dark': '#2a2a2a',
-                'text': '#5a5a5a',
-                'text_dark': '#e0e0e0',
-                'border': '#e8d5c4',
-                'border_dark': '#4a4a4a',
-                'keyboard': '#f5e6d3',
-                'keyboard_dark': '#3a3a3a'
-            }
-        )
-        
-        # 5. Yüksek Kontrast Tema
-        self.themes['high_contrast'] = Theme(
-            name='high_contrast',
-            display_name='Yüksek Kontrast',
-            description='Maksimum kontrast, erişilebilirlik için',
-            colors={
-                'correct': '#00ff00',      # Parlak yeşil
-                'present': '#ffff00',      # Parlak sarı
-                'absent': '#ff0000',       # Parlak kırmızı
-                'correct_dark': '#00cc00',
-                'present_dark': '#cccc00',
-                'absent_dark': '#cc0000',
-                'background': '#ffffff',
-                'background_dark': '#000000',
-                'text': '#000000',
-                'text_dark': '#ffffff',
-                'border': '#000000',
-                'border_dark': '#ffffff',
-                'keyboard': '#cccccc',
-                'keyboard_dark': '#333333'
-            }
-        )
-        
-        # 6. Gece Mavi Tema
-        self.themes['night_blue'] = Theme(
-            name='night_blue',
-            display_name='Gece Mavisi',
-            description='Göz dostu gece teması',
-            colors={
-                'correct': '#4a9eff',      # Mavi
-                'present': '#ffa64d',      # Turuncu
-                'absent': '#6b7280',       # Gri
-                'correct_dark': '#3a7ed0',
-                'present_dark': '#d98840',
-                'absent_dark': '#4b5563',
-                'background': '#1e3a5f',
-                'background_dark': '#0f1e3a',
-                'text': '#e5e7eb',
-                'text_dark': '#f3f4f6',
-                'border': '#334155',
-                'border_dark': '#1e293b',
-                'keyboard': '#2d4a6f',
-                'keyboard_dark': '#1a2d4a'
-            }
-        )
-        
-        # 7. Sonbahar Tema
-        self.themes['autumn'] = Theme(
-            name='autumn',
-            display_name='Sonbahar',
-            description='Sıcak sonbahar renkleri',
-            colors={
-                'correct': '#d97706',      # Turuncu-sarı
-                'present': '#dc2626',      # Kırmızı
-                'absent': '#92400e',       # Kahverengi
-                'correct_dark': '#b45309',
-                'present_dark': '#b91c1c',
-                'absent_dark': '#78350f',
-                'background': '#fef3c7',
-                'background_dark': '#451a03',
-                'text': '#451a03',
-                'text_dark': '#fef3c7',
-                'border': '#fbbf24',
-                'border_dark': '#78350f',
-                'keyboard': '#fcd34d',
-                'keyboard_dark': '#92400e'
-            }
+            colors=CLASSIC_COLORS
         )
         
-        # 8. Okyanus Tema
-        self.themes['ocean'] = Theme(
-            name='ocean',
-            display_name='Okyanus',
-            description='Sakin okyanus renkleri',
-            colors={
-                'correct': '#06b6d4',      # Cyan
-                'present': '#8b5cf6',      # Mor
-                'absent': '#64748b',       # Slate
-                'correct_dark': '#0891b2',
-                'present_dark': '#7c3aed',
-                'absent_dark': '#475569',
-                'background': '#e0f2fe',
-                'background_dark': '#0c4a6e',
-                'text': '#0c4a6e',
-                'text_dark': '#e0f2fe',
-                'border': '#7dd3fc',
-                'border_dark': '#075985',
-                'keyboard': '#bae6fd',
-                'keyboard_dark': '#0369a1'
-            }
-        )
+        index_path = os.path.join(self.packs_dir, INDEX_FILE)
+        if not os.path.exists(index_path):
+            return
+        try:
+            with open(index_path, 'r', encoding='utf-8') as f:
+                entries = json.load(f)['themes']
+        except Exception as e:
+            print(f"Tema dizini okunamadı: {e}")
+            return
+            
+        for entry in entries:
+            name = entry.get('name')
+            if not name or name in self.themes or 'file' not in entry:
+                print(f"Geçersiz tema kaydı atlandı: {entry}")
+                continue
+            self.themes[name] = Theme(
+                name=name,
+                display_name=entry.get('display_name', name),
+                description=entry.get('description', ''),
+                path=os.path.join(self.packs_dir, entry['file'])
+            )
         
     def get_theme(self, theme_name: str) -> Theme:
         """
@@ -271,10 +256,116 @@ class ThemeManager:
             Başarılı ise True
         """
         if theme_name in self.themes:
-            self.current_theme_name = theme_name
+            if theme_name != self.current_theme_name:
+                self.current_theme_name = theme_name
+                self.notify_changed()
             return True
         return False
         
+    def _resolve_palettes(self) -> Tuple[Mapping[str, RGBA], Mapping[str, RGBA]]:
+        """Aktif temanın (açık, koyu) tablolarını al"""
+        theme = self.get_current_theme()
+        return theme.get_palette(False), theme.get_palette(True)
+        
+    def notify_changed(self):
+        """
+        Renkler değişti: sürümü artır, tabloları yenile ve aboneleri bilgilendir
+        
+        Tema değişiminde otomatik çağrılır; açık/koyu kip değişiminde de
+        çağrılmalıdır.
+        """
+        self._palettes = self._resolve_palettes()
+        self.version += 1
+        for callback in list(self._subscribers):
+            callback(self.version)
+        if self._themed_widgets or self._color_bindings:
+            self._repaint_trigger()
+            
+    def set_dark_mode(self, dark_mode: bool):
+        """
+        Açık/koyu kipi değiştir (değiştiyse widget'lar yeniden boyanır)
+        
+        Args:
+            dark_mode: Koyu kip aktif mi
+        """
+        if dark_mode != self.dark_mode:
+            self.dark_mode = dark_mode
+            self.notify_changed()
+            
+    def register_widget(self, widget):
+        """
+        Widget'ı tema değişimlerinde yeniden boyanmak üzere kaydet
+        
+        Widget apply_theme(palette) metodunu sağlamalıdır.
+        
+        Args:
+            widget: Kaydedilecek widget
+        """
+        self._themed_widgets.add(widget)
+        
+    def bind_color(self, widget, prop: str, color_name: str):
+        """
+        Widget özelliğini tema rengine bağla (ör. diyalog butonu arka planı)
+        
+        Özellik hemen atanır ve her tema değişiminde yenilenir.
+        
+        Args:
+            widget: Widget
+            prop: Özellik adı (md_bg_color, text_color, ...)
+            color_name: Tema renk adı
+        """
+        setattr(widget, prop, self.get_color(color_name, self.dark_mode))
+        self._color_bindings.setdefault(widget, []).append((prop, color_name))
+        
+    def repaint_widgets(self, *args) -> int:
+        """
+        Kayıtlı tüm widget'ları güncel renklerle yeniden boya
+        
+        Hiçbir widget oluşturulmaz; normalde tema değişiminden sonraki
+        karede bir kez, Clock tetikleyicisiyle çağrılır.
+        
+        Returns:
+            Boyanan widget sayısı
+        """
+        palette = self.get_palette(self.dark_mode)
+        widgets = list(self._themed_widgets)
+        for widget in widgets:
+            widget.apply_theme(palette)
+        bindings = list(self._color_bindings.items())
+        for widget, props in bindings:
+            for prop, color_name in props:
+                setattr(widget, prop, palette.get(color_name, DEFAULT_RGBA))
+        return len(widgets) + len(bindings)
+            
+    def subscribe(self, callback: Callable[[int], None]):
+        """
+        Renk değişimlerinde çağrılacak fonksiyonu ekle
+        
+        Args:
+            callback: Yeni sürüm numarasıyla çağrılır
+        """
+        self._subscribers.append(callback)
+        
+    def unsubscribe(self, callback: Callable[[int], None]):
+        """Aboneliği kaldır"""
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+            
+    def get_palette(self, dark_mode: bool = False) -> Mapping[str, RGBA]:
+        """
+        Aktif temanın çözülmüş RGBA tablosunu döndür
+        
+        Widget'lar tabloyu version ile birlikte saklayıp yalnızca sürüm
+        değiştiğinde yeniden alabilir.
+        
+        Args:
+            dark_mode: Dark mode aktif mi
+            
+        Returns:
+            {renk adı: RGBA tuple'ı} (salt okunur)
+        """
+        return self._palettes[1 if dark_mode else 0]
+        
     def get_current_theme(self) -> Theme:
         """
         Aktif temayı döndür
@@ -295,13 +386,8 @@ class ThemeManager:
         Returns:
             RGBA renk tuple'ı
         """
-        theme = self.get_current_theme()
-        
-        # Dark mode varsa dark versiyonunu kullan
-        if dark_mode and f"{color_name}_dark" in theme.colors:
-            color_name = f"{color_name}_dark"
-            
-        return theme.get_color(color_name)
+        # Koyu tablo '_dark' renklerine önceden çözülmüştür
+        return self._palettes[1 if dark_mode else 0].get(color_name, DEFAULT_RGBA)
         
     def get_hex_color(self, color_name: str, dark_mode: bool = False) -> str:
         """
@@ -352,6 +438,44 @@ class ThemeManager:
         }
 
 
+def build_index(packs_dir: str = THEME_PACKS_DIR) -> int:
+    """
+    Dizindeki tema paketlerinden index.json'ı yeniden oluştur
+    
+    Yeni bir tema eklemek için JSON dosyasını dizine koyup bu fonksiyonu
+    çalıştırmak yeterlidir. Geçersiz paketler dizine alınmaz.
+    
+    Args:
+        packs_dir: Tema paketleri dizini
+        
+    Returns:
+        Dizine alınan tema sayısı
+    """
+    entries = []
+    for filename in sorted(os.listdir(packs_dir)):
+        if not filename.endswith('.json') or filename == INDEX_FILE:
+            continue
+        try:
+            with open(os.path.join(packs_dir, filename), 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            errors = validate_colors(data.get('colors'))
+        except Exception as e:
+            errors = [str(e)]
+        if errors:
+            print(f"✗ {filename} atlandı: {'; '.join(errors)}")
+            continue
+        entries.append({
+            'name': data.get('name', filename[:-5]),
+            'display_name': data.get('display_name', filename[:-5]),
+            'description': data.get('description', ''),
+            'file': filename
+        })
+        
+    with open(os.path.join(packs_dir, INDEX_FILE), 'w', encoding='utf-8') as f:
+        json.dump({'version': 1, 'themes': entries}, f, indent=4, ensure_ascii=False)
+    return len(entries)
+
+
 # Test fonksiyonu
 if __name__ == '__main__':
     """Modül testleri"""
@@ -400,4 +524,26 @@ if __name__ == '__main__':
         
         print(f"{theme.display_name:20} | ✓ {correct} | ~ {present} | ✗ {absent}")
     
+    # Renk tablosu erişim süresi
+    import time
+    print("\n=== get_color Süresi ===")
+    start = time.perf_counter()
+    for _ in range(100_000):
+        theme_manager.get_color('correct', True)
+    print(f"get_color: {(time.perf_counter() - start) * 10:.2f} µs/çağrı")
+    
+    # 60 temalık paket dizininde açılış süresi (renkler yüklenmez)
+    import tempfile
+    packs_dir = tempfile.mkdtemp()
+    for i in range(60):
+        with open(os.path.join(packs_dir, f"tema{i}.json"), 'w', encoding='utf-8') as f:
+            json.dump({'name': f"tema{i}", 'display_name': f"Tema {i}",
+                       'colors': CLASSIC_COLORS}, f)
+    build_index(packs_dir)
+    start = time.perf_counter()
+    manager = ThemeManager(packs_dir)
+    loaded = sum(theme.is_loaded for theme in manager.get_all_themes())
+    print(f"60 paketli açılış: {(time.perf_counter() - start) * 1000:.2f} ms, "
+          f"yüklenen renk tablosu: {loaded}")
+    
     print("\n✓ Testler tamamlandı!")
@@ -1,18 +1,222 @@
 """
 Kelime Yönetim Modülü
 Kelime listelerini okur, önbelleğe alır ve rastgele kelime seçer
+
+Kelimeler değiştirilebilir kaynak arka uçlarından (WordSource) okunur:
+düz metin, satır satır akışlı düz metin, şifreli JSON ve şifreli paket.
+WordManager yapılandırılan kaynaklardan, dil için ilk bulunanı (varsayılan
+sırada en hızlısını) kullanır; hangi kaynaktan gelirse gelsin kelimeler
+aynı doğrulama, önbellek ve indekslerden geçer.
 """
 
 import random
 import os
-from typing import Optional, List
+import time
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple, Union
+
+from game_logic import AbsurdleGameLogic, GameLogic, HashedGameLogic
+from metrics import WORD_LOAD_SECONDS
+
+
+VALID_CHARS = {
+    'tr': frozenset('ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ'),
+    'en': frozenset('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+}
+
+
+class WordSource(ABC):
+    """Kelime kaynağı arka uçlarının temel sınıfı"""
+    
+    name = ''
+    
+    @abstractmethod
+    def is_available(self, language: str) -> bool:
+        """
+        Kaynağın bu dil için kelime sağlayıp sağlayamayacağını kontrol et
+        
+        Args:
+            language: Dil kodu
+            
+        Returns:
+            Kullanılabilirse True
+        """
+        
+    @abstractmethod
+    def read_words(self, word_length: int, language: Optional[str]) -> Iterable[str]:
+        """
+        Dil ve uzunluğa ait büyük harfli kelimeleri üret
+        
+        Args:
+            word_length: Kelime uzunluğu
+            language: Dil kodu (şifreli paketlerde None ise tüm diller)
+            
+        Returns:
+            Kelimeler (doğrulama WordManager'da yapılır)
+        """
+        
+        
+class PlainTextSource(WordSource):
+    """Satır başına bir kelime içeren metin dosyası (tek okumada tüm uzunluklar)"""
+    
+    name = 'text'
+    
+    def __init__(self, pattern: str = 'kelimeler_{language}.txt'):
+        """
+        Args:
+            pattern: Dosya adı şablonu ({language} dil koduyla değiştirilir)
+        """
+        self.pattern = pattern
+        self._groups: Dict[str, Dict[int, List[str]]] = {}
+        
+    def path(self, language: Optional[str]) -> str:
+        """Dilin dosya yolu"""
+        return self.pattern.replace('{language}', language or '')
+        
+    def is_available(self, language: str) -> bool:
+        return os.path.exists(self.path(language))
+        
+    def _read_all(self, language: Optional[str]) -> List[str]:
+        """Dosyanın tüm kelimelerini oku"""
+        with open(self.path(language), 'r', encoding='utf-8') as f:
+            return f.read().upper().split()
+            
+    def read_words(self, word_length: int, language: Optional[str]) -> List[str]:
+        # Dosya bir kez okunur; diğer uzunluklar sonraki çağrılara kadar bekletilir
+        groups = self._groups.get(language)
+        if groups is None or word_length not in groups:
+            groups = defaultdict(list)
+            for word in self._read_all(language):
+                groups[len(word)].append(word)
+            self._groups[language] = groups
+        return groups.pop(word_length, [])
+        
+        
+class StreamingTextSource(PlainTextSource):
+    """Büyük sözlükler için satır satır okunan metin dosyası (yalnızca istenen uzunluk tutulur)"""
+    
+    name = 'stream'
+    
+    def read_words(self, word_length: int, language: Optional[str]) -> Iterable[str]:
+        with open(self.path(language), 'r', encoding='utf-8') as f:
+            for line in f:
+                word = line.strip().upper()
+                if len(word) == word_length:
+                    yield word
+                    
+                    
+class EncryptedJSONSource(PlainTextSource):
+    """security.WordEncryption ile kelime kelime şifrelenmiş JSON dosyası"""
+    
+    name = 'encrypted_json'
+    
+    def __init__(self, pattern: str = 'kelimeler_{language}_encrypted.json', encryption=None):
+        """
+        Args:
+            pattern: Dosya adı şablonu ({language} dil koduyla değiştirilir)
+            encryption: security.WordEncryption (None ise varsayılan anahtar)
+        """
+        super().__init__(pattern)
+        self.encryption = encryption
+        
+    def _read_all(self, language: Optional[str]) -> List[str]:
+        if self.encryption is None:
+            from security import WordEncryption
+            self.encryption = WordEncryption()
+        return self.encryption.load_encrypted_words(self.path(language))
+        
+        
+class BundleSource(WordSource):
+    """security.WordBundle şifreli paketi; yalnızca istenen (dil, uzunluk) bölümü çözülür"""
+    
+    name = 'bundle'
+    
+    def __init__(self, path: str = 'kelimeler.bundle', encryption=None):
+        """
+        Args:
+            path: Paket dosyası (tüm dilleri içerebilir)
+            encryption: security.WordEncryption (None ise varsayılan anahtar)
+        """
+        self.path = path
+        self.encryption = encryption
+        
+    def _open(self):
+        """Paketi aç (yalnızca başlık ve bölüm tablosu okunur)"""
+        from security import WordBundle, WordEncryption
+        if self.encryption is None:
+            self.encryption = WordEncryption()
+        return WordBundle(self.path, self.encryption)
+        
+    def is_available(self, language: str) -> bool:
+        if not os.path.exists(self.path):
+            return False
+        try:
+            with self._open() as bundle:
+                return any(section.language == language for section in bundle.sections())
+        except (OSError, ValueError) as e:
+            print(f"Kelime paketi okunamadı: {e}")
+            return False
+            
+    def read_words(self, word_length: int, language: Optional[str]) -> List[str]:
+        with self._open() as bundle:
+            return bundle.read(word_length, language)
+            
+            
+# Yapılandırmada adla seçilebilen kaynaklar
+SOURCE_TYPES = {
+    'bundle': BundleSource,
+    'encrypted_json': EncryptedJSONSource,
+    'text': PlainTextSource,
+    'stream': StreamingTextSource
+}
+# Varsayılan öncelik: en hızlı biçim önce
+DEFAULT_SOURCES = ('bundle', 'encrypted_json', 'text')
+
+
+def create_sources(sources: Optional[Sequence[Union[str, WordSource]]] = None) -> List[WordSource]:
+    """
+    Ad veya nesnelerden kaynak listesi oluştur
+    
+    Args:
+        sources: SOURCE_TYPES adları veya WordSource nesneleri (None ise DEFAULT_SOURCES)
+        
+    Returns:
+        Öncelik sırasına göre WordSource listesi
+    """
+    result = []
+    for source in DEFAULT_SOURCES if sources is None else sources:
+        if isinstance(source, str):
+            if source not in SOURCE_TYPES:
+                raise ValueError(f"Bilinmeyen kelime kaynağı: {source}")
+            source = SOURCE_TYPES[source]()
+        result.append(source)
+    return result
 
 
 class WordManager:
     """Kelime listelerini yöneten sınıf"""
     
-    def __init__(self):
-        """Kelime yöneticisini başlat"""
+    def __init__(self, sources: Optional[Sequence[Union[str, WordSource]]] = None,
+                 hashed: bool = False, encryption=None):
+        """
+        Kelime yöneticisini başlat
+        
+        Args:
+            sources: Öncelik sırasına göre kelime kaynakları; ad ('bundle',
+                'encrypted_json', 'text', 'stream') veya WordSource nesnesi
+                (None ise DEFAULT_SOURCES)
+            hashed: True ise listeler düz metin tutulmaz; yalnızca
+                security.HashedAnswerStore (anahtarlı özetler + şifreli veri)
+                önbelleğe alınır
+            encryption: hashed kipte anahtarı sağlayan security.WordEncryption
+        """
+        self.sources = create_sources(sources)
+        self.hashed = hashed
+        self.encryption = encryption
+        # (dil, uzunluk) -> HashedAnswerStore (yalnızca hashed kipte)
+        self.answer_stores = {}
+        self._selected: Dict[str, Optional[WordSource]] = {}
         self.word_cache = {
             'tr': {5: [], 6: [], 7: []},
             'en': {5: [], 6: [], 7: []}
@@ -21,51 +225,84 @@ class WordManager:
             'tr': {5: False, 6: False, 7: False},
             'en': {5: False, 6: False, 7: False}
         }
+        # Dil -> uzunluk -> {kelime: sıra}; üyelik ve sıra sorguları O(1)
+        self.word_index: Dict[str, Dict[int, Dict[str, int]]] = {}
+        
+    def get_source(self, language: str) -> Optional[WordSource]:
+        """
+        Dil için kullanılacak kaynağı seç (ilk kullanılabilir olan)
+        
+        Args:
+            language: Dil kodu
+            
+        Returns:
+            WordSource veya hiçbiri yoksa None
+        """
+        if language not in self._selected:
+            self._selected[language] = next(
+                (source for source in self.sources if source.is_available(language)), None
+            )
+        return self._selected[language]
         
     def load_words(self, word_length: int, language: str) -> List[str]:
         """
         Belirtilen uzunluk ve dildeki kelimeleri yükle
         
+        hashed kipte yalnızca cevap deposu oluşturulur ve düz metin liste
+        döndürülmez (boş liste döner); sorgular için get_answer_store kullanılır.
+        
         Args:
             word_length: Kelime uzunluğu (5, 6 veya 7)
             language: Dil kodu ('tr' veya 'en')
             
         Returns:
-            Kelime listesi
+            Kelime listesi (hashed kipte boş)
         """
         # Önbellekte varsa direkt dön
-        if self.cache_loaded[language][word_length]:
+        if self.cache_loaded.get(language, {}).get(word_length):
             return self.word_cache[language][word_length]
             
-        # Dosya adını oluştur
-        filename = f'kelimeler_{language}.txt'
-        
-        if not os.path.exists(filename):
-            print(f"HATA: {filename} bulunamadı!")
+        source = self.get_source(language)
+        if source is None:
+            print(f"HATA: {language} için kelime listesi bulunamadı!")
             return []
             
+        start = time.perf_counter()
         try:
-            with open(filename, 'r', encoding='utf-8') as f:
-                # Tüm kelimeleri oku ve normalize et
-                all_words = []
-                for line in f:
-                    word = line.strip().upper()
-                    if word and len(word) == word_length:
-                        # Sadece harf içeren kelimeleri al
-                        if self.is_valid_word(word, language):
-                            all_words.append(word)
-                            
-                # Önbelleğe al
-                self.word_cache[language][word_length] = all_words
-                self.cache_loaded[language][word_length] = True
-                
-                print(f"{language.upper()} - {word_length} harfli {len(all_words)} kelime yüklendi")
-                return all_words
-                
+            # Sadece harf içeren kelimeleri al
+            all_words = [
+                word for word in source.read_words(word_length, language)
+                if len(word) == word_length and self.is_valid_word(word, language)
+            ]
         except Exception as e:
             print(f"Kelimeler yüklenirken hata: {e}")
             return []
             
+        count = len(all_words)
+        if self.hashed:
+            # Düz metin liste önbelleğe alınmaz ve çağırana da dönmez
+            from security import HashedAnswerStore
+            self.answer_stores[(language, word_length)] = HashedAnswerStore(
+                all_words, self.encryption
+            )
+            all_words = []
+        else:
+            index = {}
+            for i, word in enumerate(all_words):
+                index.setdefault(word, i)
+                
+            # Önbelleğe al
+            self.word_cache.setdefault(language, {})[word_length] = all_words
+            self.word_index.setdefault(language, {})[word_length] = index
+            self.cache_loaded.setdefault(language, {})[word_length] = True
+        WORD_LOAD_SECONDS.observe(
+            time.perf_counter() - start, language=language, length=word_length
+        )
+        
+        print(f"{language.upper()} - {word_length} harfli {count} kelime yüklendi "
+              f"({source.name})")
+        return all_words
+        
     def is_valid_word(self, word: str, language: str) -> bool:
         """
         Kelimenin geçerli olup olmadığını kontrol et
@@ -77,19 +314,34 @@ class WordManager:
         Returns:
             Geçerli ise True
         """
-        if language == 'tr':
-            # Türkçe karakterler
-            valid_chars = set('ABCÇDEFGĞHIİJKLMNOÖPRSŞTUÜVYZ')
-        else:
-            # İngilizce karakterler
-            valid_chars = set('ABCDEFGHIJKLMNOPQRSTUVWXYZ')
+        # Türkçe dışındaki diller İngilizce alfabeyle doğrulanır
+        valid_chars = VALID_CHARS['tr'] if language == 'tr' else VALID_CHARS['en']
+        return valid_chars.issuperset(word)
+        
+    def get_answer_store(self, word_length: int, language: str):
+        """
+        hashed kipte (dil, uzunluk) cevap deposunu döndür (gerekirse yükle)
+        
+        Args:
+            word_length: Kelime uzunluğu
+            language: Dil kodu
             
-        return all(c in valid_chars for c in word)
+        Returns:
+            security.HashedAnswerStore veya liste yüklenemezse None
+        """
+        store = self.answer_stores.get((language, word_length))
+        if store is None:
+            self.load_words(word_length, language)
+            store = self.answer_stores.get((language, word_length))
+        return store
         
     def get_random_word(self, word_length: int, language: str) -> Optional[str]:
         """
         Rastgele bir kelime seç
         
+        hashed kipte seçilen kelime çözülür; oyun başlatmak için kelimeyi
+        bellekte tutmayan new_game kullanılmalıdır.
+        
         Args:
             word_length: Kelime uzunluğu
             language: Dil kodu
@@ -97,14 +349,62 @@ class WordManager:
         Returns:
             Rastgele seçilen kelime veya None
         """
-        words = self.load_words(word_length, language)
-        
+        if self.hashed:
+            words = self.get_answer_store(word_length, language)
+        else:
+            words = self.load_words(word_length, language)
+            
         if not words:
             print(f"UYARI: {language.upper()} dilinde {word_length} harfli kelime bulunamadı!")
             return None
             
+        if self.hashed:
+            # Depodan yalnızca seçilen kelime çözülür
+            return words.reveal(words.random_index())
         return random.choice(words)
         
+    def new_game(self, word_length: int, language: str, max_attempts: int,
+                 verbose: bool = True, mode: str = 'classic') -> Optional[Tuple[GameLogic, int]]:
+        """
+        Rastgele gizli kelimeyle yeni oyun oluştur
+        
+        hashed kipte gizli kelime çözülmez; oyun yalnızca kelimenin depodaki
+        sırasını ve özetini tutar (bkz. HashedGameLogic). 'absurdle' modu
+        tüm aday listesine ihtiyaç duyduğundan hashed kipte klasik oyuna döner.
+        
+        Args:
+            word_length: Kelime uzunluğu
+            language: Dil kodu
+            max_attempts: Maksimum tahmin hakkı
+            verbose: Konsola oyun mesajları yazılsın mı
+            mode: 'classic' veya 'absurdle'
+            
+        Returns:
+            (oyun, kelime_kimliği) tuple'ı veya kelime listesi yüklenemezse None.
+            Absurdle oyunlarında sabit bir gizli kelime olmadığından kimlik -1'dir.
+        """
+        if mode == 'absurdle':
+            if not self.hashed:
+                candidates = self.load_words(word_length, language)
+                if not candidates:
+                    return None
+                return AbsurdleGameLogic(candidates, max_attempts, verbose), -1
+            print("UYARI: Absurdle modu hashed kipte desteklenmiyor, klasik oyun başlatılıyor")
+            
+        if not self.hashed:
+            secret_word = self.get_random_word(word_length, language)
+            if not secret_word:
+                return None
+            game = GameLogic(secret_word, max_attempts, verbose)
+            return game, self.get_word_index(secret_word, word_length, language)
+            
+        store = self.get_answer_store(word_length, language)
+        if not store:
+            print(f"UYARI: {language.upper()} dilinde {word_length} harfli kelime bulunamadı!")
+            return None
+        index = store.random_index()
+        return HashedGameLogic(store, index, word_length, max_attempts, verbose), index
+        
     def is_word_in_list(self, word: str, word_length: int, language: str) -> bool:
         """
         Kelimenin listede olup olmadığını kontrol et
@@ -117,9 +417,30 @@ class WordManager:
         Returns:
             Listede ise True
         """
-        words = self.load_words(word_length, language)
-        return word.upper() in words
+        if self.hashed:
+            store = self.get_answer_store(word_length, language)
+            return store is not None and word in store
+        self.load_words(word_length, language)
+        return word.upper() in self.word_index.get(language, {}).get(word_length, {})
+        
+    def get_word_index(self, word: str, word_length: int, language: str) -> int:
+        """
+        Kelimenin listedeki sırasını döndür (oyun geçmişinde kelime kimliği)
         
+        Args:
+            word: Aranan kelime
+            word_length: Kelime uzunluğu
+            language: Dil kodu
+            
+        Returns:
+            Sıra numarası veya bulunamazsa -1
+        """
+        if self.hashed:
+            store = self.get_answer_store(word_length, language)
+            return store.index_of(word) if store is not None else -1
+        self.load_words(word_length, language)
+        return self.word_index.get(language, {}).get(word_length, {}).get(word.upper(), -1)
+            
     def get_word_count(self, word_length: int, language: str) -> int:
         """
         Belirtilen kategorideki kelime sayısını döndür
@@ -131,6 +452,9 @@ class WordManager:
         Returns:
             Kelime sayısı
         """
+        if self.hashed:
+            store = self.get_answer_store(word_length, language)
+            return len(store) if store is not None else 0
         words = self.load_words(word_length, language)
         return len(words)
         
@@ -144,6 +468,9 @@ class WordManager:
             'tr': {5: False, 6: False, 7: False},
             'en': {5: False, 6: False, 7: False}
         }
+        self.word_index = {}
+        self.answer_stores = {}
+        self._selected = {}
         print("Kelime önbelleği temizlendi")
 
 